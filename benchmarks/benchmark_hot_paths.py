@@ -0,0 +1,675 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""Benchmarks of the functions parsing or writing the bulk of the data,
+which are not covered by the synthetic files of the writers.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from .generators import make_data, make_signal_dict
+
+
+TEST_DATA_PATH = Path(__file__).parents[1] / "rsciio" / "tests" / "data"
+
+
+class BCFParseHypermap:
+    # the bcf files can't be generated, use the test data of the repository
+    params = [
+        "30x30_instructively_packed_16bit_compressed.bcf",
+        "P45_the_default_job.bcf",
+    ]
+    param_names = ["filename"]
+
+    def setup(self, filename):
+        from rsciio.bruker._api import BCF_reader
+
+        path = TEST_DATA_PATH / "bruker" / filename
+        if not path.is_file():
+            raise NotImplementedError(f"{path} is not available")
+        self.bcf = BCF_reader(str(path))
+
+    def time_parse_hypermap(self, filename):
+        self.bcf.parse_hypermap()
+
+    def time_parse_hypermap_downsample(self, filename):
+        self.bcf.parse_hypermap(downsample=2)
+
+
+class FEIStreamToArray:
+    params = ([64, 256], [True, False])
+    param_names = ["navigation_size", "sum_frames"]
+    timeout = 300
+
+    def setup(self, navigation_size, sum_frames):
+        from rsciio.utils.fei_stream_readers import array_to_stream
+
+        self.channels = 1024
+        self.frames = 4
+        shape = (self.frames, navigation_size, navigation_size, self.channels)
+        # sparse counts, as in EDX spectrum images
+        data = np.random.default_rng(0).poisson(0.01, size=shape).astype("u2")
+        self.stream = array_to_stream(data)
+        self.spatial_shape = shape[1:3]
+
+    def time_stream_to_array(self, navigation_size, sum_frames):
+        from rsciio.utils.fei_stream_readers import stream_to_array
+
+        stream_to_array(
+            self.stream,
+            spatial_shape=self.spatial_shape,
+            channels=self.channels,
+            last_frame=self.frames,
+            sum_frames=sum_frames,
+        )
+
+    def time_stream_to_sparse_COO_array(self, navigation_size, sum_frames):
+        from rsciio.utils.fei_stream_readers import stream_to_sparse_COO_array
+
+        stream_to_sparse_COO_array(
+            self.stream,
+            spatial_shape=self.spatial_shape,
+            channels=self.channels,
+            last_frame=self.frames,
+            sum_frames=sum_frames,
+        )
+
+
+class OverwriteDataset:
+    params = (["hspy", "zspy"], [False, True])
+    param_names = ["plugin", "lazy"]
+    timeout = 300
+
+    def setup(self, plugin_name, lazy):
+        data = make_data((128, 128, 1024), "u2")
+        if lazy:
+            import dask.array as da
+
+            data = da.from_array(data, chunks=(32, 32, 1024))
+        self.data = data
+        if plugin_name == "hspy":
+            import h5py
+            from rsciio.hspy._api import HyperspyWriter
+
+            self.writer = HyperspyWriter
+            # in memory file to measure the writer rather than the disk
+            self.file = h5py.File(
+                "overwrite_dataset.hspy", "w", driver="core", backing_store=False
+            )
+        else:
+            import zarr
+            from rsciio.zspy._api import ZspyWriter
+
+            self.writer = ZspyWriter
+            self.file = zarr.group(store=zarr.MemoryStore())
+
+    def teardown(self, plugin_name, lazy):
+        if plugin_name == "hspy":
+            self.file.close()
+
+    def time_overwrite_dataset(self, plugin_name, lazy):
+        self.writer.overwrite_dataset(self.file, self.data, "data", signal_axes=(2,))
+
+
+class HspyCompressionWorkers:
+    # scaling of the gzip compression of the chunks across threads
+    params = ([None, 1, 2, 4, 8], [False, True])
+    param_names = ["compression_workers", "lazy"]
+    timeout = 300
+
+    def setup(self, compression_workers, lazy):
+        import h5py
+
+        data = make_data((128, 128, 1024), "u2")
+        if lazy:
+            import dask.array as da
+
+            data = da.from_array(data, chunks=(32, 32, 1024))
+        self.data = data
+        self.file = h5py.File(
+            "compression_workers.hspy", "w", driver="core", backing_store=False
+        )
+
+    def teardown(self, compression_workers, lazy):
+        self.file.close()
+
+    def time_overwrite_dataset(self, compression_workers, lazy):
+        from rsciio.hspy._api import HyperspyWriter
+
+        HyperspyWriter.overwrite_dataset(
+            self.file,
+            self.data,
+            "data",
+            signal_axes=(2,),
+            compression="gzip",
+            shuffle=True,
+            store_kwds={"compression_workers": compression_workers},
+        )
+
+
+class ReadRaggedArray:
+    # e.g. the positions of the diffraction peaks of a 4D-STEM scan
+    params = (["hspy", "zspy"], [False, True])
+    param_names = ["plugin", "lazy"]
+    timeout = 300
+
+    def setup(self, plugin_name, lazy):
+        rng = np.random.default_rng(0)
+        data = np.empty((256, 256), dtype=object)
+        for i in np.ndindex(data.shape):
+            data[i] = rng.random((rng.integers(0, 20), 2))
+        if plugin_name == "hspy":
+            import h5py
+            from rsciio.hspy._api import HyperspyReader, HyperspyWriter
+
+            self.reader = HyperspyReader
+            self.file = h5py.File(
+                "read_ragged_array.hspy", "w", driver="core", backing_store=False
+            )
+            HyperspyWriter.overwrite_dataset(self.file, data, "data", signal_axes=())
+        else:
+            import zarr
+            from rsciio.zspy._api import ZspyReader, ZspyWriter
+
+            self.reader = ZspyReader
+            self.file = zarr.group(store=zarr.MemoryStore())
+            ZspyWriter.overwrite_dataset(self.file, data, "data", signal_axes=())
+
+    def teardown(self, plugin_name, lazy):
+        if plugin_name == "hspy":
+            self.file.close()
+
+    def time_read_array(self, plugin_name, lazy):
+        data = self.reader._read_array(self.file, "data", lazy=lazy)
+        if lazy:
+            # only the region of interest is decoded
+            data[:32, :32].compute()
+
+
+class OverwriteRaggedDataset:
+    params = (["hspy", "zspy"], [False, True])
+    param_names = ["plugin", "lazy"]
+    timeout = 300
+
+    def setup(self, plugin_name, lazy):
+        rng = np.random.default_rng(0)
+        data = np.empty((256, 256), dtype=object)
+        for i in np.ndindex(data.shape):
+            data[i] = rng.random((rng.integers(0, 20), 2))
+        self.array = data
+        if lazy:
+            import dask.array as da
+
+            data = da.from_array(data, chunks=(64, 64))
+        self.data = data
+        if plugin_name == "hspy":
+            import h5py
+            from rsciio.hspy._api import HyperspyWriter
+
+            self.writer = HyperspyWriter
+            self.file = h5py.File(
+                "overwrite_ragged_dataset.hspy", "w", driver="core", backing_store=False
+            )
+        else:
+            import zarr
+            from rsciio.zspy._api import ZspyWriter
+
+            self.writer = ZspyWriter
+            self.file = zarr.group(store=zarr.MemoryStore())
+
+    def teardown(self, plugin_name, lazy):
+        if plugin_name == "hspy":
+            self.file.close()
+
+    def time_overwrite_dataset(self, plugin_name, lazy):
+        self.writer.overwrite_dataset(self.file, self.data, "data", signal_axes=())
+
+    def time_flatten_ragged(self, plugin_name, lazy):
+        # the python loop over the arrays, part of `time_overwrite_dataset`
+        from rsciio._hierarchical import _flatten_ragged
+
+        _flatten_ragged(self.array)
+
+
+class ChunkAccessPattern:
+    # read a spectrum or a virtual image from data chunked for an access pattern
+    params = (["signal", "navigation", "balanced"], ["signal", "virtual_image"])
+    param_names = ["access_pattern", "read"]
+    timeout = 300
+
+    def setup(self, access_pattern, read):
+        import h5py
+        from rsciio.hspy._api import HyperspyWriter
+
+        data = make_data((64, 64, 128, 128), "u2")
+        self.file = h5py.File(
+            "chunk_access_pattern.hspy", "w", driver="core", backing_store=False
+        )
+        HyperspyWriter.overwrite_dataset(
+            self.file,
+            data,
+            "data",
+            signal_axes=(2, 3),
+            access_pattern=access_pattern,
+            compression="gzip",
+        )
+
+    def teardown(self, access_pattern, read):
+        self.file.close()
+
+    def time_read(self, access_pattern, read):
+        dset = self.file["data"]
+        if read == "signal":
+            dset[32, 32]
+        else:
+            dset[:, :, 60:68, 60:68].sum(axis=(2, 3))
+
+
+def _nested_dict(depth, width):
+    if depth == 0:
+        return {f"item{i}": float(i) for i in range(width)}
+    return {f"node{i}": _nested_dict(depth - 1, width) for i in range(width)}
+
+
+class ZspyOpenNestedMetadata:
+    # opening a file with a deep original_metadata tree, where each node is
+    # stored as a zarr group
+    params = [False, True]
+    param_names = ["consolidated"]
+    timeout = 300
+
+    def setup(self, consolidated):
+        import shutil
+        import tempfile
+
+        from rsciio.zspy import file_writer
+
+        signal = make_signal_dict("zspy", 1)
+        signal["original_metadata"] = _nested_dict(4, 5)
+        self.dirname = tempfile.mkdtemp()
+        self.filename = Path(self.dirname) / "nested_metadata.zspy"
+        file_writer(str(self.filename), signal)
+        if not consolidated:
+            # as written by rosettasciio < 0.2
+            (self.filename / ".zmetadata").unlink()
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, consolidated):
+        self._rmtree(self.dirname)
+
+    def time_open(self, consolidated):
+        from rsciio.zspy import file_reader
+
+        file_reader(str(self.filename), lazy=True)
+
+    def track_store_accesses(self, consolidated):
+        # each access is a request to the filesystem, slow on network filesystems
+        import zarr
+        from rsciio.zspy import file_reader
+
+        accesses = []
+
+        class Store(zarr.storage.NestedDirectoryStore):
+            def __getitem__(self, key):
+                accesses.append(key)
+                return super().__getitem__(key)
+
+            def __contains__(self, key):
+                accesses.append(key)
+                return super().__contains__(key)
+
+            def listdir(self, path=None):
+                accesses.append(path)
+                return super().listdir(path)
+
+        file_reader(Store(str(self.filename)), lazy=True)
+        return len(accesses)
+
+    track_store_accesses.unit = "accesses"
+
+
+class AppendRows:
+    # write a map row by row as during a live acquisition, reading the file
+    # back is possible after each row
+    params = ["hspy", "zspy"]
+    param_names = ["plugin"]
+    timeout = 300
+
+    def setup(self, plugin):
+        import shutil
+        import tempfile
+
+        from .generators import get_plugin
+
+        self.plugin = get_plugin(plugin)
+        self.signal = make_signal_dict(plugin, 16)
+        self.rows = self.signal["data"]
+        self.signal["data"] = self.rows[:0]
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / f"append_rows.{plugin}")
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, plugin):
+        self._rmtree(self.dirname)
+
+    def time_append(self, plugin):
+        with self.plugin.file_appender(self.filename, self.signal) as appender:
+            for i in range(len(self.rows)):
+                appender.append(self.rows[i : i + 1])
+
+
+class ReadHyperslab:
+    # read a 10x10 navigation region of a 4D dataset
+    params = [False, True]
+    param_names = ["lazy"]
+    timeout = 300
+
+    def setup(self, lazy):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_writer
+
+        signal = make_signal_dict("hspy", 1)
+        data = make_data((128, 128, 64, 64), "u2")
+        signal["data"] = data
+        signal["axes"] = [
+            dict(signal["axes"][0], name=name, size=size, navigate=i < 2)
+            for i, (name, size) in enumerate(zip("abcd", data.shape))
+        ]
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / "hyperslab.hspy")
+        file_writer(self.filename, signal)
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, lazy):
+        self._rmtree(self.dirname)
+
+    def time_read(self, lazy):
+        import dask
+        from rsciio.hspy import file_reader
+
+        d = file_reader(
+            self.filename,
+            lazy=lazy,
+            navigation_slice=(slice(60, 70), slice(60, 70)),
+        )[0]
+        dask.compute(d["data"])
+
+
+class NavigatorFromSummary:
+    # navigator image of a 4D dataset, from the summary written with the data
+    # or by summing the dataset
+    params = [False, True]
+    param_names = ["summary"]
+    timeout = 300
+
+    def setup(self, summary):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_writer
+
+        signal = make_signal_dict("hspy", 1)
+        data = make_data((128, 128, 64, 64), "u2")
+        signal["data"] = data
+        signal["axes"] = [
+            dict(signal["axes"][0], name=name, size=size, navigate=i < 2)
+            for i, (name, size) in enumerate(zip("abcd", data.shape))
+        ]
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / "summary.hspy")
+        file_writer(self.filename, signal, write_summary=summary)
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, summary):
+        self._rmtree(self.dirname)
+
+    def time_navigator(self, summary):
+        from rsciio.hspy import file_reader
+
+        if summary:
+            d = file_reader(self.filename, metadata_only=True)[0]
+            d["summary"]["navigation_sum"][0]
+        else:
+            d = file_reader(self.filename, lazy=True)[0]
+            d["data"].sum(axis=(2, 3)).compute()
+
+
+class ZspyAutoCompressor:
+    # writing sparse counting data with the default or the selected compressor
+    params = ["default", "auto"]
+    param_names = ["compressor"]
+    timeout = 300
+
+    def setup(self, compressor):
+        import shutil
+        import tempfile
+
+        signal = make_signal_dict("zspy", 1)
+        rng = np.random.default_rng(0)
+        data = rng.poisson(0.05, size=(64, 64, 64, 64)).astype("u2")
+        signal["data"] = data
+        signal["axes"] = [
+            dict(signal["axes"][0], name=name, size=size, navigate=i < 2)
+            for i, (name, size) in enumerate(zip("abcd", data.shape))
+        ]
+        self.signal = signal
+        self.dirname = tempfile.mkdtemp()
+        self.filename = Path(self.dirname) / "compressor.zspy"
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, compressor):
+        self._rmtree(self.dirname)
+
+    def _write(self, compressor):
+        from rsciio.zspy import file_writer
+
+        file_writer(
+            str(self.filename),
+            self.signal,
+            compressor=None if compressor == "default" else compressor,
+        )
+
+    def time_write(self, compressor):
+        self._write(compressor)
+
+    def track_size(self, compressor):
+        self._write(compressor)
+        return sum(f.stat().st_size for f in self.filename.rglob("*") if f.is_file())
+
+    track_size.unit = "bytes"
+
+
+class HspyUpdateMetadata:
+    # change the scale of an axis of an existing file
+    params = [True, False]
+    param_names = ["write_dataset"]
+    timeout = 300
+
+    def setup(self, write_dataset):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_writer
+
+        self.signal = make_signal_dict("hspy", 64)
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / "update_metadata.hspy")
+        file_writer(self.filename, self.signal)
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, write_dataset):
+        self._rmtree(self.dirname)
+
+    def time_update_axis(self, write_dataset):
+        from rsciio.hspy import file_writer
+
+        self.signal["axes"][0]["scale"] += 0.1
+        file_writer(self.filename, self.signal, write_dataset=write_dataset)
+
+
+class WriteLargeMetadata:
+    # original_metadata tree with 20000 tags, as read from DM or Velox files
+    params = ["hspy", "zspy"]
+    param_names = ["plugin"]
+    timeout = 300
+
+    def setup(self, plugin):
+        import shutil
+        import tempfile
+
+        from .generators import get_plugin
+
+        self.plugin = get_plugin(plugin)
+        self.signal = make_signal_dict(plugin, 1)
+        self.signal["original_metadata"] = {
+            f"TagGroup{i}": {
+                f"Tag{j}": f"value {j}" if j % 2 else float(j) for j in range(100)
+            }
+            for i in range(200)
+        }
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / f"large_metadata.{plugin}")
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, plugin):
+        self._rmtree(self.dirname)
+
+    def time_write(self, plugin):
+        self.plugin.file_writer(self.filename, self.signal)
+
+
+class ReadMisalignedChunks:
+    # lazy sum of a 4D dataset stored in (16, 16, 64, 64) chunks, read with
+    # dask chunks aligned on the stored chunks or straddling them
+    params = ["auto", (24, 24, 64, 64)]
+    param_names = ["chunks"]
+    timeout = 300
+
+    def setup(self, chunks):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_writer
+
+        signal = make_signal_dict("hspy", 1)
+        data = make_data((256, 256, 64, 64), "u2")
+        signal["data"] = data
+        signal["axes"] = [
+            dict(signal["axes"][0], name=name, size=size, navigate=i < 2)
+            for i, (name, size) in enumerate(zip("abcd", data.shape))
+        ]
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / "chunks.hspy")
+        file_writer(self.filename, signal, chunks=(16, 16, 64, 64))
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, chunks):
+        self._rmtree(self.dirname)
+
+    def time_sum(self, chunks):
+        from rsciio.hspy import file_reader
+
+        d = file_reader(self.filename, lazy=True, chunks=chunks)[0]
+        d["data"].sum(axis=(2, 3)).compute()
+
+
+class SWMRPoll:
+    # poll a file being appended for the last frame, by refreshing the
+    # signal read in SWMR mode or by reading the file again
+    params = [False, True]
+    param_names = ["swmr"]
+    timeout = 300
+
+    def setup(self, swmr):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_appender, file_reader
+
+        signal = make_signal_dict("hspy", 16)
+        signal["original_metadata"] = {
+            f"TagGroup{i}": {f"Tag{j}": float(j) for j in range(100)} for i in range(20)
+        }
+        self.dirname = tempfile.mkdtemp()
+        self.filename = str(Path(self.dirname) / "swmr.hspy")
+        self.appender = file_appender(self.filename, signal, swmr=swmr)
+        self.rows = signal["data"]
+        self.swmr = swmr
+        if swmr:
+            self.signal = file_reader(self.filename, lazy=True, swmr=True)[0]
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, swmr):
+        self.appender.close()
+        self._rmtree(self.dirname)
+
+    def time_poll(self, swmr):
+        from rsciio.hspy import file_reader
+        from rsciio.utils.tools import get_file_handle
+
+        for i in range(len(self.rows)):
+            self.appender.append(self.rows[i : i + 1])
+            if self.swmr:
+                d = self.signal["refresh"]()
+                d["data"][-1].compute()
+            else:
+                d = file_reader(self.filename, lazy=True)[0]
+                d["data"][-1].compute()
+                get_file_handle(d["data"]).close()
+
+
+class StitchFiles:
+    # lazy sum of 100 tiles, concatenated with dask or read from a master
+    # file referencing the tiles in a virtual dataset
+    params = ["concatenate", "virtual"]
+    param_names = ["method"]
+    timeout = 300
+
+    def setup(self, method):
+        import shutil
+        import tempfile
+
+        from rsciio.hspy import file_writer, write_virtual_dataset
+
+        signal = make_signal_dict("hspy", 8)
+        self.dirname = tempfile.mkdtemp()
+        self.files = [str(Path(self.dirname) / f"tile_{i}.hspy") for i in range(100)]
+        for filename in self.files:
+            file_writer(filename, signal)
+        self.filename = str(Path(self.dirname) / "tiles.hspy")
+        write_virtual_dataset(self.filename, self.files)
+        self._rmtree = shutil.rmtree
+
+    def teardown(self, method):
+        self._rmtree(self.dirname)
+
+    def time_sum(self, method):
+        import dask.array as da
+        from rsciio.hspy import file_reader
+
+        if method == "virtual":
+            data = file_reader(self.filename, lazy=True)[0]["data"]
+        else:
+            data = da.stack(
+                [file_reader(filename, lazy=True)[0]["data"] for filename in self.files]
+            )
+        data.sum(axis=(-2, -1)).compute()
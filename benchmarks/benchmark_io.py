@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""Read and write benchmarks of the plugins with writers, using synthetic
+data of different sizes.
+"""
+
+import copy
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from .generators import FORMATS, MB, SIZES, get_plugin, make_signal_dict, write_file
+
+
+def _read(plugin, filename):
+    signals = plugin.file_reader(str(filename))
+    # some readers return memory-mapped arrays, make sure the data is read
+    for signal in signals:
+        np.sum(signal["data"])
+    return signals
+
+
+def _write(plugin, filename, signal):
+    # some writers modify the metadata of the signal, use a copy to write the
+    # same file at each repeat
+    metadata = {key: value for key, value in signal.items() if key != "data"}
+    signal = dict(copy.deepcopy(metadata), data=signal["data"])
+    plugin.file_writer(filename, signal)
+
+
+class Read:
+    params = (list(FORMATS), SIZES)
+    param_names = ["plugin", "size_MB"]
+    timeout = 600
+
+    def setup_cache(self):
+        # The files are written once and shared by all the benchmarks
+        filenames = {}
+        for plugin_name in FORMATS:
+            for size in SIZES:
+                try:
+                    filename = write_file(plugin_name, size)
+                except NotImplementedError:
+                    continue
+                filenames[(plugin_name, size)] = str(filename)
+        return filenames
+
+    def setup(self, filenames, plugin_name, size):
+        if (plugin_name, size) not in filenames:
+            raise NotImplementedError
+        self.plugin = get_plugin(plugin_name)
+        self.filename = filenames[(plugin_name, size)]
+
+    def time_read(self, filenames, plugin_name, size):
+        _read(self.plugin, self.filename)
+
+    def peakmem_read(self, filenames, plugin_name, size):
+        _read(self.plugin, self.filename)
+
+    def track_read_speed(self, filenames, plugin_name, size):
+        start = time.perf_counter()
+        signals = _read(self.plugin, self.filename)
+        duration = time.perf_counter() - start
+        return sum(s["data"].nbytes for s in signals) / MB / duration
+
+    track_read_speed.unit = "MB/s"
+
+
+class Write:
+    params = (list(FORMATS), SIZES)
+    param_names = ["plugin", "size_MB"]
+    timeout = 600
+
+    def setup(self, plugin_name, size):
+        self.plugin = get_plugin(plugin_name)
+        self.signal = make_signal_dict(plugin_name, size)
+        self.dirname = tempfile.mkdtemp()
+        self.filename = f"{self.dirname}/file.{FORMATS[plugin_name]['extension']}"
+
+    def teardown(self, plugin_name, size):
+        shutil.rmtree(self.dirname)
+
+    def time_write(self, plugin_name, size):
+        _write(self.plugin, self.filename, self.signal)
+
+    def peakmem_write(self, plugin_name, size):
+        _write(self.plugin, self.filename, self.signal)
+
+    def track_write_speed(self, plugin_name, size):
+        start = time.perf_counter()
+        _write(self.plugin, self.filename, self.signal)
+        duration = time.perf_counter() - start
+        return self.signal["data"].nbytes / MB / duration
+
+    track_write_speed.unit = "MB/s"
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""Deterministic generators of synthetic signals and files for the benchmarks.
+"""
+
+import importlib
+import math
+from pathlib import Path
+
+import numpy as np
+
+
+MB = 2**20
+
+# Size of the generated data in MB
+SIZES = [1, 16, 64]
+
+# Description of the synthetic data written with each plugin:
+# - extension: extension of the file
+# - navigation_dimension: number of navigation axes
+# - signal_shape: shape of the signal, None for the axes scaled with the size
+#   of the data (for the formats supporting a single signal)
+# - dtype: dtype of the data
+# - max_size: maximum size of the data in MB, for the slow text formats
+FORMATS = {
+    "blockfile": dict(
+        extension="blo", navigation_dimension=2, signal_shape=(128, 128), dtype="u1"
+    ),
+    "emd": dict(
+        extension="emd", navigation_dimension=1, signal_shape=(256, 256), dtype="u2"
+    ),
+    "hspy": dict(
+        extension="hspy", navigation_dimension=2, signal_shape=(1024,), dtype="u2"
+    ),
+    "image": dict(
+        extension="png",
+        navigation_dimension=0,
+        signal_shape=(None, None),
+        dtype="u1",
+    ),
+    "mrcz": dict(
+        extension="mrcz", navigation_dimension=1, signal_shape=(256, 256), dtype="f4"
+    ),
+    "msa": dict(
+        extension="msa",
+        navigation_dimension=0,
+        signal_shape=(None,),
+        dtype="f8",
+        max_size=1,
+    ),
+    "nexus": dict(
+        extension="nxs", navigation_dimension=2, signal_shape=(1024,), dtype="u2"
+    ),
+    "pantarhei": dict(
+        extension="prz", navigation_dimension=1, signal_shape=(256, 256), dtype="u2"
+    ),
+    "ripple": dict(
+        extension="rpl", navigation_dimension=2, signal_shape=(1024,), dtype="u2"
+    ),
+    "semper": dict(
+        extension="unf", navigation_dimension=1, signal_shape=(256, 256), dtype="f4"
+    ),
+    "tiff": dict(
+        extension="tif", navigation_dimension=1, signal_shape=(256, 256), dtype="u2"
+    ),
+    "tvips": dict(
+        extension="tvips", navigation_dimension=1, signal_shape=(256, 256), dtype="u2"
+    ),
+    "usid": dict(
+        extension="h5", navigation_dimension=2, signal_shape=(1024,), dtype="u2"
+    ),
+    "zspy": dict(
+        extension="zspy", navigation_dimension=2, signal_shape=(1024,), dtype="u2"
+    ),
+}
+
+
+def get_plugin(plugin_name):
+    """
+    Import the API of a plugin, raise ``NotImplementedError`` to skip the
+    benchmark when the optional dependencies are not installed.
+    """
+    try:
+        return importlib.import_module(f"rsciio.{plugin_name}")
+    except ImportError:
+        raise NotImplementedError(f"{plugin_name} is not available")
+
+
+def get_shape(plugin_name, size):
+    """
+    Return the shape of the data of ``size`` MB written with ``plugin_name``.
+    """
+    fmt = FORMATS[plugin_name]
+    itemsize = np.dtype(fmt["dtype"]).itemsize
+    count = size * MB // itemsize
+    signal_shape = tuple(fmt["signal_shape"])
+    if None in signal_shape:
+        side = int(round(count ** (1 / len(signal_shape))))
+        return (side,) * len(signal_shape)
+    count = max(count // math.prod(signal_shape), 1)
+    if fmt["navigation_dimension"] == 1:
+        return (count,) + signal_shape
+    side = max(math.isqrt(count), 1)
+    return (side, side) + signal_shape
+
+
+def make_data(shape, dtype, seed=0):
+    """
+    Return reproducible data looking like counts: the values are drawn from
+    a Poisson distribution, which compresses like experimental data rather
+    than like uniform noise.
+    """
+    rng = np.random.default_rng(seed)
+    dtype = np.dtype(dtype)
+    data = rng.poisson(10, size=shape)
+    if dtype.kind == "u":
+        data = np.minimum(data, np.iinfo(dtype).max)
+    return data.astype(dtype)
+
+
+def make_signal_dict(plugin_name, size, seed=0):
+    """
+    Return the signal dictionary of about ``size`` MB of synthetic data
+    suitable for the writer of ``plugin_name``.
+    """
+    fmt = FORMATS[plugin_name]
+    if size > fmt.get("max_size", math.inf):
+        raise NotImplementedError(f"{plugin_name} is too slow for {size} MB")
+    shape = get_shape(plugin_name, size)
+    navigation_dimension = fmt["navigation_dimension"]
+    axes = [
+        {
+            "_type": "UniformDataAxis",
+            "name": name,
+            "size": axis_size,
+            "scale": 0.1,
+            "offset": 0.0,
+            "units": "nm",
+            "navigate": i < navigation_dimension,
+            "index_in_array": i,
+        }
+        for i, (name, axis_size) in enumerate(zip("abcd", shape))
+    ]
+    return {
+        "data": make_data(shape, fmt["dtype"], seed=seed),
+        "axes": axes,
+        "metadata": {
+            "General": {"title": "synthetic"},
+            "Signal": {"signal_type": ""},
+        },
+        "original_metadata": {},
+        "tmp_parameters": {},
+        "learning_results": {},
+        "models": {},
+        "attributes": {"_lazy": False},
+        "package_info": {"name": "rsciio", "version": ""},
+    }
+
+
+def write_file(plugin_name, size, dirname=".", seed=0):
+    """
+    Write a file of about ``size`` MB of synthetic data with ``plugin_name``
+    in ``dirname`` and return its path.
+    """
+    plugin = get_plugin(plugin_name)
+    fmt = FORMATS[plugin_name]
+    signal = make_signal_dict(plugin_name, size, seed=seed)
+    filename = Path(dirname) / f"{plugin_name}_{size}MB.{fmt['extension']}"
+    plugin.file_writer(str(filename), signal)
+    if plugin_name == "tvips":
+        # the tvips writer appends the index of the file to the filename
+        filename = filename.with_name(f"{filename.stem}_000.tvips")
+    return filename
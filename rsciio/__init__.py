@@ -16,28 +16,19 @@
 # You should have received a copy of the GNU General Public License
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import importlib
 import logging
-import yaml
-import os
 
-from rsciio._version import __version__
 
-
-IO_PLUGINS = []
 _logger = logging.getLogger(__name__)
 
-for sub, _, _ in os.walk(os.path.abspath(os.path.dirname(__file__))):
-    _specsf = os.path.join(sub, "specifications.yaml")
-    if os.path.isfile(_specsf):
-        with open(_specsf, "r") as stream:
-            _specs = yaml.safe_load(stream)
-            # for testing purposes
-            _specs["api"] = "rsciio.%s" % os.path.split(sub)[1]
-            IO_PLUGINS.append(_specs)
 
 __all__ = [
     "__version__",
     "IO_PLUGINS",
+    "convert",
+    "detect_format",
+    "read_many",
 ]
 
 
@@ -45,35 +36,84 @@ def __dir__():
     return sorted(__all__)
 
 
-if "dev" in __version__:
-    # Copied from https://github.com/scikit-image/scikit-image
-    # Append last commit date and hash to dev version information, if available
-
-    import subprocess
-    import os.path
-
+def _load_io_plugins():
     try:
-        p = subprocess.Popen(
-            ["git", "log", "-1", '--format="%h %aI"'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=os.path.dirname(__file__),
+        from rsciio._io_plugins import IO_PLUGINS
+    except ImportError:  # pragma: no cover
+        # The compiled registry is missing, fall back to parsing the
+        # specifications files
+        _logger.warning(
+            "The compiled IO plugins registry can't be found, "
+            "reading `specifications.yaml` files instead."
         )
-    except FileNotFoundError:
-        pass
-    else:
-        out, err = p.communicate()
-        if p.returncode == 0:
-            git_hash, git_date = (
-                out.decode("utf-8")
-                .strip()
-                .replace('"', "")
-                .split("T")[0]
-                .replace("-", "")
-                .split()
-            )
+        from rsciio._specifications import read_specifications
+
+        IO_PLUGINS = read_specifications()
+
+    return IO_PLUGINS
+
+
+def _get_version():
+    from rsciio._version import __version__
+
+    if "dev" in __version__:
+        # Copied from https://github.com/scikit-image/scikit-image
+        # Append last commit date and hash to dev version information, if available
+
+        import subprocess
+        import os.path
 
-            __version__ = "+".join(
-                [tag for tag in __version__.split("+") if not tag.startswith("git")]
+        try:
+            p = subprocess.Popen(
+                ["git", "log", "-1", '--format="%h %aI"'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=os.path.dirname(__file__),
             )
-            __version__ += f"+git{git_date}.{git_hash}"
+        except FileNotFoundError:
+            pass
+        else:
+            out, err = p.communicate()
+            if p.returncode == 0:
+                git_hash, git_date = (
+                    out.decode("utf-8")
+                    .strip()
+                    .replace('"', "")
+                    .split("T")[0]
+                    .replace("-", "")
+                    .split()
+                )
+
+                __version__ = "+".join(
+                    [tag for tag in __version__.split("+") if not tag.startswith("git")]
+                )
+                __version__ += f"+git{git_date}.{git_hash}"
+
+    return __version__
+
+
+def _get_function(module, name):
+    def _import():
+        return getattr(importlib.import_module(module), name)
+
+    return _import
+
+
+# `IO_PLUGINS`, `__version__` and the functions of the API are loaded on first
+# access to keep `import rsciio` cheap, see PEP 562.
+_LAZY_ATTRIBUTES = {
+    "IO_PLUGINS": _load_io_plugins,
+    "__version__": _get_version,
+    "convert": _get_function("rsciio._convert", "convert"),
+    "detect_format": _get_function("rsciio._detect_format", "detect_format"),
+    "read_many": _get_function("rsciio._read_many", "read_many"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = _LAZY_ATTRIBUTES[name]()
+        # cache the value so that `__getattr__` is not called anymore
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
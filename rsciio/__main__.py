@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""
+Command line interface of RosettaSciIO, for example::
+
+    python -m rsciio convert scan.blo scan.zspy --workers 4
+"""
+
+import argparse
+import sys
+
+
+def _parse_chunks(value):
+    if value == "auto":
+        return value
+    return tuple(int(chunk) for chunk in value.split(","))
+
+
+def _convert(args):
+    from rsciio import convert
+
+    reports = convert(
+        args.src,
+        args.dst,
+        chunks=args.chunks,
+        workers=args.workers,
+        resume=args.resume,
+        reader=args.reader,
+        writer=args.writer,
+        show_progressbar=not args.no_progressbar,
+    )
+    for report in reports:
+        print(
+            f"{report['filename']}: {report['nbytes'] / 2**20:.1f} MiB in "
+            f"{report['duration']:.2f} s ({report['throughput'] / 2**20:.1f} MiB/s)"
+        )
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m rsciio",
+        description="Read and write scientific file formats.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser(
+        "convert",
+        help="Convert a file to another format without loading it in memory.",
+    )
+    convert_parser.add_argument("src", help="The file to convert.")
+    convert_parser.add_argument(
+        "dst",
+        help="The file to write, its format is given by its extension.",
+    )
+    convert_parser.add_argument(
+        "--chunks",
+        type=_parse_chunks,
+        default=None,
+        help="Comma separated chunk shape, for example '1,16,-1,-1', or 'auto'.",
+    )
+    convert_parser.add_argument(
+        "--workers", type=int, default=None, help="The number of threads."
+    )
+    convert_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Only write the chunks missing in a partially written output.",
+    )
+    convert_parser.add_argument(
+        "--reader", default=None, help="The name of the plugin reading the file."
+    )
+    convert_parser.add_argument(
+        "--writer", default=None, help="The name of the plugin writing the file."
+    )
+    convert_parser.add_argument(
+        "--no-progressbar", action="store_true", help="Don't show the progressbar."
+    )
+    convert_parser.set_defaults(func=_convert)
+
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
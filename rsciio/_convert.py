@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import importlib
+import inspect
+import logging
+from pathlib import Path
+import time
+
+import dask
+import dask.array as da
+import numpy as np
+from dask.array.core import slices_from_chunks
+
+from rsciio._detect_format import detect_format
+from rsciio.utils.array import get_signal_aware_dask_array
+from rsciio.utils.tools import dummy_context_manager
+
+
+_logger = logging.getLogger(__name__)
+
+
+# The formats supporting to resume writing partially written outputs
+RESUMABLE_FORMATS = ["ZSPY"]
+
+
+def _get_plugin_by_name(name):
+    from rsciio import IO_PLUGINS
+
+    for plugin in IO_PLUGINS:
+        names = [plugin["name"]] + plugin["name_aliases"]
+        if name.lower() in [name_.lower() for name_ in names]:
+            return plugin
+    raise ValueError(f"The format '{name}' is not supported.")
+
+
+def _get_reader(filename, reader=None):
+    if reader is not None:
+        return _get_plugin_by_name(reader)
+    plugins = detect_format(filename)
+    if not plugins:
+        raise ValueError(f"The format of the file '{filename}' can't be detected.")
+    return plugins[0]
+
+
+def _get_writer(filename, writer=None):
+    if writer is not None:
+        plugin = _get_plugin_by_name(writer)
+        if not plugin["writes"]:
+            raise ValueError(f"The {plugin['name']} plugin doesn't support writing.")
+        return plugin
+
+    from rsciio import IO_PLUGINS
+
+    extension = Path(filename).suffix[1:].lower()
+    for plugin in IO_PLUGINS:
+        if plugin["writes"] and extension in [
+            ext.lower() for ext in plugin["file_extensions"]
+        ]:
+            return plugin
+    raise ValueError(f"No plugin can write files with the extension '{extension}'.")
+
+
+def _accepts(function, argument):
+    return argument in inspect.signature(function).parameters
+
+
+def _complete_signal_dict(signal, filename):
+    """
+    Add the items expected by the writers, which are not returned by the
+    readers, to the dictionary of a lazy signal.
+    """
+    signal.setdefault("original_metadata", {})
+    signal.setdefault("tmp_parameters", {})
+    signal.setdefault("learning_results", {})
+    signal.setdefault("models", {})
+    signal.setdefault("package_info", {})
+    signal.setdefault("attributes", {})["_lazy"] = True
+    general = signal.setdefault("metadata", {}).setdefault("General", {})
+    if not general.get("title"):
+        general["title"] = Path(filename).stem
+    for axis in signal["axes"]:
+        axis.setdefault("_type", "DataAxis" if "axis" in axis else "UniformDataAxis")
+    return signal
+
+
+def _get_dataset(filename, signal):
+    """Return the data array of a zspy file or None if it doesn't exist."""
+    import zarr
+
+    try:
+        f = zarr.open_group(
+            store=zarr.storage.NestedDirectoryStore(filename), mode="r+"
+        )
+    except (zarr.errors.GroupNotFoundError, FileNotFoundError):
+        return None
+    group_name = signal["metadata"]["General"]["title"].replace("/", "-")
+    return f.get(f"Experiments/{group_name}/data")
+
+
+def _resume(filename, signal, file_writer, cm):
+    """
+    Write the chunks missing in a partially written zspy file and return
+    True, or return False if the dataset needs to be written from scratch.
+    """
+    dset = _get_dataset(filename, signal)
+    data = signal["data"]
+    if dset is None or dset.shape != data.shape or dset.dtype != data.dtype:
+        return False
+
+    data = data.rechunk(dset.chunks)
+    # zarr writes each chunk in a separate file, which is only present
+    # when the chunk has been written completely
+    sources, regions = [], []
+    for block, region in zip(
+        np.ndindex(*data.numblocks),
+        slices_from_chunks(data.chunks),
+    ):
+        # the separator depends on the version of zarr used to write the file
+        keys = [f"{dset.path}/{sep.join(map(str, block))}" for sep in "./"]
+        if not any(key in dset.chunk_store for key in keys):
+            sources.append(data.blocks[block])
+            regions.append(region)
+    _logger.info(
+        f"Resuming {filename}: {len(sources)} chunks out of "
+        f"{data.npartitions} to write."
+    )
+    if sources:
+        with cm():
+            da.store(sources, [dset] * len(sources), regions=regions, lock=False)
+    # the metadata are written after the data, so they may be missing
+    file_writer(filename, signal, write_dataset=False)
+    return True
+
+
+def convert(
+    src,
+    dst,
+    chunks=None,
+    workers=None,
+    resume=False,
+    reader=None,
+    writer=None,
+    show_progressbar=True,
+    reader_kwds=None,
+    writer_kwds=None,
+):
+    """
+    Convert a file to another format without loading its data in memory.
+
+    The file is read lazily and the chunks of the dask array are computed
+    and written one after the other by the writer, so that the memory usage
+    depends on the size of the chunks and the number of workers, not on the
+    size of the file. The memory usage is constant only for the plugins
+    supporting lazy loading and for the writers writing dask arrays chunk by
+    chunk, such as ``zspy``, ``hspy``, ``nexus`` and ``tvips``.
+
+    Parameters
+    ----------
+    src : str or pathlib.Path
+        The file to convert.
+    dst : str or pathlib.Path
+        The file to write. When the source file contains several signals,
+        the index of the signal is appended to the name of the files, for
+        example ``file_0.zspy``, ``file_1.zspy``, etc.
+    chunks : tuple, dict, str or None, default=None
+        The chunks used to read and write the data, see
+        :py:func:`dask.array.from_array`. If None, use the chunks of the
+        reader, which contain entire signals for most plugins.
+    workers : int or None, default=None
+        The number of threads used to read and write the chunks. If None, use
+        the dask default.
+    resume : bool, default=False
+        If True and ``dst`` exists, only write the chunks which are missing,
+        for example after an interruption. The shape and dtype of the data
+        must be the same, otherwise the file is written again. Only supported
+        for the ``zspy`` format.
+    reader : str or None, default=None
+        The name of the plugin used to read the file. If None, the format is
+        detected with :py:func:`rsciio.detect_format`.
+    writer : str or None, default=None
+        The name of the plugin used to write the file. If None, use the first
+        plugin supporting the extension of ``dst``.
+    show_progressbar : bool, default=True
+        Whether to show the progressbar or not.
+    reader_kwds : dict or None, default=None
+        The keyword arguments passed to the ``file_reader`` of the plugin.
+    writer_kwds : dict or None, default=None
+        The keyword arguments passed to the ``file_writer`` of the plugin.
+
+    Returns
+    -------
+    list of dict
+        For each file written, a dictionary with the ``filename``, the number
+        of bytes of the uncompressed data (``nbytes``), the ``duration`` of
+        the conversion in seconds and the ``throughput`` in bytes per second.
+
+    Raises
+    ------
+    ValueError
+        If the format of ``src`` or ``dst`` isn't supported or, with
+        ``resume=True``, doesn't support resuming.
+
+    Examples
+    --------
+    >>> from rsciio import convert
+    >>> report = convert("scan.blo", "scan.zspy", workers=4)
+    >>> report[0]["throughput"] / 2**20  # MiB/s
+    """
+    reader_kwds = dict(reader_kwds or {})
+    writer_kwds = dict(writer_kwds or {})
+    src, dst = str(src), Path(dst)
+
+    start = time.perf_counter()
+    reader = _get_reader(src, reader)
+    writer = _get_writer(dst, writer)
+    if resume and writer["name"] not in RESUMABLE_FORMATS:
+        raise ValueError(
+            f"Resuming is not supported for the {writer['name']} format, only "
+            f"for {', '.join(RESUMABLE_FORMATS)}."
+        )
+    file_reader = importlib.import_module(reader["api"]).file_reader
+    file_writer = importlib.import_module(writer["api"]).file_writer
+
+    if chunks is not None and _accepts(file_reader, "chunks"):
+        reader_kwds["chunks"] = chunks
+    signals = file_reader(src, lazy=True, **reader_kwds)
+
+    if show_progressbar and not _accepts(file_writer, "show_progressbar"):
+        from dask.diagnostics import ProgressBar
+
+        cm = ProgressBar
+    else:
+        cm = dummy_context_manager
+        if _accepts(file_writer, "show_progressbar"):
+            writer_kwds.setdefault("show_progressbar", show_progressbar)
+
+    if workers is None:
+        config = {}
+    else:
+        config = {"scheduler": "threads", "num_workers": workers}
+
+    reports = []
+    for i, signal in enumerate(signals):
+        signal = _complete_signal_dict(signal, src)
+        data = signal["data"]
+        if not isinstance(data, da.Array):
+            _logger.warning(
+                f"The {reader['name']} reader doesn't support lazy loading, the "
+                "data is loaded in memory."
+            )
+            signal_axes = [
+                j for j, ax in enumerate(signal["axes"]) if not ax["navigate"]
+            ]
+            data = get_signal_aware_dask_array(data, signal_axes)
+        if chunks is not None and "chunks" not in reader_kwds:
+            data = data.rechunk(chunks)
+        signal["data"] = data
+
+        filename = dst
+        if len(signals) > 1:
+            filename = dst.with_name(f"{dst.stem}_{i}{dst.suffix}")
+        filename = str(filename)
+
+        with dask.config.set(config):
+            if not (
+                resume
+                and Path(filename).exists()
+                and _resume(filename, signal, file_writer, cm)
+            ):
+                with cm():
+                    file_writer(filename, signal, **writer_kwds)
+
+        duration = time.perf_counter() - start
+        reports.append(
+            {
+                "filename": filename,
+                "nbytes": data.nbytes,
+                "duration": duration,
+                "throughput": data.nbytes / duration,
+            }
+        )
+        _logger.info(
+            f"{src} converted to {filename} at {data.nbytes / duration / 2**20:.1f} "
+            "MiB/s."
+        )
+        start = time.perf_counter()
+
+    return reports
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+from pathlib import Path
+
+
+HEADER_SIZE = 4096
+
+
+def read_header(path, header_size=HEADER_SIZE):
+    """
+    Read the first bytes of a file. For a directory, such as a zarr directory
+    store, the attributes of the root group (``.zattrs`` file) are read.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path of the file.
+    header_size : int, default=4096
+        The number of bytes to read.
+
+    Returns
+    -------
+    bytes
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / ".zattrs"
+        if not path.is_file():
+            return b""
+    with open(path, "rb") as f:
+        return f.read(header_size)
+
+
+def _get_magic_bytes(signature):
+    if "hex" in signature:
+        return bytes.fromhex(signature["hex"])
+    return signature["ascii"].encode()
+
+
+def _match_signature(signature, header):
+    """
+    Return the number of bytes matched by the signature, 0 if it doesn't
+    match. When ``offset`` is not defined, the signature is searched in the
+    whole header and, when it is a list, the signature can be at any of
+    these offsets.
+    """
+    magic = _get_magic_bytes(signature)
+    offset = signature.get("offset")
+    if offset is None:
+        matched = magic in header
+    else:
+        offsets = offset if isinstance(offset, list) else [offset]
+        matched = any(header[i : i + len(magic)] == magic for i in offsets)
+    return len(magic) if matched else 0
+
+
+def _get_plugin_score(plugin, header, extension):
+    """
+    Return a sortable score of the plugin for the given header and extension
+    or None if the plugin can't read the file.
+    """
+    extension_match = extension in [ext.lower() for ext in plugin["file_extensions"]]
+    signatures = plugin.get("magic_signatures") or []
+    signature_length = max(
+        [_match_signature(signature, header) for signature in signatures],
+        default=0,
+    )
+    if signatures and not signature_length:
+        # The content of the file is not compatible with this plugin
+        return None
+    hints = sum(
+        bool(_match_signature(hint, header)) for hint in plugin.get("magic_hints") or []
+    )
+    if not signatures and not extension_match and not hints:
+        return None
+
+    # A plugin is a strong match when the extension or a specific hint
+    # matches, because short signatures (e.g. DM) can match files of
+    # format without signature (e.g. ripple raw files).
+    return (extension_match or hints > 0, signature_length > 0, hints, signature_length)
+
+
+def detect_format(path, header_size=HEADER_SIZE, plugins=None):
+    """
+    Detect the format of a file from its content and its extension.
+
+    The first bytes of the file are read once and compared to the
+    ``magic_signatures`` and ``magic_hints`` declared in the
+    ``specifications.yaml`` file of each plugin:
+
+    - ``magic_signatures`` are required: if a plugin declares signatures,
+      at least one of them must match for the plugin to be a candidate.
+    - ``magic_hints`` are optional and increase the rank of the plugin, for
+      example, to distinguish the different plugins based on HDF5.
+
+    Plugins without signatures are candidates when the file extension or one
+    of their hints match.
+
+    The HDF5 signature is searched at the offsets where the superblock is
+    written after a user block of 512, 1024 or 2048 bytes. The hints of the
+    plugins based on HDF5 are the names of groups or attributes, e.g.
+    ``Experiments`` for HSPY or ``NX_class`` for NeXus, which are only found
+    when they are written in the first ``header_size`` bytes of the file. This
+    is usually the case for small files, but they can be written further in
+    large files or after a large user block: increase ``header_size`` or
+    give the reader explicitly in this case.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path of the file.
+    header_size : int, default=4096
+        The number of bytes read at the beginning of the file.
+    plugins : list of dict or None, default=None
+        The plugins to consider. If None, use :py:data:`rsciio.IO_PLUGINS`.
+
+    Returns
+    -------
+    list of dict
+        The specifications of the candidate plugins, ranked from the best to
+        the worst match. The list is empty when no plugin matches.
+
+    Examples
+    --------
+    >>> from rsciio import detect_format
+    >>> plugins = detect_format("example.emd")
+    >>> plugins[0]["name"]
+    'EMD'
+    >>> import importlib
+    >>> reader = importlib.import_module(plugins[0]["api"]).file_reader
+    """
+    if plugins is None:
+        from rsciio import IO_PLUGINS
+
+        plugins = IO_PLUGINS
+
+    header = read_header(path, header_size)
+    extension = Path(path).suffix[1:].lower()
+
+    candidates = []
+    for plugin in plugins:
+        score = _get_plugin_score(plugin, header, extension)
+        if score is not None:
+            candidates.append((score, plugin))
+    # sorted is stable: plugins with the same score keep the registry order
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+    return [plugin for _, plugin in candidates]
@@ -39,6 +39,33 @@ LAZY_DOC = """lazy : bool, default=False
     """
 
 
+METADATA_ONLY_DOC = """metadata_only : bool, default=False
+        If ``True``, only the axes and the metadata are read: the ``'data'``
+        item of the returned dictionaries is a placeholder with the shape and
+        dtype of the data, see :py:func:`rsciio.utils.array.get_data_placeholder`.
+        When the format allows it, the data payload is not read from the file.
+    """
+
+
+LAZY_METADATA_DOC = """lazy_metadata : bool, default=False
+        If ``True``, the ``'original_metadata'``, the learning results and the
+        models are returned as :py:class:`rsciio._hierarchical.LazyGroupDict`
+        mappings, whose groups and datasets are read from the file when they
+        are accessed, instead of dictionaries. Use their ``to_dict`` method to
+        convert them to dictionaries. Requires ``lazy=True``, the file is kept
+        open to read them.
+    """
+
+
+SLICE_DOC = """navigation_slice, signal_slice : slice, tuple of slice or None, default=None
+        Read only the part of the data selected by these slices along the
+        navigation and signal axes respectively, given in array order, for
+        example ``navigation_slice=(slice(0, 10), slice(0, 10))``. Only this
+        hyperslab is read from the file, also with ``lazy=True``, and the
+        offset, scale and size of the axes are adjusted accordingly.
+    """
+
+
 LAZY_UNSUPPORTED_DOC = """lazy : bool, default=False
         Lazy loading is not supported.
     """
@@ -51,6 +78,34 @@ CHUNKS_DOC = """chunks : tuple of int or None, default=None
     """
 
 
+ACCESS_PATTERN_DOC = """access_pattern : {None, "signal", "navigation", "balanced"}, default=None
+        If not ``None`` and ``chunks`` is ``None``, the chunks of the signal
+        data are optimised for this access pattern: ``"signal"`` to read the
+        signals at a few navigation positions, ``"navigation"`` to read part
+        of the signal space at every navigation position (e.g. virtual imaging)
+        or ``"balanced"`` for both. See :py:func:`rsciio._hierarchical.plan_chunks`.
+    """
+
+
+CHUNKS_READ_DOC = """chunks : tuple, dict or str, default="auto"
+        The chunks of the dask array when ``lazy=True``. If ``"auto"``, each
+        chunk contains entire signals and its size is close to the
+        ``array.chunk-size`` value of the dask configuration, see
+        :py:func:`rsciio.utils.array.get_signal_aware_dask_array`. Otherwise,
+        it is passed to :py:func:`dask.array.from_array`.
+    """
+
+
+CHUNKS_ALIGNED_READ_DOC = """chunks : None, tuple, dict or str, default=None
+        The chunks of the dask array when ``lazy=True``. If ``None``, the
+        chunks of the dataset in the file are used. If a string, such as
+        ``"auto"``, the chunks calculated by :py:func:`dask.array.from_array`
+        are rounded to multiples of the chunks of the dataset, so that each
+        chunk of the file is read and decompressed only once. Otherwise, it is
+        passed to :py:func:`dask.array.from_array` as it is.
+    """
+
+
 SHOW_PROGRESSBAR_DOC = """show_progressbar : bool, default=True
         Whether to show the progressbar or not.
     """
@@ -78,6 +133,17 @@ MMAP_DOC = """mmap_mode : {None, "r+", "r", "w+", "c"}, default=None
     """
 
 
+WRITE_SUMMARY_DOC = """write_summary : bool, default=False
+        If ``True``, write a summary of the data in the ``_summary`` group of
+        the signal: the sum over the signal axes, as a pyramid binned by 2, 4,
+        8... along the navigation axes until they are smaller than 64, and the
+        mean over the navigation axes. For lazy data, it is computed while
+        writing the data, reading the data only once. The summary is returned
+        in the ``'summary'`` item of the signal dictionary by the reader, also
+        with ``metadata_only=True``, which doesn't read the data.
+    """
+
+
 COMPRESSION_HDF5_DOC = """compression : None, 'gzip', 'szip', 'lzf', default='gzip'
         Compression can significantly increase the saving speed. If file size is not
         an issue, it can be disabled by setting ``compression=None``.
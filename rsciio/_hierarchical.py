@@ -17,16 +17,22 @@
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import ast
+from collections.abc import MutableMapping
 import datetime
+import itertools
 import logging
+import operator
 from packaging.version import Version
 import warnings
 
-import dask.array as da
-import h5py
 import numpy as np
 
-from rsciio.utils.tools import ensure_unicode
+from rsciio.utils.array import get_aligned_chunks, get_data_placeholder
+from rsciio.utils.tools import ensure_unicode, deferred_import
+
+
+da = deferred_import("dask.array")
+h5py = deferred_import("h5py")
 
 
 version = "3.3"
@@ -35,6 +41,20 @@ default_version = Version(version)
 
 not_valid_format = "The file is not a valid HyperSpy hdf5 file"
 
+# The chunks of compressed datasets are made larger by this typical
+# compression ratio so that their size on disk stays close to the target size
+_COMPRESSION_RATIO = 2
+# Minimum size of the chunks when each chunk is stored in a separate file, to
+# limit the overhead of opening the files
+_MIN_FILE_CHUNK_SIZE = 2**22
+# Minimum size of the chunks of datasets written incrementally
+_MIN_APPEND_CHUNK_SIZE = 2**16
+# The navigation sum of the summary is binned until all the navigation axes
+# are smaller than this size
+_SUMMARY_MIN_SIZE = 64
+
+ACCESS_PATTERNS = ("signal", "navigation", "balanced")
+
 _logger = logging.getLogger(__name__)
 
 
@@ -106,6 +126,385 @@ def get_signal_chunks(shape, dtype, signal_axes=None, target_size=1e6):
         return tuple(int(x) for x in chunks)
 
 
+def _stores_chunks_in_files(store):
+    """Return True if the chunks of the zarr store are stored in separate files."""
+    if store is None:
+        return False
+    import zarr
+
+    return isinstance(store, (zarr.storage.DirectoryStore, zarr.storage.FSStore))
+
+
+def _get_balanced_chunks(shape, typesize, target_size):
+    """Chunks spanning the same fraction of every axis."""
+    chunks = list(shape)
+    free_axes = list(range(len(shape)))
+    iterate = True
+    while iterate and free_axes:
+        iterate = False
+        # size of the chunk along the axes whose chunk size is fixed to 1
+        fixed_size = typesize * np.prod(
+            [chunks[i] for i in range(len(shape)) if i not in free_axes]
+        )
+        free_size = np.prod([shape[i] for i in free_axes]) * fixed_size
+        if free_size <= target_size:
+            break
+        fraction = (target_size / free_size) ** (1 / len(free_axes))
+        for i in list(free_axes):
+            chunks[i] = int(shape[i] * fraction)
+            if chunks[i] < 1:
+                # the axis is too small, the other axes are chunked more coarsely
+                chunks[i] = 1
+                free_axes.remove(i)
+                iterate = True
+    return tuple(int(c) for c in chunks)
+
+
+def plan_chunks(
+    shape,
+    dtype,
+    signal_axes=None,
+    access_pattern="signal",
+    target_size=1e6,
+    compressor=None,
+    store=None,
+):
+    """
+    Function that calculates the chunks of a dataset for the way it is most
+    often read.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of the dataset to be stored / chunked.
+    dtype : {dtype, string}
+        The numpy dtype of the data.
+    signal_axes : {None, iterable of ints}
+        The axes defining "signal space" of the dataset. If None, the chunks
+        are ``"balanced"``, whatever the value of ``access_pattern``.
+    access_pattern : {"signal", "navigation", "balanced"}
+        The access pattern to optimise the chunks for:
+
+        - ``"signal"``: reading the signals of a few navigation positions,
+          for example to extract spectra. The chunks contain entire signals,
+          as with :py:func:`get_signal_chunks`.
+        - ``"navigation"``: reading a part of the signal space at every
+          navigation position, for example to compute virtual images. The
+          chunks contain the entire navigation space.
+        - ``"balanced"``: alternating between both. The chunks span the same
+          fraction of every axis.
+    target_size : int
+        The target number of bytes for one chunk, before compression.
+    compressor : object or None
+        The compression of the dataset, for example the ``compression``
+        argument of h5py or the ``compressor`` of zarr. Compressed chunks
+        are made larger since their size on disk is smaller.
+    store : object or None
+        The zarr store of the dataset. When the chunks are stored in separate
+        files, for example in a :py:class:`zarr.storage.DirectoryStore`, they
+        are at least 4 MiB to limit the overhead of opening the files.
+
+    Returns
+    -------
+    tuple of int
+        The chunks of the dataset.
+    """
+    if access_pattern not in ACCESS_PATTERNS:
+        raise ValueError(
+            f"`access_pattern` must be one of {ACCESS_PATTERNS}, "
+            f"not '{access_pattern}'."
+        )
+    if compressor is not None and compressor is not False:
+        target_size *= _COMPRESSION_RATIO
+    if _stores_chunks_in_files(store):
+        target_size = max(target_size, _MIN_FILE_CHUNK_SIZE)
+
+    if signal_axes is None or access_pattern == "balanced":
+        return _get_balanced_chunks(shape, np.dtype(dtype).itemsize, target_size)
+    elif access_pattern == "signal":
+        return get_signal_chunks(shape, dtype, signal_axes, target_size)
+    else:
+        # entire navigation space, the signal space is chunked
+        navigation_axes = [i for i in range(len(shape)) if i not in signal_axes]
+        return get_signal_chunks(shape, dtype, navigation_axes, target_size)
+
+
+def _get_ragged_chunks(data, signal_axes=None, target_size=1e6, sample_size=1000):
+    """
+    Function that calculates chunks for a ragged array, using the average size
+    of a sample of its arrays as the size of an element in
+    :py:func:`get_signal_chunks`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The object array of the arrays to be stored.
+    signal_axes : {None, iterable of ints}
+        The axes defining "signal space" of the dataset, see
+        :py:func:`get_signal_chunks`.
+    target_size : int
+        The target number of bytes for one chunk.
+    sample_size : int
+        The maximum number of arrays used to estimate the average size.
+    """
+    flat_data = data.ravel()
+    indices = np.linspace(0, flat_data.size - 1, min(sample_size, flat_data.size))
+    itemsize = np.mean([np.asarray(flat_data[i]).nbytes for i in indices.astype(int)])
+    dtype = np.dtype((np.void, max(int(itemsize), 1)))
+    return get_signal_chunks(data.shape, dtype, signal_axes, target_size)
+
+
+def _get_ragged_dtype(data):
+    """Return the dtype of the arrays of a ragged array, from its first array."""
+    first = data[(0,) * data.ndim]
+    if isinstance(first, da.Array):
+        first = first.compute()
+    return np.asarray(first).dtype
+
+
+def _flatten_ragged(data):
+    """
+    Return the flattened arrays and the shapes of the arrays of a ragged array,
+    as object arrays to be written in variable length datasets.
+
+    The arrays are python objects, so they are flattened and their shapes
+    collected one by one; ``OverwriteRaggedDataset.time_flatten_ragged`` in
+    the benchmarks measures the cost of this loop.
+    """
+    flat_data = np.frompyfunc(operator.methodcaller("ravel"), 1, 1)(data)
+    shapes = [array.shape for array in data.flat]
+    try:
+        shapes = np.array(shapes, dtype=np.int64)
+    except ValueError:
+        # the arrays don't have the same number of dimensions
+        shapes = [np.array(shape, dtype=np.int64) for shape in shapes]
+    # the trailing None prevents numpy from stacking the shapes in a 2D array
+    shapes = np.array(list(shapes) + [None], dtype=object)[:-1]
+    return flat_data, shapes.reshape(data.shape)
+
+
+def _iter_chunk_regions(shape, chunks):
+    """Iterate over the regions of an array covered by each of its chunks."""
+    offsets = itertools.product(*[range(0, s, c) for s, c in zip(shape, chunks)])
+    for offset in offsets:
+        yield tuple(slice(o, min(o + c, s)) for o, c, s in zip(offset, chunks, shape))
+
+
+def _reshape_ragged(data, shapes):
+    """
+    Reshape the flattened arrays of a ragged array read from a variable length
+    dataset.
+
+    The shapes are converted to tuples at once when they have the same length,
+    but the arrays are python objects and are reshaped one by one in a loop
+    over the flattened array, which avoids the overhead of ``np.ndindex``.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Object array of the flattened arrays.
+    shapes : numpy.ndarray
+        Object array of the shapes of the arrays, with the same shape as
+        ``data``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Object array of the reshaped arrays.
+    """
+    new_data = np.empty(data.shape, dtype=object)
+    shapes = shapes.ravel()
+    try:
+        # convert all the shapes at once when they have the same length
+        shapes = np.stack(shapes).tolist()
+    except ValueError:
+        shapes = [tuple(shape) for shape in shapes]
+    flat_data = new_data.reshape(-1)
+    for i, (array, shape) in enumerate(zip(data.flat, shapes)):
+        flat_data[i] = array.reshape(shape)
+    return new_data
+
+
+def _get_hyperslab(axes, navigation_slice=None, signal_slice=None):
+    """
+    Return the tuple of slices selecting ``navigation_slice`` along the
+    navigation axes and ``signal_slice`` along the signal axes, in array
+    order, with positive steps.
+    """
+    if any("navigate" not in axis for axis in axes):
+        raise ValueError(
+            "The navigation and signal axes are not defined in files saved "
+            "with a hspy format version < 2.1."
+        )
+    region = [slice(None)] * len(axes)
+    for navigate, slices in ((True, navigation_slice), (False, signal_slice)):
+        if slices is None:
+            continue
+        if isinstance(slices, slice):
+            slices = (slices,)
+        indices = [i for i, axis in enumerate(axes) if axis["navigate"] == navigate]
+        space = "navigation" if navigate else "signal"
+        if len(slices) > len(indices):
+            raise ValueError(
+                f"{len(slices)} slices are given for the {len(indices)} "
+                f"{space} axes."
+            )
+        for i, slice_ in zip(indices, slices):
+            if not isinstance(slice_, slice):
+                raise TypeError(
+                    f"The {space} slice must be a slice or a tuple of slices."
+                )
+            start, stop, step = slice_.indices(axes[i]["size"])
+            if step < 1:
+                raise ValueError("Only positive steps are supported.")
+            region[i] = slice(start, max(start, stop), step)
+    return tuple(region)
+
+
+def _slice_axis(axis, slice_):
+    """Return the axis dictionary of the part of the axis selected by ``slice_``."""
+    if slice_ == slice(None):
+        return axis
+    if axis.get("_type") == "FunctionalDataAxis":
+        raise ValueError("Slicing functional axes is not supported.")
+    axis = dict(axis)
+    size = len(range(slice_.start, slice_.stop, slice_.step))
+    if "axis" in axis:
+        # non-uniform axis
+        axis["axis"] = axis["axis"][slice_]
+    else:
+        axis["offset"] = axis["offset"] + slice_.start * axis["scale"]
+        axis["scale"] = axis["scale"] * slice_.step
+    axis["size"] = size
+    return axis
+
+
+def _bin_sum(data, factors):
+    """Sum ``data`` over bins of ``factors`` elements, dropping the remainder."""
+    data = data[tuple(slice(0, s - s % f) for s, f in zip(data.shape, factors))]
+    shape = tuple(itertools.chain(*((s // f, f) for s, f in zip(data.shape, factors))))
+    return data.reshape(shape).sum(axis=tuple(range(1, len(shape), 2)))
+
+
+def _get_summary_arrays(data, signal_axes):
+    """
+    Return the pyramid of the sums of ``data`` over the signal axes, binned by
+    2, 4, 8... along the navigation axes, and the mean of ``data`` over the
+    navigation axes. The arrays are lazy if ``data`` is a dask array.
+    """
+    navigation_axes = tuple(i for i in range(data.ndim) if i not in signal_axes)
+    navigation_sum = data.sum(axis=tuple(signal_axes))
+    pyramid = [navigation_sum]
+    while navigation_sum.ndim and max(navigation_sum.shape) > _SUMMARY_MIN_SIZE:
+        factors = [2 if s > 1 else 1 for s in navigation_sum.shape]
+        navigation_sum = _bin_sum(navigation_sum, factors)
+        pyramid.append(navigation_sum)
+    return pyramid, data.mean(axis=navigation_axes)
+
+
+def require_signal_group(file, signal, file_format):
+    """
+    Write the file format attributes of the root group of a file and return
+    the group of the ``Experiments`` group where the signal is written, named
+    after its title.
+    """
+    file.attrs["file_format"] = file_format
+    file.attrs["file_format_version"] = version
+    exps = file.require_group("Experiments")
+    title = signal["metadata"]["General"]["title"]
+    group_name = title if title else "__unnamed__"
+    # / is a invalid character, see https://github.com/hyperspy/hyperspy/issues/942
+    if "/" in group_name:
+        group_name = group_name.replace("/", "-")
+    return exps.require_group(group_name)
+
+
+class LazyGroupDict(MutableMapping):
+    """
+    Dictionary of a group of a hierarchical file, whose subgroups and
+    datasets are read only when they are accessed. The subgroups are
+    also returned as :py:class:`LazyGroupDict`.
+
+    The file must stay open until the items are read. Use :py:meth:`to_dict`
+    to read all the items and convert the group to nested dictionaries.
+    """
+
+    def __init__(self, reader, group, lazy=False):
+        self._reader = reader
+        self._group = group
+        self._lazy = lazy
+        # the attributes and the items already read
+        self._dict = None
+        # the dictionary keys and group keys of the items not read yet
+        self._unread = None
+
+    def _read_keys(self):
+        if self._dict is not None:
+            return
+        self._dict = self._reader._attrs2dict(self._group, {})
+        self._unread = {}
+        if not isinstance(self._group, self._reader.Dataset):
+            for key in self._group.keys():
+                dict_key = self._reader._get_item_key(key, self._group[key])
+                if dict_key is not None:
+                    self._unread[dict_key] = key
+
+    def __getitem__(self, key):
+        self._read_keys()
+        if key in self._unread:
+            group_key = self._unread.pop(key)
+            self._dict[key] = self._reader._read_item(
+                self._group,
+                group_key,
+                self._group[group_key],
+                lazy=self._lazy,
+                lazy_metadata=True,
+            )
+        return self._dict[key]
+
+    def __setitem__(self, key, value):
+        self._read_keys()
+        self._unread.pop(key, None)
+        self._dict[key] = value
+
+    def __delitem__(self, key):
+        self._read_keys()
+        if key not in self._dict and key not in self._unread:
+            raise KeyError(key)
+        self._dict.pop(key, None)
+        self._unread.pop(key, None)
+
+    def __iter__(self):
+        self._read_keys()
+        # same order as the dictionary returned by `_group2dict`
+        yield from list(self._dict)
+        yield from [key for key in self._unread if key not in self._dict]
+
+    def __len__(self):
+        self._read_keys()
+        return len(self._dict.keys() | self._unread.keys())
+
+    def __contains__(self, key):
+        self._read_keys()
+        return key in self._dict or key in self._unread
+
+    def __repr__(self):
+        return f"<LazyGroupDict of '{self._group.name}', {len(self)} items>"
+
+    def to_dict(self):
+        """
+        Read all the items and return the group as nested dictionaries.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            key: value.to_dict() if isinstance(value, LazyGroupDict) else value
+            for key, value in self.items()
+        }
+
+
 class HierarchicalReader:
     """A generic Reader class for reading data from hierarchical file types."""
 
@@ -153,7 +552,15 @@ class HierarchicalReader:
 
         return Version(version)
 
-    def read(self, lazy):
+    def read(
+        self,
+        lazy,
+        metadata_only=False,
+        lazy_metadata=False,
+        navigation_slice=None,
+        signal_slice=None,
+        chunks=None,
+    ):
         """
         Read all data, metadata, models.
 
@@ -161,6 +568,18 @@ class HierarchicalReader:
         ----------
         lazy : bool
             Return data as lazy signal.
+        metadata_only : bool, default=False
+            Don't read the data of the signals and use placeholders instead.
+        lazy_metadata : bool, default=False
+            Return the original metadata, the learning results and the models
+            as :py:class:`LazyGroupDict`, which are read on access. Requires
+            ``lazy=True``, for which the file is kept open.
+        navigation_slice, signal_slice : slice, tuple of slice or None
+            Read only the part of the data of the signals selected by these
+            slices, see :py:meth:`group2signaldict`.
+        chunks : None, tuple, dict or str
+            The chunks of the data of the signals when ``lazy=True``, see
+            :py:meth:`group2signaldict`.
 
         Raises
         ------
@@ -183,12 +602,20 @@ class HierarchicalReader:
                     if "_signal" in m_gr[model_name].attrs:
                         key = m_gr[model_name].attrs["_signal"]
                         # del m_gr[model_name].attrs['_signal']
-                        res = self._group2dict(m_gr[model_name], lazy=lazy)
+                        res = self._group2dict(
+                            m_gr[model_name], lazy=lazy, lazy_metadata=lazy_metadata
+                        )
                         del res["_signal"]
                         models_with_signals.append((key, {model_name: res}))
                     else:
                         standalone_models.append(
-                            {model_name: self._group2dict(m_gr[model_name], lazy=lazy)}
+                            {
+                                model_name: self._group2dict(
+                                    m_gr[model_name],
+                                    lazy=lazy,
+                                    lazy_metadata=lazy_metadata,
+                                )
+                            }
                         )
             except TypeError:
                 raise IOError(not_valid_format)
@@ -204,7 +631,15 @@ class HierarchicalReader:
             # Parse the file
             for experiment in experiments:
                 exg = self.file["Experiments"][experiment]
-                exp = self.group2signaldict(exg, lazy)
+                exp = self.group2signaldict(
+                    exg,
+                    lazy,
+                    metadata_only=metadata_only,
+                    lazy_metadata=lazy_metadata,
+                    navigation_slice=navigation_slice,
+                    signal_slice=signal_slice,
+                    chunks=chunks,
+                )
                 # assign correct models, if found:
                 _tmp = {}
                 for key, _dict in reversed(models_with_signals):
@@ -226,12 +661,42 @@ class HierarchicalReader:
         return exp_dict_list
 
     @staticmethod
-    def _read_array(group, dataset_key):
+    def _get_dask_array(dataset, chunks=None):
+        """
+        Return a dask array reading ``dataset``. If ``chunks`` is ``None`` or
+        a string, the chunks are aligned on the chunks of the dataset, see
+        :py:func:`rsciio.utils.array.get_aligned_chunks`. The readers can
+        reopen the dataset to read it, ``dataset`` must not be used
+        afterwards, see :py:meth:`_read_array`.
+        """
+        if chunks is None:
+            chunks = dataset.chunks or "auto"
+        if isinstance(chunks, str) and dataset.chunks is not None:
+            chunks = get_aligned_chunks(
+                chunks, dataset.shape, dataset.dtype, dataset.chunks
+            )
+        return da.from_array(dataset, chunks=chunks)
+
+    @classmethod
+    def _read_array(cls, group, dataset_key, lazy=False, region=None, chunks=None):
+        """
+        Read the dataset ``dataset_key`` of ``group``, as a dask array if
+        ``lazy=True``.
+
+        With ``lazy=True``, the dask array may read a dataset reopened by
+        :py:meth:`_get_dask_array`, for example with a chunk cache sized for
+        ``chunks``, and the handle of the dataset read from ``group`` by this
+        method is then closed. It is only done when no other handle of the
+        dataset is open, so that the handles obtained from
+        ``group[dataset_key]`` by the caller stay valid.
+        """
         # This is a workaround for the lack of support for n-d ragged array
         # in h5py and zarr. There is work in progress for implementation in zarr:
         # https://github.com/zarr-developers/zarr-specs/issues/62 which may be
         # relevant to implement here when available
         data = group[dataset_key]
+        if region is None:
+            region = (slice(None),) * len(data.shape)
         key = f"_ragged_shapes_{dataset_key}"
         if "ragged_shapes" in group:
             # For file saved with rosettaSciIO <= 0.1
@@ -239,19 +704,130 @@ class HierarchicalReader:
             key = "ragged_shapes"
         if key in group:
             ragged_shape = group[key]
-            # if the data is chunked saved array we must first
-            # cast to a numpy array to avoid multiple calls to
-            # _decode_chunk in zarr (or h5py)
-            ragged_shape = np.array(ragged_shape)
-            new_data = np.empty(shape=data.shape, dtype=object)
-            # cast to numpy array to stop multiple calls to _decode_chunk in zarr
-            data = np.array(data)
-            for i in np.ndindex(data.shape):
-                new_data[i] = np.reshape(data[i], ragged_shape[i])
-            data = new_data
+            if lazy:
+                # the arrays are reshaped block by block when computed so that
+                # only the chunks of the requested region are decoded
+                ragged_chunks = data.chunks or data.shape
+                data = da.map_blocks(
+                    _reshape_ragged,
+                    da.from_array(data, chunks=ragged_chunks)[region],
+                    da.from_array(ragged_shape, chunks=ragged_chunks)[region],
+                    dtype=object,
+                    meta=np.empty((0,) * data.ndim, dtype=object),
+                )
+            else:
+                # if the data is chunked saved array we must first
+                # cast to a numpy array to avoid multiple calls to
+                # _decode_chunk in zarr (or h5py)
+                data = _reshape_ragged(
+                    np.array(data[region]), np.array(ragged_shape[region])
+                )
+        elif lazy:
+            # only the chunks overlapping the region are read when computed
+            data = cls._get_dask_array(data, chunks)[region]
+        elif region != (slice(None),) * len(data.shape):
+            # read the hyperslab only
+            data = data[region]
         return data
 
-    def group2signaldict(self, group, lazy=False):
+    @staticmethod
+    def _read_summary(group):
+        """
+        Read the summary written with ``write_summary=True``, which is small
+        and always read in memory.
+        """
+        levels = sorted(
+            (int(key.split("_")[-1]), key)
+            for key in group.keys()
+            if key.startswith("navigation_sum_")
+        )
+        return {
+            "navigation_sum": [np.asarray(group[key][...]) for _, key in levels],
+            "signal_mean": np.asarray(group["signal_mean"][...]),
+        }
+
+    def _read_axes(self, group, lazy=False):
+        """Read the list of the axes dictionaries of a signal group."""
+        ndim = len(group["data"].shape)
+        axes = []
+        for i in range(ndim):
+            try:
+                axes.append(self._group2dict(group[f"axis-{i}"]))
+                axis = axes[-1]
+                for key, item in axis.items():
+                    if isinstance(item, np.bool_):
+                        axis[key] = bool(item)
+                    else:
+                        axis[key] = ensure_unicode(item)
+            except KeyError:
+                break
+        if len(axes) != ndim:  # broke from the previous loop
+            try:
+                axes = [
+                    i
+                    for k, i in sorted(
+                        iter(
+                            self._group2dict(
+                                group["_list_" + str(ndim) + "_axes"],
+                                lazy=lazy,
+                            ).items()
+                        )
+                    )
+                ]
+            except KeyError:
+                raise IOError(not_valid_format)
+        return axes
+
+    def _read_data(
+        self,
+        group,
+        axes,
+        lazy=False,
+        metadata_only=False,
+        navigation_slice=None,
+        signal_slice=None,
+        chunks=None,
+    ):
+        """
+        Read the data of a signal group, see :py:meth:`group2signaldict`.
+
+        Returns
+        -------
+        tuple
+            The list of the axes dictionaries adjusted to the region selected
+            by ``navigation_slice`` and ``signal_slice``, and the data.
+        """
+        region = None
+        if navigation_slice is not None or signal_slice is not None:
+            region = _get_hyperslab(axes, navigation_slice, signal_slice)
+            axes = [_slice_axis(axis, slice_) for axis, slice_ in zip(axes, region)]
+
+        if metadata_only:
+            # ragged arrays are stored as variable length arrays, which are
+            # read as object arrays
+            data = group["data"]
+            shape = data.shape
+            if region is not None:
+                shape = np.broadcast_to(0, shape)[region].shape
+            data = get_data_placeholder(shape, data.dtype)
+        elif lazy:
+            data = self._read_array(
+                group, "data", lazy=True, region=region, chunks=chunks
+            )
+        else:
+            data = np.asanyarray(self._read_array(group, "data", region=region))
+        return axes, data
+
+    def group2signaldict(
+        self,
+        group,
+        lazy=False,
+        metadata_only=False,
+        lazy_metadata=False,
+        navigation_slice=None,
+        signal_slice=None,
+        chunks=None,
+    ):
         """
         Reads a h5py/zarr group and returns a signal dictionary.
 
@@ -261,6 +837,22 @@ class HierarchicalReader:
             A group following hspy specification.
         lazy : bool, optional
             Return the data as dask array. The default is False.
+        metadata_only : bool, optional
+            Don't read the data and use a placeholder with the shape and dtype
+            of the data instead. The default is False.
+        lazy_metadata : bool, optional
+            Return the original metadata and the learning results as
+            :py:class:`LazyGroupDict`. The default is False.
+        navigation_slice, signal_slice : slice, tuple of slice or None, optional
+            Read only the part of the data selected by these slices along
+            the navigation and signal axes, in array order. The offset,
+            scale and size of the axes are adjusted. The default is None.
+        chunks : None, tuple, dict or str, optional
+            The chunks of the dask array when ``lazy=True``. If None, the
+            chunks of the dataset are used. A string, such as ``"auto"``, is
+            passed to :py:func:`dask.array.from_array` and the chunks are
+            rounded to multiples of the chunks of the dataset. The default
+            is None.
 
         Raises
         ------
@@ -278,7 +870,9 @@ class HierarchicalReader:
 
         exp = {
             "metadata": self._group2dict(group[metadata], lazy=lazy),
-            "original_metadata": self._group2dict(group[original_metadata], lazy=lazy),
+            "original_metadata": self._group2dict(
+                group[original_metadata], lazy=lazy, lazy_metadata=lazy_metadata
+            ),
         }
         if "attributes" in group:
             # RosettaSciIO version is > 0.1
@@ -296,49 +890,26 @@ class HierarchicalReader:
             exp["package"] = ""
             exp["package_version"] = ""
 
-        data = self._read_array(group, "data")
-        if lazy:
-            data = da.from_array(data, chunks=data.chunks)
-            exp["attributes"]["_lazy"] = True
-        else:
-            data = np.asanyarray(data)
-            exp["attributes"]["_lazy"] = False
-        exp["data"] = data
-        axes = []
-        for i in range(len(exp["data"].shape)):
-            try:
-                axes.append(self._group2dict(group[f"axis-{i}"]))
-                axis = axes[-1]
-                for key, item in axis.items():
-                    if isinstance(item, np.bool_):
-                        axis[key] = bool(item)
-                    else:
-                        axis[key] = ensure_unicode(item)
-            except KeyError:
-                break
-        if len(axes) != len(exp["data"].shape):  # broke from the previous loop
-            try:
-                axes = [
-                    i
-                    for k, i in sorted(
-                        iter(
-                            self._group2dict(
-                                group["_list_" + str(len(exp["data"].shape)) + "_axes"],
-                                lazy=lazy,
-                            ).items()
-                        )
-                    )
-                ]
-            except KeyError:
-                raise IOError(not_valid_format)
-        exp["axes"] = axes
+        axes = self._read_axes(group, lazy=lazy)
+        exp["axes"], exp["data"] = self._read_data(
+            group,
+            axes,
+            lazy=lazy,
+            metadata_only=metadata_only,
+            navigation_slice=navigation_slice,
+            signal_slice=signal_slice,
+            chunks=chunks,
+        )
+        exp["attributes"]["_lazy"] = lazy and not metadata_only
+        if "_summary" in group:
+            exp["summary"] = self._read_summary(group["_summary"])
         if "learning_results" in group.keys():
             exp["attributes"]["learning_results"] = self._group2dict(
-                group["learning_results"], lazy=lazy
+                group["learning_results"], lazy=lazy, lazy_metadata=lazy_metadata
             )
         if "peak_learning_results" in group.keys():
             exp["attributes"]["peak_learning_results"] = self._group2dict(
-                group["peak_learning_results"], lazy=lazy
+                group["peak_learning_results"], lazy=lazy, lazy_metadata=lazy_metadata
             )
 
         # If the title was not defined on writing the Experiment is
@@ -353,11 +924,11 @@ class HierarchicalReader:
             # mva_results
             if "mva_results" in group.keys():
                 exp["attributes"]["learning_results"] = self._group2dict(
-                    group["mva_results"], lazy=lazy
+                    group["mva_results"], lazy=lazy, lazy_metadata=lazy_metadata
                 )
             if "peak_mva_results" in group.keys():
                 exp["attributes"]["peak_learning_results"] = self._group2dict(
-                    group["peak_mva_results"], lazy=lazy
+                    group["peak_mva_results"], lazy=lazy, lazy_metadata=lazy_metadata
                 )
             # Replace the old signal and name keys with their current names
             if "signal" in exp["metadata"]:
@@ -496,9 +1067,24 @@ class HierarchicalReader:
 
         return exp
 
-    def _group2dict(self, group, dictionary=None, lazy=False):
+    def _group2dict(self, group, dictionary=None, lazy=False, lazy_metadata=False):
+        if lazy_metadata:
+            return LazyGroupDict(self, group, lazy=lazy)
         if dictionary is None:
             dictionary = {}
+        self._attrs2dict(group, dictionary)
+        if not isinstance(group, self.Dataset):
+            for key in group.keys():
+                item = group[key]
+                dict_key = self._get_item_key(key, item)
+                if dict_key is not None:
+                    dictionary[dict_key] = self._read_item(group, key, item, lazy=lazy)
+
+        return dictionary
+
+    @staticmethod
+    def _attrs2dict(group, dictionary):
+        """Add the attributes of a group to a dictionary."""
         for key, value in group.attrs.items():
             if isinstance(value, bytes):
                 value = value.decode()
@@ -535,69 +1121,74 @@ class HierarchicalReader:
                 dictionary[key.replace("_datetime_", "")] = date_iso
             else:
                 dictionary[key] = value
-        if not isinstance(group, self.Dataset):
-            for key in group.keys():
-                if key.startswith("_ragged_shapes_"):
-                    # array used to parse ragged array, need to skip it
-                    # otherwise, it will wrongly read kwargs when reading
-                    # variable length markers as they uses ragged arrays
-                    pass
-                elif key.startswith("_sig_"):
-                    dictionary[key] = self.group2signaldict(group[key])
-                elif isinstance(group[key], self.Dataset):
-                    dat = self._read_array(group, key)
-                    kn = key
-                    if key.startswith("_list_"):
-                        ans = self._parse_iterable(dat)
-                        ans = ans.tolist()
-                        kn = key[6:]
-                    elif key.startswith("_tuple_"):
-                        ans = self._parse_iterable(dat)
-                        ans = tuple(ans.tolist())
-                        kn = key[7:]
-                    elif dat.dtype.char == "S":
-                        ans = np.array(dat)
-                        try:
-                            ans = ans.astype("U")
-                        except UnicodeDecodeError:
-                            # There are some strings that must stay in binary,
-                            # for example dill pickles. This will obviously also
-                            # let "wrong" binary string fail somewhere else...
-                            pass
-                    elif lazy:
-                        ans = da.from_array(dat, chunks=dat.chunks)
-                    else:
-                        ans = np.array(dat)
-                    dictionary[kn] = ans
-                elif key.startswith("_hspy_AxesManager_"):
-                    dictionary[key] = [
-                        i
-                        for k, i in sorted(
-                            iter(self._group2dict(group[key], lazy=lazy).items())
-                        )
-                    ]
-                elif key.startswith("_list_"):
-                    dictionary[key[7 + key[6:].find("_") :]] = [
-                        i
-                        for k, i in sorted(
-                            iter(self._group2dict(group[key], lazy=lazy).items())
-                        )
-                    ]
-                elif key.startswith("_tuple_"):
-                    dictionary[key[8 + key[7:].find("_") :]] = tuple(
-                        [
-                            i
-                            for k, i in sorted(
-                                iter(self._group2dict(group[key], lazy=lazy).items())
-                            )
-                        ]
-                    )
-                else:
-                    dictionary[key] = {}
-                    self._group2dict(group[key], dictionary[key], lazy=lazy)
-
         return dictionary
 
+    def _get_item_key(self, key, item):
+        """
+        Return the key in the dictionary of the item ``key`` of a group, or
+        None if the item is not added to the dictionary.
+        """
+        if key.startswith("_ragged_shapes_"):
+            # array used to parse ragged array, need to skip it
+            # otherwise, it will wrongly read kwargs when reading
+            # variable length markers as they uses ragged arrays
+            return None
+        elif key.startswith("_sig_"):
+            return key
+        elif isinstance(item, self.Dataset):
+            if key.startswith("_list_"):
+                return key[6:]
+            elif key.startswith("_tuple_"):
+                return key[7:]
+            return key
+        elif key.startswith("_hspy_AxesManager_"):
+            return key
+        elif key.startswith("_list_"):
+            return key[7 + key[6:].find("_") :]
+        elif key.startswith("_tuple_"):
+            return key[8 + key[7:].find("_") :]
+        return key
+
+    def _read_item(self, group, key, item, lazy=False, lazy_metadata=False):
+        """Read the item ``key`` of a group, see :py:meth:`_get_item_key`."""
+        if key.startswith("_sig_"):
+            return self.group2signaldict(item)
+        elif isinstance(item, self.Dataset):
+            if (
+                lazy
+                and item.dtype.char != "S"
+                and not key.startswith(("_list_", "_tuple_"))
+            ):
+                return self._read_array(group, key, lazy=True)
+            dat = self._read_array(group, key)
+            if key.startswith("_list_"):
+                ans = self._parse_iterable(dat)
+                ans = ans.tolist()
+            elif key.startswith("_tuple_"):
+                ans = self._parse_iterable(dat)
+                ans = tuple(ans.tolist())
+            elif dat.dtype.char == "S":
+                ans = np.array(dat)
+                try:
+                    ans = ans.astype("U")
+                except UnicodeDecodeError:
+                    # There are some strings that must stay in binary,
+                    # for example dill pickles. This will obviously also
+                    # let "wrong" binary string fail somewhere else...
+                    pass
+            else:
+                ans = np.array(dat)
+            return ans
+        elif key.startswith(("_hspy_AxesManager_", "_list_")):
+            return [
+                i for k, i in sorted(iter(self._group2dict(item, lazy=lazy).items()))
+            ]
+        elif key.startswith("_tuple_"):
+            return tuple(
+                [i for k, i in sorted(iter(self._group2dict(item, lazy=lazy).items()))]
+            )
+        return self._group2dict(item, lazy=lazy, lazy_metadata=lazy_metadata)
+
     @staticmethod
     def _parse_iterable(data):
         if h5py.check_string_dtype(data.dtype) and hasattr(data, "asstr"):
@@ -636,6 +1227,8 @@ class HierarchicalWriter:
         self.Group = None
         self.unicode_kwds = None
         self.ragged_kwds = None
+        # keyword arguments passed to `_store_data` when writing the signal data
+        self.store_kwds = {}
         self.kwds = kwds
 
     @staticmethod
@@ -646,8 +1239,22 @@ class HierarchicalWriter:
     def _store_data(*arg):  # pragma: no cover
         raise NotImplementedError("This method must be implemented by subclasses.")
 
+    @staticmethod
+    def _write_region(data, dset, region):  # pragma: no cover
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
     @classmethod
-    def overwrite_dataset(cls, group, data, key, signal_axes=None, chunks=None, **kwds):
+    def overwrite_dataset(
+        cls,
+        group,
+        data,
+        key,
+        signal_axes=None,
+        chunks=None,
+        store_kwds=None,
+        access_pattern=None,
+        **kwds,
+    ):
         """
         Overwrites a dataset into a hierarchical structure following the h5py
         API.
@@ -666,16 +1273,39 @@ class HierarchicalWriter:
             The chunks for the dataset. If ``None`` and saving lazy signal,
             the chunks of the dask array will be used otherwise the chunks
             will be determined by the
-            :py:func:`~.io_plugins._hierarchical.get_signal_chunks` function.
+            :py:func:`~.io_plugins._hierarchical.get_signal_chunks` function,
+            using the average size of the arrays for ragged arrays.
+        store_kwds : dict, None
+            Additional keywords passed to the ``_store_data`` method of the
+            writer, for example ``compression_workers`` for the hspy writer.
+        access_pattern : {None, "signal", "navigation", "balanced"}
+            If not ``None`` and ``chunks`` is ``None``, the chunks are
+            calculated for this access pattern, the compression and the store
+            of the dataset by the :py:func:`plan_chunks` function, also for
+            lazy dataset.
         kwds : dict
             Any additional keywords for to be passed to the
             :py:meth:`h5py.Group.require_dataset` or
             :py:meth:`zarr.hierarchy.Group.require_dataset` method.
         """
         if chunks is None:
-            if isinstance(data, da.Array):
+            if access_pattern is not None and data.dtype != np.dtype("O"):
+                chunks = plan_chunks(
+                    data.shape,
+                    data.dtype,
+                    signal_axes,
+                    access_pattern,
+                    cls.target_size,
+                    compressor=kwds.get("compression", kwds.get("compressor")),
+                    store=getattr(group, "store", None),
+                )
+            elif isinstance(data, da.Array):
                 # For lazy dataset, by default, we use the current dask chunking
                 chunks = tuple([c[0] for c in data.chunks])
+            elif data.dtype == np.dtype("O"):
+                # The size of the arrays of a ragged array is estimated from
+                # a sample to find the number of arrays per chunk
+                chunks = _get_ragged_chunks(data, signal_axes, cls.target_size)
             else:
                 # If signal_axes=None, use automatic h5py chunking, otherwise
                 # optimise the chunking to contain at least one signal per chunk
@@ -687,7 +1317,8 @@ class HierarchicalWriter:
             data = data.astype(np.dtype("S"))
 
         if data.dtype == np.dtype("O"):
-            dset = cls._get_object_dset(group, data, key, chunks, **kwds)
+            dtype = _get_ragged_dtype(data)
+            dset = cls._get_object_dset(group, data, key, chunks, dtype, **kwds)
         else:
             got_data = False
             while not got_data:
@@ -713,25 +1344,42 @@ class HierarchicalWriter:
 
         _logger.info(f"Chunks used for saving: {chunks}")
         if data.dtype == np.dtype("O"):
-            new_data = np.empty(shape=data.shape, dtype=object)
-            shapes = np.empty(shape=data.shape, dtype=object)
-            for i in np.ndindex(data.shape):
-                new_data[i] = data[i].ravel()
-                shapes[i] = np.array(data[i].shape)
-            shape_dset = cls._get_object_dset(
-                group, shapes, f"_ragged_shapes_{key}", shapes.shape, **kwds
-            )
-            cls._store_data(
-                shapes, shape_dset, group, f"_ragged_shapes_{key}", chunks=shapes.shape
-            )
-            cls._store_data(new_data, dset, group, key, chunks)
+            cls._store_ragged_data(group, data, dset, key, **kwds)
         else:
-            cls._store_data(data, dset, group, key, chunks)
+            cls._store_data(data, dset, group, key, chunks, **(store_kwds or {}))
+
+    @classmethod
+    def _store_ragged_data(cls, group, data, dset, key, **kwds):
+        """
+        Write a ragged array one chunk at a time. The arrays are flattened and
+        their shapes are written in the ``_ragged_shapes_{key}`` dataset, with
+        the same chunks. A lazy array is computed one chunk at a time too.
+        """
+        chunks = dset.chunks or dset.shape
+        shapes_dset = cls._get_object_dset(
+            group, data, f"_ragged_shapes_{key}", chunks, np.int64, **kwds
+        )
+        for region in _iter_chunk_regions(dset.shape, chunks):
+            block = data[region]
+            if isinstance(block, da.Array):
+                block = block.compute()
+            flat_data, shapes = _flatten_ragged(block)
+            cls._write_region(flat_data, dset, region)
+            cls._write_region(shapes, shapes_dset, region)
 
     def write(self):
         self.write_signal(self.signal, self.group, **self.kwds)
 
-    def write_signal(self, signal, group, write_dataset=True, chunks=None, **kwds):
+    def write_signal(
+        self,
+        signal,
+        group,
+        write_dataset=True,
+        chunks=None,
+        access_pattern=None,
+        write_summary=False,
+        **kwds,
+    ):
         "Writes a hyperspy signal to a hdf5 group"
         group.attrs.update(signal["package_info"])
 
@@ -745,33 +1393,49 @@ class HierarchicalWriter:
             coord_group = group.create_group(group_name)
             self.dict2group(axis_dict, coord_group, **kwds)
 
-        mapped_par = group.require_group("metadata")
         metadata_dict = signal["metadata"]
 
+        if not write_dataset and "data" in group:
+            shape = group["data"].shape
+            if shape != signal["data"].shape:
+                raise ValueError(
+                    f"The shape of the data {signal['data'].shape} is different "
+                    f"from the shape of the data in the file {shape}, the "
+                    "dataset must be written."
+                )
         if write_dataset:
+            signal_axes = [
+                idx for idx, axis in enumerate(signal["axes"]) if not axis["navigate"]
+            ]
+            store_kwds = self.store_kwds
+            if "_summary" in group:
+                del group["_summary"]
+            if write_summary:
+                extra_stores = self._write_summary(group, signal["data"], signal_axes)
+                if extra_stores:
+                    store_kwds = dict(store_kwds, extra_stores=extra_stores)
             self.overwrite_dataset(
                 group,
                 signal["data"],
                 "data",
-                signal_axes=[
-                    idx
-                    for idx, axis in enumerate(signal["axes"])
-                    if not axis["navigate"]
-                ],
+                signal_axes=signal_axes,
                 chunks=chunks,
+                store_kwds=store_kwds,
+                access_pattern=access_pattern,
                 **kwds,
             )
 
         if default_version < Version("1.2"):
             metadata_dict["_internal_parameters"] = metadata_dict.pop("_HyperSpy")
 
-        self.dict2group(metadata_dict, mapped_par, **kwds)
-        original_par = group.require_group("original_metadata")
-        self.dict2group(signal["original_metadata"], original_par, **kwds)
-        learning_results = group.require_group("learning_results")
-        self.dict2group(signal["learning_results"], learning_results, **kwds)
-        attributes = group.require_group("attributes")
-        self.dict2group(signal["attributes"], attributes, **kwds)
+        self._rewrite_group(group, "metadata", metadata_dict, **kwds)
+        self._rewrite_group(
+            group, "original_metadata", signal["original_metadata"], **kwds
+        )
+        self._rewrite_group(
+            group, "learning_results", signal["learning_results"], **kwds
+        )
+        self._rewrite_group(group, "attributes", signal["attributes"], **kwds)
 
         if signal["models"]:
             model_group = self.file.require_group("Analysis/models")
@@ -779,9 +1443,62 @@ class HierarchicalWriter:
             for model in model_group.values():
                 model.attrs["_signal"] = group.name
 
+    def _rewrite_group(self, group, name, dictionary, **kwds):
+        """
+        Write ``dictionary`` in the ``name`` subgroup of ``group``, replacing
+        the existing subgroup, if any, so that no item of a previous write is
+        left. The new subgroup is written before the existing one is deleted,
+        because lazy arrays of the dictionary can be read from it.
+        """
+        if name not in group:
+            self.dict2group(dictionary, group.create_group(name), **kwds)
+            return
+        tmp_name = f"_{name}_tmp"
+        if tmp_name in group:
+            # left by an interrupted write
+            del group[tmp_name]
+        self.dict2group(dictionary, group.create_group(tmp_name), **kwds)
+        del group[name]
+        group.move(tmp_name, name)
+
+    @staticmethod
+    def _write_summary(group, data, signal_axes):
+        """
+        Write the summary of the data in the ``_summary`` group: the sums over
+        the signal axes binned along the navigation axes and the mean over
+        the navigation axes. For lazy data, return the list of ``(source,
+        target)`` pairs to compute when storing the data, so that the data
+        is read only once.
+        """
+        if data.dtype.kind not in "biuf":
+            _logger.warning(
+                f"The summary of data with {data.dtype} dtype is not written."
+            )
+            return []
+        pyramid, signal_mean = _get_summary_arrays(data, signal_axes)
+        summary_group = group.require_group("_summary")
+        arrays = {f"navigation_sum_{i}": array for i, array in enumerate(pyramid)}
+        arrays["signal_mean"] = signal_mean
+        extra_stores = []
+        for key, array in arrays.items():
+            dset = summary_group.create_dataset(
+                key, shape=array.shape, dtype=array.dtype
+            )
+            if key.startswith("navigation_sum"):
+                dset.attrs["binning"] = 2 ** int(key.split("_")[-1])
+            if isinstance(array, da.Array):
+                # a single chunk, written at once by a single task
+                extra_stores.append((array.rechunk(-1), dset))
+            else:
+                dset[...] = array
+        return extra_stores
+
     def dict2group(self, dictionary, group, **kwds):
         "Recursive writer of dicts and signals"
 
+        # the attributes of the group are written at once, in a single
+        # operation for zarr instead of rewriting the `.zattrs` file each time
+        attrs = {}
         for key, value in dictionary.items():
             if isinstance(value, dict):
                 self.dict2group(value, group.require_group(key), **kwds)
@@ -789,33 +1506,45 @@ class HierarchicalWriter:
                 self.overwrite_dataset(group, value, key, **kwds)
 
             elif value is None:
-                group.attrs[key] = "_None_"
+                attrs[key] = "_None_"
 
             elif isinstance(value, bytes):
                 try:
                     # binary string if has any null characters (otherwise not
                     # supported by hdf5)
                     value.index(b"\x00")
-                    group.attrs["_bs_" + key] = np.void(value)
+                    attrs["_bs_" + key] = np.void(value)
                 except ValueError:
-                    group.attrs[key] = value.decode()
+                    attrs[key] = value.decode()
 
             elif isinstance(value, str):
-                group.attrs[key] = value
+                attrs[key] = value
 
             elif isinstance(value, list):
                 if len(value):
                     self.parse_structure(key, group, value, "_list_", **kwds)
                 else:
-                    group.attrs["_list_empty_" + key] = "_None_"
+                    attrs["_list_empty_" + key] = "_None_"
 
             elif isinstance(value, tuple):
                 if len(value):
                     self.parse_structure(key, group, value, "_tuple_", **kwds)
                 else:
-                    group.attrs["_tuple_empty_" + key] = "_None_"
+                    attrs["_tuple_empty_" + key] = "_None_"
 
             else:
+                attrs[key] = value
+        self._write_attrs(group, attrs)
+
+    @staticmethod
+    def _write_attrs(group, attrs):
+        """Write the ``attrs`` dictionary in the attributes of ``group``."""
+        try:
+            group.attrs.update(attrs)
+        except Exception:
+            # write them one at a time to skip only the ones which can't be
+            # written
+            for key, value in attrs.items():
                 try:
                     group.attrs[key] = value
                 except Exception:
@@ -853,3 +1582,118 @@ class HierarchicalWriter:
             if _type + key in group:
                 del group[_type + key]
             group.create_dataset(_type + key, data=tmp, **kwds)
+
+
+class HierarchicalAppender:
+    """
+    Write a signal incrementally, by appending data along its first axis, for
+    example the frames of an in situ experiment as they are acquired. The
+    file is consistent and can be read after each call of :py:meth:`append`.
+
+    Use the ``file_appender`` function of the hspy and zspy plugins to create
+    it. It can be used as context manager, which closes it on exit.
+    """
+
+    writer_class = HierarchicalWriter
+
+    def __init__(self, file, group, signal, chunks=None, **kwds):
+        axes = signal["axes"]
+        if not axes or not axes[0]["navigate"]:
+            raise ValueError(
+                "The first axis of the signal must be a navigation axis to "
+                "append data along it."
+            )
+        if axes[0].get("_type", "UniformDataAxis") != "UniformDataAxis":
+            raise ValueError(
+                "The first axis of the signal must be a uniform axis to "
+                "append data along it."
+            )
+        data = signal["data"]
+        if isinstance(data, da.Array):
+            data = data.compute()
+        data = np.asarray(data)
+        if data.dtype == np.dtype("O"):
+            raise ValueError("Appending ragged arrays is not supported.")
+        signal_axes = [i for i, axis in enumerate(axes) if not axis["navigate"]]
+        if chunks is None:
+            chunks = self._get_append_chunks(data.shape, data.dtype, signal_axes)
+        # the size of the first axis is the length of the initial data
+        signal = dict(signal, axes=[dict(axes[0], size=len(data))] + axes[1:])
+
+        self.file = file
+        self.group = group
+        writer = self.writer_class(file, signal, group, write_dataset=False, **kwds)
+        writer.write()
+        self.writer_class.overwrite_dataset(
+            group,
+            data,
+            "data",
+            signal_axes=signal_axes,
+            chunks=chunks,
+            **self._get_resizable_kwds(data.shape),
+            **kwds,
+        )
+        self.dataset = group["data"]
+        self.flush()
+
+    def _get_append_chunks(self, shape, dtype, signal_axes):
+        """
+        Chunks as short as possible along the first axis, so that appending
+        data writes new chunks instead of rewriting the compressed chunks
+        already written.
+        """
+        chunks = get_signal_chunks(
+            shape[1:],
+            dtype,
+            [i - 1 for i in signal_axes],
+            self.writer_class.target_size,
+        )
+        chunk_size = np.prod(chunks, dtype=int) * np.dtype(dtype).itemsize
+        return (max(1, _MIN_APPEND_CHUNK_SIZE // chunk_size),) + tuple(chunks)
+
+    @staticmethod
+    def _get_resizable_kwds(shape):
+        """Additional keywords to create a dataset resizable along the first axis."""
+        return {}
+
+    @property
+    def shape(self):
+        """The shape of the data written so far."""
+        return self.dataset.shape
+
+    def append(self, data):
+        """
+        Append data along the first axis of the signal.
+
+        Parameters
+        ----------
+        data : numpy.ndarray or dask.array.Array
+            The data to append, with the same shape as the signal along all
+            the other axes.
+        """
+        if data.shape[1:] != self.dataset.shape[1:]:
+            raise ValueError(
+                f"The shape of the data {data.shape} doesn't match the shape of "
+                f"the signal {self.dataset.shape} along the axes after the first."
+            )
+        if isinstance(data, da.Array):
+            data = data.compute()
+        start = self.dataset.shape[0]
+        stop = start + data.shape[0]
+        self.dataset.resize((stop,) + self.dataset.shape[1:])
+        self.dataset[start:stop] = data
+        # updated after the data so that the axis is never longer than the data
+        self.group["axis-0"].attrs["size"] = stop
+        self.flush()
+
+    def flush(self):
+        """Write the data and metadata buffered by the library to the file."""
+
+    def close(self):
+        """Close the file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
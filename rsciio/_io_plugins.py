@@ -0,0 +1,479 @@
+"""
+Compiled registry of the IO plugins specifications.
+
+This file is generated from the ``specifications.yaml`` file of each plugin
+by ``python -m rsciio._specifications``. Do not edit manually.
+"""
+
+IO_PLUGINS = [
+    {
+        "name": "Blockfile",
+        "name_aliases": [],
+        "description": "Read/write support for ASTAR blockfiles.",
+        "full_support": False,
+        "file_extensions": ["blo", "BLO"],
+        "default_extension": 0,
+        "writes": [[2, 2], [2, 1], [2, 0]],
+        "non_uniform_axis": False,
+        "magic_signatures": [{"offset": 0, "ascii": "IMGBLO"}],
+        "api": "rsciio.blockfile",
+    },
+    {
+        "name": "Bruker",
+        "name_aliases": [
+            "BrukerComposite",
+            "Bruker composite file",
+            "Bruker composite file bcf",
+            "BCF",
+            "SPX",
+        ],
+        "description": "The proprietary format used by Bruker's Esprit(R) software "
+        "to save hypermaps together with 16bit SEM imagery, EDS "
+        "spectra and metadata describing the dimentions of the data "
+        "and SEM/TEM (limited) parameters.\n",
+        "full_support": False,
+        "file_extensions": ["bcf", "spx"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "ascii": "AAMVHFSS"},
+            {"ascii": "TRTSpectrum"},
+        ],
+        "api": "rsciio.bruker",
+    },
+    {
+        "name": "DENS",
+        "name_aliases": [],
+        "description": "Reads heater log from a DENS heating holder.",
+        "version": "3.1",
+        "full_support": False,
+        "file_extensions": ["dens", "DENS"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "api": "rsciio.dens",
+    },
+    {
+        "name": "DigitalMicrograph",
+        "name_aliases": [
+            "Digital Micrograph dm3",
+            "Digital Micrograph",
+            "Gatan",
+            "DM3",
+            "DM4",
+        ],
+        "description": "Read data from Gatan Digital Micrograph (TM) files.",
+        "full_support": False,
+        "file_extensions": ["dm3", "DM3", "dm4", "DM4"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "hex": "00000003"},
+            {"offset": 0, "hex": "00000004"},
+        ],
+        "api": "rsciio.digitalmicrograph",
+    },
+    {
+        "name": "DigitalSurf",
+        "name_aliases": ["DigitalSurfSurface", "Digital Surf Surface", "SUR"],
+        "description": "Read data from the proprietary .sur file format from Digital "
+        "Surf.",
+        "full_support": False,
+        "file_extensions": ["sur", "SUR", "pro", "PRO"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "ascii": "DSCOMPRESSED"},
+            {"offset": 0, "ascii": "DIGITAL SURF"},
+        ],
+        "api": "rsciio.digitalsurf",
+    },
+    {
+        "name": "EDAX",
+        "name_aliases": ["EDAX TEAM", "EDAX-TEAM"],
+        "description": "Reader for EDS maps and spectra saved by the EDAX TEAM or "
+        "Genesis software. An SPD file contains map data. The "
+        "spectral information is  held in an SPC file with the same "
+        "name, while the spatial  calibration is held in a related "
+        "IPR file.\n",
+        "full_support": False,
+        "file_extensions": ["spd", "SPD", "spc", "SPC"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_hints": [{"offset": 0, "ascii": "MAPSPECTRA_DATA"}],
+        "api": "rsciio.edax",
+    },
+    {
+        "name": "EMD",
+        "name_aliases": ["Electron Microscopy Data", "Electron Microscopy Data (EMD)"],
+        "description": "Read data from Berkeley's Electron Microscopy Data (EMD) "
+        "files.",
+        "full_support": False,
+        "file_extensions": ["emd", "EMD", "de5", "DE5"],
+        "default_extension": 0,
+        "reads_images": True,
+        "reads_spectrum": True,
+        "reads_spectrum_image": True,
+        "writes": True,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": [0, 512, 1024, 2048], "hex": "894844460d0a1a0a"}
+        ],
+        "magic_hints": [
+            {"ascii": "version_major"},
+            {"ascii": "Velox"},
+            {"ascii": "DevelopersKit"},
+        ],
+        "api": "rsciio.emd",
+    },
+    {
+        "name": "EMPAD",
+        "name_aliases": [],
+        "description": "File format used by the Electron Microscope Pixel Array "
+        "Detector (EMPAD).",
+        "full_support": False,
+        "file_extensions": ["xml", "XML"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "api": "rsciio.empad",
+    },
+    {
+        "name": "Hamamatsu",
+        "name_aliases": [],
+        "description": "Read data from Hamamatsu's .img (ITEX) files.",
+        "full_support": False,
+        "file_extensions": ["img", "IMG"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": True,
+        "api": "rsciio.hamamatsu",
+    },
+    {
+        "name": "HSPY",
+        "name_aliases": ["HyperSpy", "HyperSpy_HDF5", "HyperSpy HDF5"],
+        "description": "The default file format for HyperSpy based on the HDF5 "
+        "standard.",
+        "full_support": False,
+        "file_extensions": ["hspy", "hdf5"],
+        "default_extension": 0,
+        "writes": True,
+        "non_uniform_axis": True,
+        "magic_signatures": [
+            {"offset": [0, 512, 1024, 2048], "hex": "894844460d0a1a0a"}
+        ],
+        "magic_hints": [{"ascii": "Experiments"}, {"ascii": "HyperSpy"}],
+        "api": "rsciio.hspy",
+    },
+    {
+        "name": "Image",
+        "name_aliases": [],
+        "description": "Import/Export standard image formats using PIL or freeimage.",
+        "full_support": False,
+        "file_extensions": [
+            "png",
+            "bmp",
+            "dib",
+            "gif",
+            "jpeg",
+            "jpe",
+            "jpg",
+            "msp",
+            "pcx",
+            "ppm",
+            "pbm",
+            "pgm",
+            "xbm",
+            "spi",
+        ],
+        "default_extension": 0,
+        "writes": [[2, 0], [0, 2]],
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "hex": "89504e470d0a1a0a"},
+            {"offset": 0, "hex": "ffd8ff"},
+            {"offset": 0, "ascii": "BM"},
+            {"offset": 0, "ascii": "GIF8"},
+        ],
+        "api": "rsciio.image",
+    },
+    {
+        "name": "Impulse",
+        "name_aliases": [],
+        "description": "Reads DENSsolutions Impulse log files.",
+        "full_support": False,
+        "file_extensions": ["csv", "CSV"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_hints": [{"offset": 0, "ascii": "TimeStamp,"}],
+        "api": "rsciio.impulse",
+    },
+    {
+        "name": "JEOL",
+        "name_aliases": [],
+        "description": "Read JEOL files output by the Analysis Station software.",
+        "full_support": False,
+        "file_extensions": ["ASW", "asw", "img", "map", "pts", "eds"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "api": "rsciio.jeol",
+    },
+    {
+        "name": "JobinYvon",
+        "name_aliases": [],
+        "description": "Read data from .xml files saved using Horiba Jobin Yvon's "
+        "LabSpec software.",
+        "full_support": False,
+        "file_extensions": ["xml", "XML"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": True,
+        "magic_hints": [{"ascii": "LSX_Tree"}],
+        "api": "rsciio.jobinyvon",
+    },
+    {
+        "name": "MRC",
+        "name_aliases": [],
+        "description": "MRC file format, widely used for tomographic data.",
+        "full_support": False,
+        "file_extensions": ["mrc", "MRC", "ALI", "ali"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_hints": [{"offset": 208, "ascii": "MAP "}],
+        "api": "rsciio.mrc",
+    },
+    {
+        "name": "MRCZ",
+        "name_aliases": [],
+        "description": "Compressed MRC file format extension with blosc "
+        "meta-compression.",
+        "full_support": False,
+        "file_extensions": ["mrc", "MRC", "mrcz", "MRCZ"],
+        "default_extension": 2,
+        "writes": [[2, 0], [2, 1], [2, 2], [3, 0]],
+        "non_uniform_axis": False,
+        "magic_hints": [{"offset": 208, "ascii": "MAP "}],
+        "api": "rsciio.mrcz",
+    },
+    {
+        "name": "MSA",
+        "name_aliases": [],
+        "description": "Open standard format for single spectra defined by the "
+        "Microscopy Society of America.",
+        "full_support": False,
+        "file_extensions": ["msa", "ems", "mas", "emsa", "EMS", "MAS", "EMSA", "MSA"],
+        "default_extension": 0,
+        "writes": [[1, 0]],
+        "non_uniform_axis": False,
+        "magic_signatures": [{"offset": 0, "ascii": "#FORMAT"}],
+        "api": "rsciio.msa",
+    },
+    {
+        "name": "netCDF",
+        "name_aliases": [],
+        "description": "Read files written by EELSlab (HyperSpy's predecessor) using "
+        "the nedCDF format.",
+        "full_support": True,
+        "file_extensions": ["nc", "NC"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "hex": "43444601"},
+            {"offset": 0, "hex": "43444602"},
+            {"offset": [0, 512, 1024, 2048], "hex": "894844460d0a1a0a"},
+        ],
+        "api": "rsciio.netcdf",
+    },
+    {
+        "name": "NeXus",
+        "name_aliases": [],
+        "description": "Read NXdata sets from NeXus files and metadata. Data and "
+        "metadata from general hdf5 files can also be examined.",
+        "full_support": False,
+        "file_extensions": ["nxs", "NXS"],
+        "default_extension": 0,
+        "writes": True,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": [0, 512, 1024, 2048], "hex": "894844460d0a1a0a"}
+        ],
+        "magic_hints": [{"ascii": "NX_class"}, {"ascii": "nexus"}],
+        "api": "rsciio.nexus",
+    },
+    {
+        "name": "PantaRhei",
+        "name_aliases": ["PRZ"],
+        "description": "File format used by CEOS PantaRhei, based on simple numpy "
+        "arrays and dictionaries.",
+        "full_support": False,
+        "file_extensions": ["prz", "PRZ"],
+        "default_extension": 0,
+        "writes": True,
+        "non_uniform_axis": False,
+        "magic_signatures": [{"offset": 0, "hex": "504b0304"}],
+        "api": "rsciio.pantarhei",
+    },
+    {
+        "name": "Phenom",
+        "name_aliases": [
+            "PhenomELID",
+            "Phenom Element Identification",
+            "Phenom Element Identification (ELID)",
+        ],
+        "description": "Read data from Phenom Element Identification (ELID) files.",
+        "full_support": False,
+        "file_extensions": ["elid", "ELID"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [{"offset": 0, "ascii": "BZh"}],
+        "api": "rsciio.phenom",
+    },
+    {
+        "name": "Protochips",
+        "name_aliases": [],
+        "description": "Reads Protochips log files (heating/baising and gas cell).",
+        "full_support": False,
+        "file_extensions": ["csv", "CSV"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_hints": [{"offset": 0, "ascii": "Time, Notes"}],
+        "api": "rsciio.protochips",
+    },
+    {
+        "name": "Renishaw",
+        "name_aliases": [],
+        "description": "Read data from .wdf files saved using Renishaw's WIRE "
+        "software.",
+        "full_support": False,
+        "file_extensions": ["wdf", "WDF"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": True,
+        "magic_signatures": [{"offset": 0, "ascii": "WDF1"}],
+        "api": "rsciio.renishaw",
+    },
+    {
+        "name": "Ripple",
+        "name_aliases": [],
+        "description": "RPL file contains the information on how to read the RAW "
+        "file with the same name.",
+        "full_support": True,
+        "file_extensions": ["rpl", "RPL"],
+        "default_extension": 0,
+        "writes": [[1, 0], [1, 1], [1, 2], [2, 0], [2, 1]],
+        "non_uniform_axis": False,
+        "api": "rsciio.ripple",
+    },
+    {
+        "name": "Semper",
+        "name_aliases": ["SEMPER UNF (unformatted)", "Semper UNF", "Semper_UNF", "UNF"],
+        "description": "Read data from Semper UNF (unformatted) files.",
+        "full_support": True,
+        "file_extensions": ["unf", "UNF"],
+        "default_extension": 0,
+        "writes": [[1, 0], [1, 1], [1, 2], [2, 0], [2, 1]],
+        "non_uniform_axis": False,
+        "api": "rsciio.semper",
+    },
+    {
+        "name": "TIA",
+        "name_aliases": ["FEI", "FEI TIA", "FEI-TIA", "FEI_TIA"],
+        "description": "Read sets of .ser & .emi files from the FEI TIA software.",
+        "full_support": False,
+        "file_extensions": ["ser", "SER", "emi", "EMI"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "hex": "49499701"},
+            {"offset": 0, "hex": "4a4b0002"},
+        ],
+        "api": "rsciio.tia",
+    },
+    {
+        "name": "TIFF",
+        "name_aliases": [],
+        "description": "Import/Export standard image formats using Christoph "
+        "Gohlke's tifffile library.",
+        "full_support": False,
+        "file_extensions": ["tif", "tiff"],
+        "default_extension": 0,
+        "writes": [[2, 0], [2, 1]],
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": 0, "hex": "49492a00"},
+            {"offset": 0, "hex": "4d4d002a"},
+            {"offset": 0, "hex": "49492b00"},
+            {"offset": 0, "hex": "4d4d002b"},
+        ],
+        "api": "rsciio.tiff",
+    },
+    {
+        "name": "TriVista",
+        "name_aliases": [],
+        "description": "Reads data from TriVista tvf files",
+        "full_support": False,
+        "file_extensions": ["tvf", "TVF"],
+        "default_extension": 0,
+        "writes": False,
+        "non_uniform_axis": True,
+        "magic_hints": [{"ascii": "TriVista"}],
+        "api": "rsciio.trivista",
+    },
+    {
+        "name": "TVIPS",
+        "name_aliases": [],
+        "description": "Read support for TVIPS CMOS camera stream/movie files. Can "
+        "be used for in-situ movies or 4D-STEM datasets.",
+        "full_support": False,
+        "file_extensions": ["tvips", "TVIPS"],
+        "default_extension": 0,
+        "writes": True,
+        "non_uniform_axis": False,
+        "api": "rsciio.tvips",
+    },
+    {
+        "name": "USID",
+        "name_aliases": [
+            "Universal Spectroscopic and Imaging Data",
+            "USID HDF5",
+            "USID_HDF5",
+        ],
+        "description": "Data structured according to the Universal Spectroscopic and "
+        "Imaging Data (USID) model, written into Hierarchical Data "
+        "Format (HDF5) files.",
+        "full_support": False,
+        "file_extensions": ["h5", "hdf5"],
+        "default_extension": 0,
+        "writes": True,
+        "non_uniform_axis": False,
+        "magic_signatures": [
+            {"offset": [0, 512, 1024, 2048], "hex": "894844460d0a1a0a"}
+        ],
+        "magic_hints": [{"ascii": "Measurement_"}],
+        "api": "rsciio.usid",
+    },
+    {
+        "name": "ZSPY",
+        "name_aliases": ["HyperSpyZarr"],
+        "description": "HyperSpy file format definition based on the zarr standard, "
+        "particularly suited for big data sets.",
+        "full_support": True,
+        "file_extensions": ["zspy", "ZSPY"],
+        "default_extension": 0,
+        "non_uniform_axis": True,
+        "writes": True,
+        "magic_hints": [{"ascii": "ZSpy"}],
+        "api": "rsciio.zspy",
+    },
+]
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+import importlib
+import os
+from pathlib import Path
+
+from rsciio._detect_format import detect_format
+
+
+_EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+_ON_ERROR = ("raise", "skip", "return")
+
+
+def _get_file_size(path):
+    path = Path(path)
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return path.stat().st_size
+
+
+def _read_file(path, kwds):
+    """Read a file with the best plugin returned by :py:func:`detect_format`."""
+    plugins = detect_format(path)
+    if not plugins:
+        raise ValueError(f"The format of the file '{path}' can't be detected.")
+    file_reader = importlib.import_module(plugins[0]["api"]).file_reader
+    return file_reader(path, **kwds)
+
+
+def read_many(
+    paths,
+    workers=None,
+    max_bytes_in_flight=None,
+    executor="thread",
+    on_error="raise",
+    **kwds,
+):
+    """
+    Read many files in parallel and yield the results as they complete.
+
+    The plugin used to read each file is the best match returned by
+    :py:func:`rsciio.detect_format`. A file is submitted to the pool only
+    when the total size of the files being read, or read but not yet
+    consumed, stays below ``max_bytes_in_flight``. The size of a file on
+    disk is used as an estimate of its size in memory.
+
+    Parameters
+    ----------
+    paths : iterable of str or pathlib.Path
+        The paths of the files to read. It can be a generator, which is
+        consumed as the files are submitted.
+    workers : int or None, default=None
+        The number of workers of the pool. If None, use the number of CPUs.
+    max_bytes_in_flight : int or None, default=None
+        The maximum number of bytes being read or waiting to be consumed.
+        A file larger than the budget is read alone. If None, the number
+        of files in flight is only limited to twice the number of workers.
+    executor : str, default="thread"
+        The type of pool, either ``"thread"`` or ``"process"``. Threads are
+        suitable for most formats, since the reading is mostly limited by
+        the IO and numpy and h5py release the GIL. Processes may be faster
+        for the formats parsed in python, for example text formats, but
+        the dictionaries returned by the reader must be picklable, which is
+        not the case for the ``post_process`` of the DigitalMicrograph
+        reader.
+    on_error : str, default="raise"
+        What to do when a file can't be read: ``"raise"`` raises the
+        exception, after cancelling the files which are not being read yet,
+        ``"skip"`` ignores the file and ``"return"`` yields the exception
+        instead of the list of dictionaries.
+    **kwds : dict
+        The keyword arguments passed to the ``file_reader`` of the plugins,
+        for example ``lazy`` or ``metadata_only``.
+
+    Yields
+    ------
+    tuple
+        The path of the file, as given in ``paths``, and the list of
+        dictionaries returned by the ``file_reader`` of the plugin, or the
+        exception raised when reading the file with ``on_error="return"``.
+
+    Raises
+    ------
+    ValueError
+        If the format of a file can't be detected and ``on_error="raise"``.
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from rsciio import read_many
+    >>> paths = Path("spectra").glob("*.msa")
+    >>> for path, dicts in read_many(paths, workers=8, max_bytes_in_flight=2**30):
+    ...     print(path, dicts[0]["data"].shape)
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(
+            f"`executor` must be one of {list(_EXECUTORS)}, not '{executor}'."
+        )
+    if on_error not in _ON_ERROR:
+        raise ValueError(
+            f"`on_error` must be one of {list(_ON_ERROR)}, not '{on_error}'."
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    paths = iter(paths)
+    # the next file to submit, kept aside when it doesn't fit in the budget
+    next_file = None
+    pending = {}
+    bytes_in_flight = 0
+
+    def submit(pool):
+        nonlocal next_file, bytes_in_flight
+        while len(pending) < 2 * workers:
+            if next_file is None:
+                path = next(paths, None)
+                if path is None:
+                    return
+                next_file = (path, _get_file_size(path))
+            path, size = next_file
+            if (
+                pending
+                and max_bytes_in_flight is not None
+                and bytes_in_flight + size > max_bytes_in_flight
+            ):
+                return
+            pending[pool.submit(_read_file, path, kwds)] = next_file
+            bytes_in_flight += size
+            next_file = None
+
+    with _EXECUTORS[executor](max_workers=workers) as pool:
+        try:
+            submit(pool)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, size = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield path, future.result()
+                    elif on_error == "raise":
+                        # the files not being read yet are cancelled below
+                        raise error
+                    elif on_error == "return":
+                        yield path, error
+                    # the result is now owned by the caller
+                    bytes_in_flight -= size
+                submit(pool)
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""
+Read the ``specifications.yaml`` files of the plugins and compile them into
+the ``rsciio._io_plugins`` module, which is used at runtime to populate
+``rsciio.IO_PLUGINS`` without parsing any YAML file.
+
+The compiled registry is updated by the pre-commit hook or by running::
+
+    python -m rsciio._specifications
+"""
+
+import os
+import pprint
+
+
+_RSCIIO_PATH = os.path.abspath(os.path.dirname(__file__))
+_IO_PLUGINS_FILE = os.path.join(_RSCIIO_PATH, "_io_plugins.py")
+
+_HEADER = '''"""
+Compiled registry of the IO plugins specifications.
+
+This file is generated from the ``specifications.yaml`` file of each plugin
+by ``python -m rsciio._specifications``. Do not edit manually.
+"""
+
+'''
+
+
+def read_specifications():
+    """
+    Walk the package tree and parse the ``specifications.yaml`` of each plugin.
+
+    Returns
+    -------
+    list of dict
+        The specifications of each plugin, sorted by plugin folder name. The
+        ``api`` key is set to the module path of the plugin.
+    """
+    import yaml
+
+    specifications = []
+    for sub, _, _ in sorted(os.walk(_RSCIIO_PATH)):
+        specs_file = os.path.join(sub, "specifications.yaml")
+        if os.path.isfile(specs_file):
+            with open(specs_file, "r") as stream:
+                specs = yaml.safe_load(stream)
+            # for testing purposes
+            specs["api"] = "rsciio.%s" % os.path.split(sub)[1]
+            specifications.append(specs)
+
+    return specifications
+
+
+def format_specifications(specifications):
+    """Return the source code of the compiled registry module."""
+    content = (
+        _HEADER + "IO_PLUGINS = " + pprint.pformat(specifications, sort_dicts=False)
+    )
+    try:
+        # Keep the generated file consistent with the code style of the
+        # repository
+        import black
+
+        content = black.format_str(content, mode=black.Mode())
+    except ImportError:  # pragma: no cover
+        content += "\n"
+
+    return content
+
+
+def update_io_plugins_registry(filename=None):
+    """
+    Write the compiled registry module from the ``specifications.yaml`` files.
+
+    Parameters
+    ----------
+    filename : str or None, default=None
+        The file to write to. If None, ``rsciio/_io_plugins.py`` is updated.
+
+    Returns
+    -------
+    bool
+        Whether the file has been modified.
+    """
+    if filename is None:
+        filename = _IO_PLUGINS_FILE
+    content = format_specifications(read_specifications())
+    if os.path.isfile(filename):
+        with open(filename, "r") as f:
+            if f.read() == content:
+                return False
+    with open(filename, "w") as f:
+        f.write(content)
+
+    return True
+
+
+if __name__ == "__main__":
+    # Used by the pre-commit hook: return 1 when the registry was out of date
+    exit(int(update_io_plugins_registry()))
@@ -23,29 +23,33 @@ import datetime
 import dateutil
 
 import numpy as np
-import dask
-from dask.diagnostics import ProgressBar
 from skimage import dtype_limits
 
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    CHUNKS_READ_DOC,
     ENDIANESS_DOC,
     MMAP_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
     SHOW_PROGRESSBAR_DOC,
 )
+from rsciio.utils.array import get_data_placeholder, get_signal_aware_dask_array
 from rsciio.utils.skimage_exposure import rescale_intensity
 from rsciio.utils.tools import DTBox, sarray2dict, dict2sarray
 from rsciio.utils.date_time_tools import (
     serial_date_to_ISO_format,
     datetime_to_serial_date,
 )
-from rsciio.utils.tools import dummy_context_manager, convert_units
+from rsciio.utils.tools import dummy_context_manager, convert_units, deferred_import
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
+dask = deferred_import("dask")
+
 
 magics = [0x0102]
 
@@ -206,7 +210,15 @@ def get_header_from_signal(signal, endianess="<"):
     return header, note
 
 
-def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
+@instrumented
+def file_reader(
+    filename,
+    lazy=False,
+    mmap_mode=None,
+    endianess="<",
+    metadata_only=False,
+    chunks="auto",
+):
     """
     Read a blockfile.
 
@@ -216,6 +228,9 @@ def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
     %s
     %s
     %s
+    %s
+    %s
+
     %s
     """
 
@@ -227,9 +242,9 @@ def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
     if "+" in mmap_mode or ("write" in mmap_mode and "copyonwrite" != mmap_mode):
         if lazy:
             raise ValueError("Lazy loading does not support in-place writing")
-        f = open(filename, "r+b")
+        f = open_file(filename, "r+b")
     else:
-        f = open(filename, "rb")
+        f = open_file(filename, "rb")
     _logger.debug("File opened")
 
     # Get header
@@ -271,27 +286,31 @@ def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
 
     # Then comes actual blockfile
     offset2 = header["Data_offset_2"]
-    if not lazy:
-        f.seek(offset2)
-        data = np.fromfile(f, dtype=endianess + "u1")
+    if metadata_only:
+        data = get_data_placeholder((NY, NX, DP_SZ, DP_SZ), endianess + "u1")
+        data = data.squeeze()
     else:
-        data = np.memmap(f, mode=mmap_mode, offset=offset2, dtype=endianess + "u1")
-    try:
-        data = data.reshape((NY, NX, DP_SZ * DP_SZ + 6))
-    except ValueError:
-        warnings.warn(
-            "Blockfile header dimensions larger than file size! "
-            "Will attempt to load by zero padding incomplete frames."
-        )
-        # Data is stored DP by DP:
-        pw = [(0, NX * NY * (DP_SZ * DP_SZ + 6) - data.size)]
-        data = np.pad(data, pw, mode="constant")
-        data = data.reshape((NY, NX, DP_SZ * DP_SZ + 6))
+        if not lazy:
+            f.seek(offset2)
+            data = np.fromfile(f, dtype=endianess + "u1")
+        else:
+            data = np.memmap(f, mode=mmap_mode, offset=offset2, dtype=endianess + "u1")
+        try:
+            data = data.reshape((NY, NX, DP_SZ * DP_SZ + 6))
+        except ValueError:
+            warnings.warn(
+                "Blockfile header dimensions larger than file size! "
+                "Will attempt to load by zero padding incomplete frames."
+            )
+            # Data is stored DP by DP:
+            pw = [(0, NX * NY * (DP_SZ * DP_SZ + 6) - data.size)]
+            data = np.pad(data, pw, mode="constant")
+            data = data.reshape((NY, NX, DP_SZ * DP_SZ + 6))
 
-    # Every frame is preceeded by a 6 byte sequence (AA 55, and then a 4 byte
-    # integer specifying frame number)
-    data = data[:, :, 6:]
-    data = data.reshape((NY, NX, DP_SZ, DP_SZ), order="C").squeeze()
+        # Every frame is preceeded by a 6 byte sequence (AA 55, and then a 4 byte
+        # integer specifying frame number)
+        data = data[:, :, 6:]
+        data = data.reshape((NY, NX, DP_SZ, DP_SZ), order="C").squeeze()
 
     units = ["nm", "nm", "cm", "cm"]
     names = ["y", "x", "dy", "dx"]
@@ -323,6 +342,10 @@ def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
         for i in range(dim)
     ]
 
+    if lazy and not metadata_only:
+        signal_axes = [i for i, axis in enumerate(axes) if not axis["navigate"]]
+        data = get_signal_aware_dask_array(data, signal_axes, chunks=chunks)
+
     dictionary = {
         "data": data,
         "axes": axes,
@@ -337,9 +360,18 @@ def file_reader(filename, lazy=False, mmap_mode=None, endianess="<"):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, MMAP_DOC, ENDIANESS_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    MMAP_DOC,
+    ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
 
 
+@instrumented
 def file_writer(
     filename,
     signal,
@@ -405,7 +437,7 @@ def file_writer(
         original_scale = intensity_scaling
 
     header, note = get_header_from_signal(signal, endianess=endianess)
-    with open(filename, "wb") as f:
+    with open_file(filename, "wb") as f:
         # Write header
         header.tofile(f)
         # Write header note field:
@@ -474,6 +506,8 @@ def file_writer(
     file_memmap["MAGIC"] = magics
     file_memmap["ID"] = ids
     if signal["attributes"]["_lazy"]:
+        from dask.diagnostics import ProgressBar
+
         cm = ProgressBar if show_progressbar else dummy_context_manager
         with cm():
             array_data.store(file_memmap["IMG"])
@@ -34,17 +34,26 @@ import codecs
 import xml.etree.ElementTree as ET
 import io
 
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.date_time_tools import msfiletime_to_unix
-from rsciio.utils.tools import sanitize_msxml_float, XmlToDict
+from rsciio.utils.tools import sanitize_msxml_float, XmlToDict, deferred_import
 
-import dask.delayed as dd
-import dask.array as da
 import numpy as np
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils import cache
+from rsciio.utils.instrumentation import instrumented, open_file, phase
 
 _logger = logging.getLogger(__name__)
 
+da = deferred_import("dask.array")
+dask = deferred_import("dask")
+
 warn_once = True
 
 try:
@@ -126,7 +135,7 @@ class SFSTreeItem(object):
         """
         # table size in number of chunks:
         n_of_chunks = ceil(self.size_in_chunks / (self.sfs.usable_chunk // 4))
-        with open(self.sfs.filename, "rb") as fn:
+        with open_file(self.sfs.filename, "rb") as fn:
             if n_of_chunks > 1:
                 next_chunk = self._pointer_to_pointer_table
                 temp_string = io.BytesIO()
@@ -169,7 +178,7 @@ class SFSTreeItem(object):
         lb_idx = (offset + length) // self.sfs.usable_chunk
         # last block cut off:
         lbco = (offset + length) % self.sfs.usable_chunk
-        with open(self.sfs.filename, "rb") as fn:
+        with open_file(self.sfs.filename, "rb") as fn:
             if fb_idx != lb_idx:
                 fn.seek(self.pointers[fb_idx] + fbo)
                 data.write(fn.read(self.sfs.usable_chunk - fbo))
@@ -198,7 +207,7 @@ class SFSTreeItem(object):
         chunks -- the number of chunks to read. (default False)
         """
         last = self.size_in_chunks
-        with open(self.sfs.filename, "rb") as fn:
+        with open_file(self.sfs.filename, "rb") as fn:
             for idx in range(first, last - 1):
                 fn.seek(self.pointers[idx])
                 yield fn.read(self.sfs.usable_chunk)
@@ -218,7 +227,7 @@ class SFSTreeItem(object):
         self.uncompressed_blk_size, self.no_of_compr_blk
 
         """
-        with open(self.sfs.filename, "rb") as fn:
+        with open_file(self.sfs.filename, "rb") as fn:
             fn.seek(self.pointers[0])
             # AACS signature, uncompressed size, undef var, number of blocks
             aacs, uc_size, _, n_of_blocks = strct_unp("<IIII", fn.read(16))
@@ -306,7 +315,7 @@ class SFS_reader(object):
     def __init__(self, filename):
         self.filename = filename
         # read the file header
-        with open(filename, "rb") as fn:
+        with open_file(filename, "rb") as fn:
             a = fn.read(8)
             if a != b"AAMVHFSS":
                 raise TypeError("file '{0}' is not SFS container".format(filename))
@@ -332,7 +341,7 @@ class SFS_reader(object):
         --------
         SFSTreeItem
         """
-        with open(self.filename, "rb") as fn:
+        with open_file(self.filename, "rb") as fn:
             # check if file tree do not exceed one chunk:
             n_file_tree_chunks = ceil(
                 (self.n_tree_items * 0x200) / (self.chunksize - 0x20)
@@ -405,7 +414,7 @@ class SFS_reader(object):
 
     def _check_the_compresion(self, temp_item_list):
         """parse, check and setup the self.compression"""
-        with open(self.filename, "rb") as fn:
+        with open_file(self.filename, "rb") as fn:
             # Find if there is compression:
             for c in temp_item_list:
                 if not c.is_dir:
@@ -894,11 +903,14 @@ class BCF_reader(SFS_reader):
             if "SpectrumData" in i:
                 self.available_indexes.append(int(i[-1]))
         self.def_index = min(self.available_indexes)
-        header_bytes = header_file.get_as_BytesIO_string().getvalue()
-        sanitized_bytes = sanitize_msxml_float(header_bytes)
-        self.header = HyperHeader(
-            sanitized_bytes, self.available_indexes, instrument=instrument
-        )
+        self.header = cache.get_entry(filename, f"bruker.header.{instrument}")
+        if self.header is None:
+            header_bytes = header_file.get_as_BytesIO_string().getvalue()
+            sanitized_bytes = sanitize_msxml_float(header_bytes)
+            self.header = HyperHeader(
+                sanitized_bytes, self.available_indexes, instrument=instrument
+            )
+            cache.set_entry(filename, f"bruker.header.{instrument}", self.header)
         self.hypermap = {}
 
     def check_index_valid(self, index):
@@ -914,7 +926,14 @@ class BCF_reader(SFS_reader):
             )
         return index
 
-    def parse_hypermap(self, index=None, downsample=1, cutoff_at_kV=None, lazy=False):
+    def parse_hypermap(
+        self,
+        index=None,
+        downsample=1,
+        cutoff_at_kV=None,
+        lazy=False,
+        metadata_only=False,
+    ):
         """Unpack the Delphi/Bruker binary spectral map and return
         numpy array in memory efficient way.
 
@@ -941,6 +960,9 @@ class BCF_reader(SFS_reader):
         lazy : bool
             It True, returns dask.array otherwise a numpy.array. Default is
             False.
+        metadata_only : bool
+            If True, the hypermap is not parsed and a placeholder with the
+            shape and dtype of the hypermap is returned. Default is False.
 
         Returns
         -------
@@ -965,6 +987,12 @@ class BCF_reader(SFS_reader):
             ceil(self.header.image.width / downsample),
             n_channels,
         )
+        if metadata_only:
+            dtype = self.header.estimate_map_depth(
+                index=index, downsample=downsample, for_numpy=False
+            )
+            return get_data_placeholder(shape, dtype)
+
         sfs_file = SFS_reader(self.filename)
         vrt_file_hand = sfs_file.get_file("EDSDatabase/SpectrumData" + str(index))
         if fast_unbcf:
@@ -978,10 +1006,14 @@ class BCF_reader(SFS_reader):
                 index=index, downsample=downsample, for_numpy=True
             )
         if lazy:
-            value = dd(parse_func)(vrt_file_hand, shape, dtype, downsample=downsample)
+            value = dask.delayed(parse_func)(
+                vrt_file_hand, shape, dtype, downsample=downsample
+            )
             result = da.from_delayed(value, shape=shape, dtype=dtype)
         else:
-            result = parse_func(vrt_file_hand, shape, dtype, downsample=downsample)
+            # the data are decompressed and decoded at the same time
+            with phase("data"):
+                result = parse_func(vrt_file_hand, shape, dtype, downsample=downsample)
         return result
 
     def add_filename_to_general(self, item):
@@ -989,8 +1021,8 @@ class BCF_reader(SFS_reader):
         item["metadata"]["General"]["original_filename"] = basename(self.filename)
 
 
-def spx_reader(filename, lazy=False):
-    with open(filename, "br") as fn:
+def spx_reader(filename, lazy=False, metadata_only=False):
+    with open_file(filename, "br") as fn:
         xml_str = fn.read()
     root = ET.fromstring(xml_str)
     sp_node = root.find("./ClassInstance[@Type='TRTSpectrum']")
@@ -1003,8 +1035,12 @@ def spx_reader(filename, lazy=False):
     mode = guess_mode(spectrum.hv)
     results_xml = sp_node.find("./ClassInstance[@Type='TRTResult']")
     elements_xml = sp_node.find("./ClassInstance[@Type='TRTPSEElementList']")
+    data = spectrum.data
+    if metadata_only:
+        # the spectrum is part of the xml tree, which is parsed anyway
+        data = get_data_placeholder(data.shape, data.dtype)
     hy_spec = {
-        "data": spectrum.data,
+        "data": data,
         "axes": [
             {
                 "name": "Energy",
@@ -1240,6 +1276,7 @@ def py_parse_hypermap(virtual_file, shape, dtype, downsample=1):
     return vfa
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
@@ -1248,6 +1285,7 @@ def file_reader(
     downsample=1,
     cutoff_at_kV=None,
     instrument=None,
+    metadata_only=False,
 ):
     """
     Read a Bruker ``.bcf`` or ``.spx`` file.
@@ -1284,6 +1322,7 @@ def file_reader(
         the full channel range.
     instrument : str or None, default=None
         Can be either ``'TEM'`` or ``'SEM'``.
+    %s
 
     %s
 
@@ -1319,11 +1358,13 @@ def file_reader(
             downsample=downsample,
             cutoff_at_kV=cutoff_at_kV,
             instrument=instrument,
+            metadata_only=metadata_only,
         )
     elif ext == "spx":
         to_return = spx_reader(
             filename=filename,
             lazy=lazy,
+            metadata_only=metadata_only,
         )
     else:
         raise ValueError(f"'{ext}' is not a supported extension for the bruker reader.")
@@ -1331,7 +1372,7 @@ def file_reader(
     return to_return
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def bcf_reader(
@@ -1342,6 +1383,7 @@ def bcf_reader(
     downsample=1,
     cutoff_at_kV=None,
     instrument=None,
+    metadata_only=False,
 ):
     """
     Reads a bruker ``.bcf`` file and loads the data into the appropriate class,
@@ -1368,12 +1410,15 @@ def bcf_reader(
         crop or enlarge energy range at max values.
     instrument : str or None, default=None
         Can be either 'TEM' or 'SEM'.
+    metadata_only : bool, default=False
+        If True, the data are replaced by placeholders.
     """
 
     # objectified bcf file:
-    obj_bcf = BCF_reader(filename, instrument=instrument)
+    with phase("header"):
+        obj_bcf = BCF_reader(filename, instrument=instrument)
     if select_type == "image":
-        return bcf_images(obj_bcf)
+        return bcf_images(obj_bcf, metadata_only=metadata_only)
     elif select_type == "spectrum_image":
         return bcf_hyperspectra(
             obj_bcf,
@@ -1381,18 +1426,20 @@ def bcf_reader(
             downsample=downsample,
             cutoff_at_kV=cutoff_at_kV,
             lazy=lazy,
+            metadata_only=metadata_only,
         )
     else:
-        return bcf_images(obj_bcf) + bcf_hyperspectra(
+        return bcf_images(obj_bcf, metadata_only=metadata_only) + bcf_hyperspectra(
             obj_bcf,
             index=index,
             downsample=downsample,
             cutoff_at_kV=cutoff_at_kV,
             lazy=lazy,
+            metadata_only=metadata_only,
         )
 
 
-def bcf_images(obj_bcf):
+def bcf_images(obj_bcf, metadata_only=False):
     """return hyperspy required list of dict with sem
     images and metadata.
     """
@@ -1404,11 +1451,22 @@ def bcf_images(obj_bcf):
         for img2 in obj_bcf.header.overview.images:
             obj_bcf.add_filename_to_general(img2)
             images_list.append(img2)
+    if metadata_only:
+        # the images are stored in the header, which is parsed anyway
+        images_list = [
+            dict(img, data=get_data_placeholder(img["data"].shape, img["data"].dtype))
+            for img in images_list
+        ]
     return images_list
 
 
 def bcf_hyperspectra(
-    obj_bcf, index=None, downsample=None, cutoff_at_kV=None, lazy=False  # noqa
+    obj_bcf,
+    index=None,
+    downsample=None,
+    cutoff_at_kV=None,
+    lazy=False,
+    metadata_only=False,  # noqa
 ):
     """Return hyperspy required list of dict with eds
     hyperspectra and metadata.
@@ -1433,7 +1491,11 @@ For more information, check the 'Installing HyperSpy' section in the documentati
     mapping = get_mapping(mode)
     for index in indexes:
         hypermap = obj_bcf.parse_hypermap(
-            index=index, downsample=downsample, cutoff_at_kV=cutoff_at_kV, lazy=lazy
+            index=index,
+            downsample=downsample,
+            cutoff_at_kV=cutoff_at_kV,
+            lazy=lazy,
+            metadata_only=metadata_only,
         )
         eds_metadata = obj_bcf.header.get_spectra_metadata(index=index)
         hyperspectra.append(
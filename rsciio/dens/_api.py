@@ -22,7 +22,14 @@ import os
 import scipy
 from datetime import datetime
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 def _cnv_time(timestr):
@@ -39,7 +46,8 @@ def _bad_file(filename):
     raise AssertionError("Cannot interpret as DENS heater log: %s" % filename)
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a DENSsolutions DigiHeater logfile.
 
@@ -47,13 +55,14 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
     if lazy is not False:
         raise NotImplementedError("Lazy loading is not supported.")
 
-    with open(filename, "rt") as f:
+    with open_file(filename, "rt") as f:
         # Strip leading, empty lines
         line = str(f.readline())
         while line.strip() == "" and not f.closed:
@@ -123,6 +132,10 @@ def file_reader(filename, lazy=False):
         }
     ]
 
+    if metadata_only:
+        # the axes are calibrated from the data, which needs to be read anyway
+        temp_interp = get_data_placeholder(temp_interp.shape, temp_interp.dtype)
+
     dictionary = {
         "data": temp_interp,
         "axes": axes,
@@ -135,4 +148,9 @@ def file_reader(filename, lazy=False):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
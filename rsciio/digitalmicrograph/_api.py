@@ -28,9 +28,17 @@ import dateutil.parser
 import numpy as np
 from copy import deepcopy
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 import rsciio.utils.readfile as iou
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.exceptions import DM3TagIDError, DM3DataTypeError, DM3TagTypeError
+from rsciio.utils import cache
+from rsciio.utils.instrumentation import instrumented, open_file, phase
 from box import Box
 
 
@@ -613,7 +621,7 @@ class ImageObject(object):
     def _get_data_array(self):
         need_to_close = False
         if self.file.closed:
-            self.file = open(self.filename, "rb")
+            self.file = open_file(self.filename, "rb")
             need_to_close = True
         self.file.seek(self.imdict.ImageData.Data.offset)
         count = self.imdict.ImageData.Data.size
@@ -652,6 +660,18 @@ class ImageObject(object):
             )
         return data.reshape(self.shape, order=self.order)
 
+    def get_placeholder(self):
+        """Return a placeholder with the shape and dtype of :py:meth:`get_data`."""
+        if isinstance(self.imdict.ImageData.Data, np.ndarray):
+            data = self.imdict.ImageData.Data
+            return get_data_placeholder(data.shape, data.dtype)
+        dtype = self.dtype
+        if self.imdict.ImageData.DataType == 5:  # Old packed compled
+            dtype = "complex64"
+        elif self.imdict.ImageData.DataType in (8, 23):  # ABGR
+            dtype = [("R", "u1"), ("G", "u1"), ("B", "u1"), ("A", "u1")]
+        return get_data_placeholder(self.shape, dtype)
+
     def unpack_new_packed_complex(self, data):
         packed_shape = (self.shape[0], int(self.shape[1] / 2 + 1))
         data = data.reshape(packed_shape, order=self.order)
@@ -1248,7 +1268,8 @@ class ImageObject(object):
         return mapping
 
 
-def file_reader(filename, lazy=False, order=None, optimize=True):
+@instrumented
+def file_reader(filename, lazy=False, order=None, optimize=True, metadata_only=False):
     """
     Read a DM3/4 file and loads the data into the appropriate class.
 
@@ -1269,13 +1290,20 @@ def file_reader(filename, lazy=False, order=None, optimize=True):
         during data loading, which for large data sets can lead to a slow down on
         machines with limited memory. When operating on lazy signals, if ``True``,
         the chunks are optimised for the new axes configuration.
+    %s
 
     %s
     """
 
-    with open(filename, "rb") as f:
+    with open_file(filename, "rb") as f:
         dm = DigitalMicrographReader(f)
-        dm.parse_file()
+        with phase("header"):
+            header = cache.get_entry(filename, "digitalmicrograph.tags")
+            if header is None:
+                dm.parse_file()
+                header = (dm.dm_version, dm.endian, dm.tags_dict)
+                cache.set_entry(filename, "digitalmicrograph.tags", header)
+            dm.dm_version, dm.endian, dm.tags_dict = header
         images = [
             ImageObject(imdict, f, order=order)
             for imdict in dm.get_image_dictionaries()
@@ -1286,14 +1314,17 @@ def file_reader(filename, lazy=False, order=None, optimize=True):
 
         for image in images:
             dm.tags_dict["ImageList"]["TagGroup0"] = image.imdict.to_dict()
-            axes = image.get_axes_dict()
-            mp = image.get_metadata()
+            with phase("metadata"):
+                axes = image.get_axes_dict()
+                mp = image.get_metadata()
             mp["General"]["original_filename"] = os.path.split(filename)[1]
             post_process = []
             if image.to_spectrum is True:
                 post_process.append(lambda s: s.to_signal1D(optimize=optimize))
             post_process.append(lambda s: s.squeeze())
-            if lazy:
+            if metadata_only:
+                data = image.get_placeholder()
+            elif lazy:
                 image.filename = filename
                 from dask.array import from_delayed
                 import dask.delayed as dd
@@ -1301,7 +1332,8 @@ def file_reader(filename, lazy=False, order=None, optimize=True):
                 val = dd(image.get_data, pure=True)()
                 data = from_delayed(val, shape=image.shape, dtype=image.dtype)
             else:
-                data = image.get_data()
+                with phase("data"):
+                    data = image.get_data()
             # in the event there are multiple signals contained within this
             # DM file, it is important to make a "deepcopy" of the metadata
             # and original_metadata, since they are changed in each iteration
@@ -1322,4 +1354,4 @@ def file_reader(filename, lazy=False, order=None, optimize=True):
     return imd
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
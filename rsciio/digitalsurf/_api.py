@@ -50,8 +50,15 @@ import warnings
 # DictionaryTreeBrowser class handles the fancy metadata dictionnaries
 # from hyperspy.misc.utils import DictionaryTreeBrowser
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.exceptions import MountainsMapFileError
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -98,10 +105,12 @@ class DigitalSurfHandler(object):
         21: "_HYPCARD",
     }
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, metadata_only=False):
         # We do not need to check for file existence here because
         # io module implements it in the load function
         self.filename = filename
+        # When only reading the metadata, the datapoints are skipped
+        self._metadata_only = metadata_only
 
         # The signal_dict dictionnary has to be returned by the
         # file_reader function. Apparently original_metadata needs
@@ -454,7 +463,7 @@ class DigitalSurfHandler(object):
         of objects. The file is thus read iteratively and from metadata of the
         first file"""
 
-        with open(self.filename, "rb") as f:
+        with open_file(self.filename, "rb") as f:
             # We read the first object
             self._read_single_sur_object(f)
             # We append the first object to the content list
@@ -1330,6 +1339,10 @@ class DigitalSurfHandler(object):
             # if Npts_channel is not 0:
             #    readsize*=Npts_channel
 
+            if self._metadata_only:
+                file.seek(readsize, 1)
+                return get_data_placeholder((readsize // psize,), float)
+
             # Read the exact size of the data
             _points = np.frombuffer(file.read(readsize), dtype=dtype)
             # _points = np.fromstring(file.read(readsize),dtype=dtype)
@@ -1348,6 +1361,10 @@ class DigitalSurfHandler(object):
                 rawLengthData.append(self._get_uint32(file))
                 zipLengthData.append(self._get_uint32(file))
 
+            if self._metadata_only:
+                file.seek(sum(zipLengthData), 1)
+                return get_data_placeholder((sum(rawLengthData) // psize,), float)
+
             # We now initialize an empty binary string to store the results
             rawData = b""
             for i in range(_directoryCount):
@@ -1386,7 +1403,8 @@ class DigitalSurfHandler(object):
         self._set_str(file, val, datasize)
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a mountainsmap ``.sur`` file.
 
@@ -1394,20 +1412,31 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
     if lazy is not False:
         raise NotImplementedError("Lazy loading is not supported.")
-    ds = DigitalSurfHandler(filename)
+    ds = DigitalSurfHandler(filename, metadata_only=metadata_only)
 
     ds._read_sur_file()
 
     surdict = ds._build_sur_dict()
+    if metadata_only:
+        # series of objects are stacked when building the signal dictionary
+        surdict["data"] = get_data_placeholder(
+            surdict["data"].shape, surdict["data"].dtype
+        )
 
     return [
         surdict,
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
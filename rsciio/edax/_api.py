@@ -27,11 +27,15 @@ import numpy as np
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    CHUNKS_READ_DOC,
     ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
 )
+from rsciio.utils.array import get_data_placeholder, get_signal_aware_dask_array
 from rsciio.utils.tools import sarray2dict
 from rsciio.utils.elements import atomic_number2name
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -684,7 +688,15 @@ def _add_spc_metadata(metadata, spc_header):
     return metadata
 
 
-def spc_reader(filename, lazy=False, endianess="<", load_all_spc=False, **kwds):
+def spc_reader(
+    filename,
+    lazy=False,
+    endianess="<",
+    load_all_spc=False,
+    metadata_only=False,
+    chunks="auto",
+    **kwds,
+):
     """
     Read data from an SPC spectrum specified by filename.
 
@@ -696,12 +708,14 @@ def spc_reader(filename, lazy=False, endianess="<", load_all_spc=False, **kwds):
     load_all_spc : bool, Default=False
         Switch to control whether the complete .spc header is read, or just the
         important parts for import into RosettaSciIO.
+    %s
+    %s
     **kwds
         Remaining arguments are passed to the Numpy ``memmap`` function
 
     %s
     """
-    with open(filename, "rb") as f:
+    with open_file(filename, "rb") as f:
         _logger.debug(" Reading {}".format(filename))
         spc_header = __get_spc_header(f, endianess, load_all_spc)
 
@@ -715,10 +729,13 @@ def spc_reader(filename, lazy=False, endianess="<", load_all_spc=False, **kwds):
         if lazy:
             mode = "r"
 
-        # Read data from file into a numpy memmap object
-        data = np.memmap(
-            f, mode=mode, offset=data_offset, dtype="u4", shape=(1, nz), **kwds
-        ).squeeze()
+        if metadata_only:
+            data = get_data_placeholder((1, nz), "u4").squeeze()
+        else:
+            # Read data from file into a numpy memmap object
+            data = np.memmap(
+                f, mode=mode, offset=data_offset, dtype="u4", shape=(1, nz), **kwds
+            ).squeeze()
 
     # create the energy axis dictionary:
     energy_axis = {
@@ -743,6 +760,9 @@ def spc_reader(filename, lazy=False, endianess="<", load_all_spc=False, **kwds):
     }
     metadata = _add_spc_metadata(metadata, spc_dict)
 
+    if lazy and not metadata_only:
+        data = get_signal_aware_dask_array(data, [0], chunks=chunks)
+
     dictionary = {
         "data": data,
         "axes": [energy_axis],
@@ -755,7 +775,14 @@ def spc_reader(filename, lazy=False, endianess="<", load_all_spc=False, **kwds):
     ]
 
 
-spc_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, ENDIANESS_DOC, RETURNS_DOC)
+spc_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
 
 
 def spd_reader(
@@ -765,6 +792,8 @@ def spd_reader(
     spc_fname=None,
     ipr_fname=None,
     load_all_spc=False,
+    metadata_only=False,
+    chunks="auto",
     **kwds,
 ):
     """
@@ -792,12 +821,14 @@ def spd_reader(
     load_all_spc : bool, Default=False
         Switch to control whether the complete .spc header is read, or just the
         important parts for import into HyperSpy.
+    %s
+    %s
     **kwds
         Remaining arguments are passed to the Numpy ``memmap`` function.
 
     %s
     """
-    with open(filename, "rb") as f:
+    with open_file(filename, "rb") as f:
         spd_header = np.fromfile(f, dtype=get_spd_dtype_list(endianess), count=1)
 
         original_metadata = {"spd_header": sarray2dict(spd_header)}
@@ -814,13 +845,16 @@ def spd_reader(
         if lazy:
             mode = "r"
 
-        # Read data from file into a numpy memmap object
-        data = (
-            np.memmap(f, mode=mode, offset=data_offset, dtype=data_type, **kwds)
-            .squeeze()
-            .reshape((nz, nx, ny), order="F")
-            .T
-        )
+        if metadata_only:
+            data = get_data_placeholder((ny, nx, nz), data_type)
+        else:
+            # Read data from file into a numpy memmap object
+            data = (
+                np.memmap(f, mode=mode, offset=data_offset, dtype=data_type, **kwds)
+                .squeeze()
+                .reshape((nz, nx, ny), order="F")
+                .T
+            )
 
     # Convert char arrays to strings:
     original_metadata["spd_header"]["tag"] = spd_header["tag"][0].view("S16")[0]
@@ -850,7 +884,7 @@ def spd_reader(
 
     # Read the .ipr header (if possible)
     if read_ipr:
-        with open(ipr_fname, "rb") as f:
+        with open_file(ipr_fname, "rb") as f:
             _logger.debug(" From .spd reader - " "reading .ipr {}".format(ipr_fname))
             ipr_header = __get_ipr_header(f, endianess)
             original_metadata["ipr_header"] = sarray2dict(ipr_header)
@@ -871,7 +905,7 @@ def spd_reader(
 
     # Read the .spc header (if possible)
     if read_spc:
-        with open(spc_fname, "rb") as f:
+        with open_file(spc_fname, "rb") as f:
             _logger.debug(" From .spd reader - " "reading .spc {}".format(spc_fname))
             spc_header = __get_spc_header(f, endianess, load_all_spc)
             spc_dict = sarray2dict(spc_header)
@@ -936,6 +970,9 @@ def spd_reader(
     # Define navigation and signal axes:
     axes = [y_axis, x_axis, energy_axis]
 
+    if lazy and not metadata_only:
+        data = get_signal_aware_dask_array(data, [2], chunks=chunks)
+
     dictionary = {
         "data": data,
         "axes": axes,
@@ -948,9 +985,17 @@ def spd_reader(
     ]
 
 
-spd_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, ENDIANESS_DOC, RETURNS_DOC)
+spd_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
@@ -958,6 +1003,8 @@ def file_reader(
     spc_fname=None,
     ipr_fname=None,
     endianess="<",
+    metadata_only=False,
+    chunks="auto",
     **kwds,
 ):
     """
@@ -988,6 +1035,8 @@ def file_reader(
         Otherwise, the name of the .ipr file to use for spatial calibration
         can be explicitly given as a string.
     %s
+    %s
+    %s
     **kwds : dict, optional
         Remaining arguments are passed to :py:class:`numpy.memmap`.
 
@@ -1007,12 +1056,29 @@ def file_reader(
             spc_fname=spc_fname,
             ipr_fname=ipr_fname,
             load_all_spc=load_all_spc,
+            metadata_only=metadata_only,
+            chunks=chunks,
             **kwds,
         )
     elif ext == "spc":
-        return spc_reader(filename, lazy, endianess, load_all_spc=load_all_spc, **kwds)
+        return spc_reader(
+            filename,
+            lazy,
+            endianess,
+            load_all_spc=load_all_spc,
+            metadata_only=metadata_only,
+            chunks=chunks,
+            **kwds,
+        )
     else:
         raise ValueError(f"'{ext}' is not a supported extension for the edax reader.")
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, ENDIANESS_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
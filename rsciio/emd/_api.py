@@ -34,22 +34,26 @@ import logging
 
 import h5py
 import numpy as np
-import dask.array as da
 from dateutil import tz
 
 from rsciio._docstrings import (
     CHUNKS_DOC,
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
-from rsciio.utils.tools import _UREG, DTBox
+from rsciio.utils.array import get_data_placeholder, get_h5py_dask_array
+from rsciio.utils.tools import _UREG, DTBox, deferred_import
 from rsciio.utils.elements import atomic_number2name
 import rsciio.utils.fei_stream_readers as stream_readers
 from rsciio._hierarchical import get_signal_chunks
+from rsciio.utils import cache
 
 
+da = deferred_import("dask.array")
+
 EMD_VERSION = "0.2"
 
 _logger = logging.getLogger(__name__)
@@ -67,7 +71,9 @@ class EMD_NCEM:
         List of dictionaries which are passed to the file_reader.
     """
 
-    def read_file(self, file, lazy=None, dataset_path=None, stack_group=None):
+    def read_file(
+        self, file, lazy=None, dataset_path=None, stack_group=None, metadata_only=False
+    ):
         """
         Read the data from an emd file
 
@@ -84,9 +90,13 @@ class EMD_NCEM:
             Stack datasets of groups with common name. Relevant for emd file
             version >= 0.5 where groups can be named 'group0000', 'group0001',
             etc.
+        metadata_only : bool, optional
+            Don't read the data and use placeholders instead. The default is
+            False.
         """
         self.file = file
         self.lazy = lazy
+        self.metadata_only = metadata_only
 
         if isinstance(dataset_path, list):
             if stack_group:
@@ -246,7 +256,16 @@ class EMD_NCEM:
         if None in array_list:
             raise IOError("Dataset can't be found.")
 
-        if len(array_list) > 1:
+        if self.metadata_only:
+            shape = array_list[0].shape
+            if transpose_required:
+                shape = shape[::-1]
+            if len(array_list) > 1:
+                shape = (len(array_list),) + shape
+            data = get_data_placeholder(shape, array_list[0].dtype)
+            if len(array_list) > 1:
+                data = data.squeeze()
+        elif len(array_list) > 1:
             # Squeeze the data only when
             if self.lazy:
                 data_list = [da.from_array(*self._read_dataset(d)) for d in array_list]
@@ -598,6 +617,7 @@ class FeiEMDReader(object):
         SI_dtype=None,
         load_SI_image_stack=False,
         lazy=False,
+        metadata_only=False,
     ):
         # TODO: Finish lazy implementation using the `FrameLocationTable`
         # Parallelise streams reading
@@ -612,6 +632,7 @@ class FeiEMDReader(object):
         self.SI_data_dtype = SI_dtype
         self.load_SI_image_stack = load_SI_image_stack
         self.lazy = lazy
+        self.metadata_only = metadata_only
         self.detector_name = None
         self.original_metadata = {}
 
@@ -682,8 +703,10 @@ class FeiEMDReader(object):
     def _read_spectrum(self, spectrum_group, spectrum_sub_group_key):
         spectrum_sub_group = spectrum_group[spectrum_sub_group_key]
         dataset = spectrum_sub_group["Data"]
-        if self.lazy:
-            data = da.from_array(dataset, chunks=dataset.chunks).T
+        if self.metadata_only:
+            data = get_data_placeholder(dataset.shape, dataset.dtype).T
+        elif self.lazy:
+            data = get_h5py_dask_array(dataset, chunks="auto").T
         else:
             data = dataset[:].T
         original_metadata = _parse_metadata(spectrum_group, spectrum_sub_group_key)
@@ -775,8 +798,11 @@ class FeiEMDReader(object):
             _logger.debug("Found an FFT or DPC, loading as Complex2DSignal")
             real = h5data.dtype.descr[0][0]
             imag = h5data.dtype.descr[1][0]
-            if self.lazy:
-                data = da.from_array(h5data, chunks=h5data.chunks)
+            if self.metadata_only:
+                data = get_data_placeholder(h5data.shape, "complex64")
+                data = np.rollaxis(data, axis=2)
+            elif self.lazy:
+                data = get_h5py_dask_array(h5data, chunks="auto")
                 data = data[real] + 1j * data[imag]
                 data = da.transpose(data, axes=[2, 0, 1])
             else:
@@ -786,9 +812,12 @@ class FeiEMDReader(object):
                 # Set the axes in frame, y, x order
                 data = np.rollaxis(data, axis=2)
         else:
-            if self.lazy:
+            if self.metadata_only:
+                data = get_data_placeholder(h5data.shape, "float64")
+                data = np.rollaxis(data, axis=2)
+            elif self.lazy:
                 data = da.transpose(
-                    da.from_array(h5data, chunks=h5data.chunks), axes=[2, 0, 1]
+                    get_h5py_dask_array(h5data, chunks="auto"), axes=[2, 0, 1]
                 )
             else:
                 # Workaround for a h5py bug https://github.com/h5py/h5py/issues/977
@@ -1055,7 +1084,7 @@ class FeiEMDReader(object):
             s0 = _read_stream(subgroup_keys[0])
             streams = [s0]
             # add other stream streams
-            if len(subgroup_keys) > 1:
+            if len(subgroup_keys) > 1 and not self.metadata_only:
                 for key in subgroup_keys[1:]:
                     stream_data = spectrum_stream_group[key]["Data"][:].T[0]
                     if self.lazy:
@@ -1069,7 +1098,7 @@ class FeiEMDReader(object):
                         )
         else:
             streams = [_read_stream(key) for key in subgroup_keys]
-        if self.lazy:
+        if self.lazy and not self.metadata_only:
             for stream in streams:
                 sa = stream.spectrum_image.astype(self.SI_data_dtype)
                 stream.spectrum_image = sa
@@ -1373,8 +1402,15 @@ class FeiSpectrumStream(object):
             self.reader.SI_data_dtype = acquisition_settings["StreamEncoding"]
         # Parse the rest of the metadata for storage
         self.original_metadata = _parse_sub_data_group_metadata(stream_group)
-        # If last_frame is None, compute it
-        stream_data = self.stream_group["Data"][:].T[0]
+        # If last_frame is None, get it from the cache or compute it
+        cache_name = f"emd.number_of_frames.{stream_group.name}"
+        if self.reader.last_frame is None:
+            last_frame = cache.get_entry(self.reader.filename, cache_name)
+            if last_frame is not None:
+                self.reader.last_frame = last_frame
+                self.reader.number_of_frames = last_frame
+        if self.reader.last_frame is None or not self.reader.metadata_only:
+            stream_data = self.stream_group["Data"][:].T[0]
         if self.reader.last_frame is None:
             # The information could not be retrieved from metadata
             # we compute, which involves iterating once over the whole stream.
@@ -1389,6 +1425,7 @@ class FeiSpectrumStream(object):
             )
             self.reader.last_frame = last_frame
             self.reader.number_of_frames = last_frame
+            cache.set_entry(self.reader.filename, cache_name, last_frame)
         self.original_metadata["ImportedDataParameter"] = {
             "First_frame": self.reader.first_frame,
             "Last_frame": self.reader.last_frame,
@@ -1397,7 +1434,9 @@ class FeiSpectrumStream(object):
             "Number_of_channels": self.bin_count,
         }
         # Convert stream to spectrum image
-        if self.reader.lazy:
+        if self.reader.metadata_only:
+            self.spectrum_image = self.get_placeholder()
+        elif self.reader.lazy:
             self.spectrum_image = self.stream_to_sparse_array(stream_data=stream_data)
         else:
             self.spectrum_image = self.stream_to_array(stream_data=stream_data)
@@ -1410,6 +1449,18 @@ class FeiSpectrumStream(object):
         om_br = self.original_metadata["BinaryResult"]
         return om_br["PixelSize"], om_br["Offset"], om_br["PixelUnitX"]
 
+    def get_placeholder(self):
+        """Return a placeholder with the shape and dtype of the spectrum image."""
+        reader = self.reader
+        shape = (
+            reader.spatial_shape[0],
+            reader.spatial_shape[1],
+            int(self.bin_count / reader.rebin_energy),
+        )
+        if not reader.sum_frames:
+            shape = (reader.last_frame - reader.first_frame,) + shape
+        return get_data_placeholder(shape, reader.SI_data_dtype)
+
     def stream_to_sparse_array(self, stream_data):
         """Convert stream in sparse array
 
@@ -1550,6 +1601,7 @@ def file_reader(
     rebin_energy=1,
     SI_dtype=None,
     load_SI_image_stack=False,
+    metadata_only=False,
 ):
     """
     Read EMD file, which can be an NCEM or a Velox variant of the EMD format.
@@ -1600,6 +1652,7 @@ def file_reader(
         simultaneously with the EDS spectrum image. This option can be useful to
         monitor any specimen changes during the acquisition or to correct the
         spatial drift in the spectrum image by using the STEM images.
+    %s
 
     %s
     """
@@ -1618,20 +1671,25 @@ def file_reader(
                 rebin_energy=rebin_energy,
                 SI_dtype=SI_dtype,
                 load_SI_image_stack=load_SI_image_stack,
+                metadata_only=metadata_only,
             )
             emd_reader.read_file(file)
         elif is_EMD_NCEM(file):
             _logger.debug("EMD file is a Berkeley variant.")
             emd_reader = EMD_NCEM()
             emd_reader.read_file(
-                file, lazy=lazy, dataset_path=dataset_path, stack_group=stack_group
+                file,
+                lazy=lazy,
+                dataset_path=dataset_path,
+                stack_group=stack_group,
+                metadata_only=metadata_only,
             )
         else:
             raise IOError("The file is not a supported EMD file.")
     except Exception as e:
         raise e
     finally:
-        if not lazy:
+        if not lazy or metadata_only:
             file.close()
 
     dictionaries = emd_reader.dictionaries
@@ -1639,7 +1697,7 @@ def file_reader(
     return dictionaries
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def file_writer(filename, signal, chunks=None, **kwds):
@@ -22,20 +22,34 @@ import xml.etree.ElementTree as ET
 import numpy as np
 import logging
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder, get_signal_aware_dask_array
 from rsciio.utils.tools import _UREG
 from rsciio.utils.tools import convert_xml_to_dict
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
 
 
-def _read_raw(info, fp, lazy=False):
+def _read_raw(info, fp, lazy=False, metadata_only=False):
     raw_height = info["raw_height"]
     width = info["width"]
     height = info["height"]
 
-    if lazy:
+    if metadata_only:
+        if "series_count" in info.keys():
+            size = (info["series_count"], height, width)
+        else:
+            size = (info["scan_x"], info["scan_y"], height, width)
+        return get_data_placeholder(size, "<f4")
+    elif lazy:
         data = np.memmap(fp, dtype="<f4", mode="r")
     else:
         data = np.fromfile(fp, dtype="<f4")
@@ -51,7 +65,8 @@ def _read_raw(info, fp, lazy=False):
 
 
 def _parse_xml(filename):
-    tree = ET.parse(filename)
+    with open_file(filename, "rb") as f:
+        tree = ET.parse(f)
     om = convert_xml_to_dict(tree.getroot())
 
     info = {
@@ -93,7 +108,8 @@ def _convert_scale_units(value, units, factor=1):
     return converted_value, converted_units
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False, chunks="auto"):
     """
     Read file format used by the Electron Microscope Pixel Array Detector (EMPAD).
 
@@ -101,6 +117,9 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
+    %s
+
     %s
     """
     om, info = _parse_xml(filename)
@@ -185,10 +204,18 @@ def file_reader(filename, lazy=False):
             )
             index_in_array += 1
 
-    data = _read_raw(info, os.path.join(dname, info["raw_filename"]), lazy=lazy)
+    data = _read_raw(
+        info,
+        os.path.join(dname, info["raw_filename"]),
+        lazy=lazy,
+        metadata_only=metadata_only,
+    ).squeeze()
+    if lazy and not metadata_only:
+        signal_axes = [i for i, axis in enumerate(axes) if not axis["navigate"]]
+        data = get_signal_aware_dask_array(data, signal_axes, chunks=chunks)
 
     dictionary = {
-        "data": data.squeeze(),
+        "data": data,
         "axes": axes,
         "metadata": md,
         "original_metadata": om.to_dict(),
@@ -199,4 +226,10 @@ def file_reader(filename, lazy=False):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
@@ -25,7 +25,9 @@ from enum import IntEnum, EnumMeta
 import numpy as np
 from numpy.polynomial.polynomial import polyfit
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -110,11 +112,14 @@ class Scaling_Type(IntEnum, metaclass=DefaultEnumMeta):
 
 
 class IMGReader:
-    def __init__(self, file, filesize, filename, use_uniform_signal_axes):
+    def __init__(
+        self, file, filesize, filename, use_uniform_signal_axes, metadata_only=False
+    ):
         self._file_obj = file
         self._filesize = filesize
         self._original_filename = filename
         self._use_uniform_signal_axes = use_uniform_signal_axes
+        self._metadata_only = metadata_only
 
         self.original_metadata = {}
         self._h_lines = None
@@ -186,7 +191,11 @@ class IMGReader:
             dtype = "uint32"
         else:
             raise RuntimeError(f"reading type: {file_type} not implemented")
-        data = self.__read_numeric(dtype, size=w_px * self._h_lines)
+        if self._metadata_only:
+            # unsigned integers are converted to int64, see `__read_numeric`
+            data = get_data_placeholder((w_px * self._h_lines,), "<i8")
+        else:
+            data = self.__read_numeric(dtype, size=w_px * self._h_lines)
         self.original_metadata.update(header)
         return data, comment
 
@@ -271,7 +280,7 @@ class IMGReader:
                 axes_sizes.append(ax["size"])
 
         self.data = np.reshape(self.data, axes_sizes)
-        if self._reverse_signal:
+        if self._reverse_signal and not self._metadata_only:
             self.data = np.ascontiguousarray(self.data[:, ::-1])
 
     @staticmethod
@@ -495,7 +504,10 @@ class IMGReader:
         return metadata
 
 
-def file_reader(filename, lazy=False, use_uniform_signal_axes=False, **kwds):
+@instrumented
+def file_reader(
+    filename, lazy=False, use_uniform_signal_axes=False, metadata_only=False, **kwds
+):
     """Reads Hamamatsu's ``.img`` file.
 
     Parameters
@@ -507,18 +519,20 @@ def file_reader(filename, lazy=False, use_uniform_signal_axes=False, **kwds):
         If ``True``, the ``scale`` attribute is calculated from the average delta
         along the signal axis and a warning is raised in case the delta varies
         by more than 1 percent.
+    %s
 
     %s
     """
     filesize = Path(filename).stat().st_size
     original_filename = Path(filename).name
     result = {}
-    with open(str(filename), "rb") as f:
+    with open_file(str(filename), "rb") as f:
         img = IMGReader(
             f,
             filesize=filesize,
             filename=original_filename,
             use_uniform_signal_axes=use_uniform_signal_axes,
+            metadata_only=metadata_only,
         )
 
         result["data"] = img.data
@@ -531,4 +545,4 @@ def file_reader(filename, lazy=False, use_uniform_signal_axes=False, **kwds):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
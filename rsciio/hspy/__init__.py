@@ -1,12 +1,16 @@
 from ._api import (
+    file_appender,
     file_reader,
     file_writer,
+    write_virtual_dataset,
 )
 
 
 __all__ = [
+    "file_appender",
     "file_reader",
     "file_writer",
+    "write_virtual_dataset",
 ]
 
 
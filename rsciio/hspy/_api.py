@@ -16,24 +16,44 @@
 # You should have received a copy of the GNU General Public License
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import functools
+import importlib.util
 import logging
+import os
 from packaging.version import Version
 from pathlib import Path
+import zlib
 
-import dask.array as da
 import h5py
+import numpy as np
 
 from rsciio._docstrings import (
+    ACCESS_PATTERN_DOC,
+    CHUNKS_ALIGNED_READ_DOC,
     CHUNKS_DOC,
     COMPRESSION_HDF5_DOC,
     COMPRESSION_HDF5_NOTES_DOC,
     FILENAME_DOC,
     LAZY_DOC,
+    LAZY_METADATA_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
+    SLICE_DOC,
+    WRITE_SUMMARY_DOC,
 )
-from rsciio._hierarchical import HierarchicalWriter, HierarchicalReader, version
-from rsciio.utils.tools import get_file_handle
+from rsciio._hierarchical import (
+    HierarchicalAppender,
+    HierarchicalReader,
+    HierarchicalWriter,
+    require_signal_group,
+    version,
+)
+from rsciio.utils.array import get_h5py_dask_array
+from rsciio.utils.tools import get_file_handle, deferred_import
+
+
+da = deferred_import("dask.array")
 
 
 _logger = logging.getLogger(__name__)
@@ -53,6 +73,149 @@ class HyperspyReader(HierarchicalReader):
         self.Group = h5py.Group
         self.unicode_kwds = {"dtype": h5py.special_dtype(vlen=str)}
 
+    @staticmethod
+    def _get_dask_array(dataset, chunks=None):
+        # also size the chunk cache of the dataset for the chunks
+        storage_chunks = None
+        if dataset.is_virtual and "chunks" in dataset.attrs:
+            # chunks of the source datasets, see `write_virtual_dataset`
+            storage_chunks = tuple(int(c) for c in dataset.attrs["chunks"])
+        return get_h5py_dask_array(
+            dataset, chunks=chunks, storage_chunks=storage_chunks
+        )
+
+    def _read_axes(self, group, lazy=False):
+        axes = super()._read_axes(group, lazy=lazy)
+        if self.file.swmr_mode and axes:
+            # the attributes modified by a writer in SWMR mode are not
+            # visible to the readers, but the shape of the data is
+            axes[0]["size"] = group["data"].shape[0]
+        return axes
+
+    def group2signaldict(self, group, lazy=False, **kwds):
+        exp = super().group2signaldict(group, lazy=lazy, **kwds)
+        if self.file.swmr_mode and lazy:
+            exp["refresh"] = functools.partial(
+                self._refresh_signaldict, exp, group, lazy=lazy, **kwds
+            )
+        return exp
+
+    def _refresh_signaldict(self, exp, group, lazy=False, **kwds):
+        """
+        Replace the data and the axes of the signal dictionary ``exp`` by
+        those of the file, including the data appended since it was read.
+        """
+        kwds.pop("lazy_metadata", None)
+        group["data"].refresh()
+        axes = self._read_axes(group, lazy=lazy)
+        exp["axes"], exp["data"] = self._read_data(group, axes, lazy=lazy, **kwds)
+        return exp
+
+
+# Filters registered by hdf5plugin
+_BLOSC_FILTER = 32001
+_ZSTD_FILTER = 32015
+# Compressor codes of the blosc filter
+_BLOSC_COMPRESSORS = ["blosclz", "lz4", "lz4hc", "snappy", "zlib", "zstd"]
+
+
+def _shuffle(buffer, itemsize):
+    # same byte transposition as the HDF5 shuffle filter
+    return np.frombuffer(buffer, np.uint8).reshape(-1, itemsize).T.tobytes()
+
+
+def _blosc_compress(buffer, cd_values):
+    import blosc
+
+    # default values of the filter for the parameters not given
+    cd_values = tuple(cd_values) + (0, 0, 1, 0, 5, 1, 0)[len(cd_values) :]
+    typesize, clevel, shuffle, compressor = (cd_values[i] for i in (2, 4, 5, 6))
+    compressed = blosc.compress(
+        buffer,
+        typesize=typesize if typesize <= blosc.MAX_TYPESIZE else 1,
+        clevel=clevel,
+        shuffle=shuffle,
+        cname=_BLOSC_COMPRESSORS[compressor],
+    )
+    # the HDF5 filter fails, and is skipped, when the chunk isn't compressible
+    return compressed if len(compressed) <= len(buffer) else None
+
+
+def _zstd_compress(buffer, cd_values):
+    import zstandard
+
+    level = cd_values[0] if cd_values else 0
+    return zstandard.ZstdCompressor(level=level).compress(buffer)
+
+
+def _get_chunk_encoder(dset):
+    """
+    Return a function applying the filter pipeline of the dataset to a chunk,
+    which returns the filtered bytes and the filter mask, or None if one of
+    the filters isn't supported.
+    """
+    if dset.chunks is None or dset.dtype.hasobject:
+        return None
+    plist = dset.id.get_create_plist()
+    itemsize = dset.dtype.itemsize
+    filters = []
+    for i in range(plist.get_nfilters()):
+        code, _, cd_values, _ = plist.get_filter(i)
+        if code == h5py.h5z.FILTER_SHUFFLE:
+            if itemsize == 1:
+                # the HDF5 filter doesn't change the data
+                continue
+            filters.append((i, lambda b: _shuffle(b, itemsize)))
+        elif code == h5py.h5z.FILTER_DEFLATE:
+            filters.append((i, lambda b, level=cd_values[0]: zlib.compress(b, level)))
+        elif code == _BLOSC_FILTER and importlib.util.find_spec("blosc"):
+            filters.append((i, lambda b, cd=cd_values: _blosc_compress(b, cd)))
+        elif code == _ZSTD_FILTER and importlib.util.find_spec("zstandard"):
+            filters.append((i, lambda b, cd=cd_values: _zstd_compress(b, cd)))
+        else:
+            return None
+
+    def encode(chunk):
+        buffer = chunk.tobytes()
+        filter_mask = 0
+        for i, function in filters:
+            filtered = function(buffer)
+            if filtered is None:
+                filter_mask |= 1 << i
+            else:
+                buffer = filtered
+        return buffer, filter_mask
+
+    return encode
+
+
+class _DirectChunkTarget:
+    """
+    Target of :py:func:`dask.array.store` compressing the blocks, which match
+    the chunks of the dataset, in the threads of the dask scheduler and
+    writing them with ``write_direct_chunk``, bypassing the HDF5 filter
+    pipeline, which runs on a single thread.
+    """
+
+    def __init__(self, dset, encode):
+        self.dset = dset
+        self.encode = encode
+        self.shape = dset.shape
+        self.dtype = dset.dtype
+        self.chunks = dset.chunks
+
+    def __setitem__(self, region, chunk):
+        dset = self.dset
+        chunk = np.asarray(chunk, dtype=dset.dtype)
+        if chunk.shape != dset.chunks:
+            # HDF5 stores entire edge chunks, padded with the fill value
+            padded = np.full(dset.chunks, dset.fillvalue, dtype=dset.dtype)
+            padded[tuple(slice(0, s) for s in chunk.shape)] = chunk
+            chunk = padded
+        buffer, filter_mask = self.encode(np.ascontiguousarray(chunk))
+        offset = tuple(r.start for r in region)
+        dset.id.write_direct_chunk(offset, buffer, filter_mask)
+
 
 class HyperspyWriter(HierarchicalWriter):
     """
@@ -62,37 +225,85 @@ class HyperspyWriter(HierarchicalWriter):
 
     target_size = 1e6
 
-    def __init__(self, file, signal, expg, **kwds):
+    def __init__(self, file, signal, expg, compression_workers=None, **kwds):
         super().__init__(file, signal, expg, **kwds)
         self.Dataset = h5py.Dataset
         self.Group = h5py.Group
         self.unicode_kwds = {"dtype": h5py.special_dtype(vlen=str)}
-        self.ragged_kwds = {"dtype": h5py.special_dtype(vlen=signal["data"][0].dtype)}
+        if signal["data"].dtype == np.dtype("O"):
+            self.ragged_kwds = {
+                "dtype": h5py.special_dtype(vlen=signal["data"][0].dtype)
+            }
+        self.store_kwds = {"compression_workers": compression_workers}
 
     @staticmethod
-    def _store_data(data, dset, group, key, chunks):
+    def _store_data(
+        data, dset, group, key, chunks, compression_workers=None, extra_stores=()
+    ):
+        # the sources of `extra_stores` are computed from the lazy data and
+        # stored with it, see `HierarchicalWriter._write_summary`
+        sources = [source for source, _ in extra_stores]
+        targets = [target for _, target in extra_stores]
+        compute_kwds = {}
+        if compression_workers is not None:
+            encode = _get_chunk_encoder(dset)
+            if encode is not None:
+                if not isinstance(data, da.Array):
+                    data = da.from_array(data, chunks=dset.chunks)
+                dset = _DirectChunkTarget(dset, encode)
+                # the blocks are compressed concurrently, h5py serialises the
+                # writes
+                compute_kwds = dict(
+                    lock=False, scheduler="threads", num_workers=compression_workers
+                )
+            else:
+                _logger.info(
+                    f"The filters of the dataset '{key}' can't be applied in "
+                    "parallel, the chunks are compressed by HDF5."
+                )
         if isinstance(data, da.Array):
+            # each block is computed once, for the data and the summary
             if data.chunks != dset.chunks:
                 data = data.rechunk(dset.chunks)
-            da.store(data, dset)
+            da.store([data] + sources, [dset] + targets, **compute_kwds)
         elif data.flags.c_contiguous:
             dset.write_direct(data)
         else:
             dset[:] = data
 
     @staticmethod
-    def _get_object_dset(group, data, key, chunks, **kwds):
-        """Creates a h5py dataset object for saving ragged data"""
-        # For saving ragged array
-        if chunks is None:
-            chunks = 1
+    def _write_region(data, dset, region):
+        # h5py broadcasts an object array of arrays of the same length
+        # to a 2D array when using `__setitem__`
+        dset.write_direct(data, dest_sel=region)
+
+    @staticmethod
+    def _get_object_dset(group, data, key, chunks, dtype, **kwds):
+        """
+        Creates a h5py dataset object for saving ragged data, ``dtype`` is the
+        dtype of the arrays.
+        """
         dset = group.require_dataset(
-            key, chunks, dtype=h5py.special_dtype(vlen=data.flatten()[0].dtype), **kwds
+            key,
+            data.shape,
+            dtype=h5py.special_dtype(vlen=dtype),
+            chunks=chunks,
+            **kwds,
         )
         return dset
 
 
-def file_reader(filename, lazy=False, **kwds):
+def file_reader(
+    filename,
+    lazy=False,
+    metadata_only=False,
+    lazy_metadata=False,
+    navigation_slice=None,
+    signal_slice=None,
+    chunks=None,
+    swmr=False,
+    **kwds,
+):
     """
     Read data from hdf5-files saved with the HyperSpy hdf5-format
     specification (``.hspy``).
@@ -101,6 +312,17 @@ def file_reader(filename, lazy=False, **kwds):
     ----------
     %s
     %s
+    %s
+    %s
+    %s
+    %s
+    swmr : bool, default=False
+        If ``True``, open the file in single-writer/multiple-reader (SWMR)
+        mode to read a file being written by :py:func:`~.hspy.file_appender`
+        with ``swmr=True``. Requires ``lazy=True``. The ``'refresh'`` item of
+        the returned dictionaries is a function updating the ``'data'`` and
+        ``'axes'`` items of the dictionary with the data appended since the
+        file was read, without reopening the file.
     **kwds : dict, optional
         The keyword arguments are passed to :py:class:`h5py.File`.
 
@@ -111,18 +333,39 @@ def file_reader(filename, lazy=False, **kwds):
         import hdf5plugin
     except ImportError:
         pass
+    if lazy_metadata and not lazy:
+        raise ValueError("Reading the metadata lazily requires `lazy=True`.")
     mode = kwds.pop("mode", "r")
+    if swmr:
+        if not lazy or metadata_only:
+            raise ValueError("Reading a file in SWMR mode requires `lazy=True`.")
+        kwds.update(libver="latest", swmr=True)
     f = h5py.File(filename, mode=mode, **kwds)
 
     reader = HyperspyReader(f)
-    exp_dict_list = reader.read(lazy=lazy)
-    if not lazy:
+    exp_dict_list = reader.read(
+        lazy=lazy,
+        metadata_only=metadata_only,
+        lazy_metadata=lazy_metadata,
+        navigation_slice=navigation_slice,
+        signal_slice=signal_slice,
+        chunks=chunks,
+    )
+    if (not lazy or metadata_only) and not lazy_metadata:
         f.close()
 
     return exp_dict_list
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    LAZY_METADATA_DOC,
+    SLICE_DOC,
+    CHUNKS_ALIGNED_READ_DOC,
+    RETURNS_DOC,
+)
 
 
 def file_writer(
@@ -132,6 +375,9 @@ def file_writer(
     compression="gzip",
     close_file=True,
     write_dataset=True,
+    compression_workers=None,
+    access_pattern=None,
+    write_summary=False,
     **kwds,
 ):
     """
@@ -143,13 +389,28 @@ def file_writer(
     %s
     %s
     %s
+    %s
     close_file : bool, default=True
         Close the file after writing.  The file should not be closed if the data
         needs to be accessed lazily after saving.
     write_dataset : bool, default=True
         If True, write the dataset, otherwise, don't write it. Useful to
         overwrite attributes (for example ``axes_manager``) only without having
-        to write the whole dataset.
+        to write the whole dataset. If False, the existing file is opened in
+        ``'a'`` mode, the axes, metadata, original metadata, learning results
+        and attributes of the signal are replaced and the dataset is left
+        in place, unchanged. The shape of the data must be the same as in
+        the file.
+    compression_workers : int or None, default=None
+        If not ``None``, the chunks of the signal data are compressed in a pool
+        of ``compression_workers`` threads and written with
+        :external+h5py:meth:`h5py.h5d.DatasetID.write_direct_chunk` instead of
+        being compressed by HDF5 on a single thread. The chunks are identical
+        to the ones written by HDF5. It is supported for the ``gzip``
+        compression, the ``shuffle`` filter and the ``blosc`` and ``zstd``
+        filters of ``hdf5plugin`` (requires the ``blosc`` and ``zstandard``
+        packages respectively). With other filters, HDF5 compresses the chunks.
+    %s
     **kwds
         The keyword argument are passed to the
         :external+h5py:meth:`h5py.Group.require_dataset` function.
@@ -170,6 +431,12 @@ def file_writer(
     ext = signal["tmp_parameters"].get("original_extension", "")
     original_path = Path(folder, f"{fname}.{ext}")
 
+    # with "write_dataset=False", we need mode='a', otherwise the dataset
+    # will be flushed with using 'w' mode
+    mode = kwds.pop("mode", "w" if write_dataset else "a")
+    if mode != "a" and not write_dataset:
+        raise ValueError("`mode='a'` is required to use " "`write_dataset=False`.")
+
     f = None
     if signal["attributes"]["_lazy"] and Path(filename).absolute() == original_path:
         f = get_file_handle(signal["data"], warn=False)
@@ -182,22 +449,9 @@ def file_writer(
             )
 
     if f is None:
-        # with "write_dataset=False", we need mode='a', otherwise the dataset
-        # will be flushed with using 'w' mode
-        mode = kwds.get("mode", "w" if write_dataset else "a")
-        if mode != "a" and not write_dataset:
-            raise ValueError("`mode='a'` is required to use " "`write_dataset=False`.")
         f = h5py.File(filename, mode=mode)
 
-    f.attrs["file_format"] = "HyperSpy"
-    f.attrs["file_format_version"] = version
-    exps = f.require_group("Experiments")
-    title = signal["metadata"]["General"]["title"]
-    group_name = title if title else "__unnamed__"
-    # / is a invalid character, see https://github.com/hyperspy/hyperspy/issues/942
-    if "/" in group_name:
-        group_name = group_name.replace("/", "-")
-    expg = exps.require_group(group_name)
+    expg = require_signal_group(f, signal, "HyperSpy")
 
     writer = HyperspyWriter(
         f,
@@ -206,6 +460,9 @@ def file_writer(
         chunks=chunks,
         compression=compression,
         write_dataset=write_dataset,
+        compression_workers=compression_workers,
+        access_pattern=access_pattern,
+        write_summary=write_summary,
         **kwds,
     )
     writer.write()
@@ -218,9 +475,251 @@ file_writer.__doc__ %= (
     FILENAME_DOC.replace("read", "write to"),
     SIGNAL_DOC,
     CHUNKS_DOC,
+    ACCESS_PATTERN_DOC,
+    COMPRESSION_HDF5_DOC,
+    WRITE_SUMMARY_DOC,
+    COMPRESSION_HDF5_NOTES_DOC,
+)
+
+
+class HyperspyAppender(HierarchicalAppender):
+    """
+    Write a signal incrementally to a ``.hspy`` file, see
+    :py:func:`~.hspy.file_appender`.
+    """
+
+    writer_class = HyperspyWriter
+
+    @staticmethod
+    def _get_resizable_kwds(shape):
+        return {"maxshape": (None,) + tuple(shape[1:])}
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def file_appender(
+    filename, signal, chunks=None, compression="gzip", swmr=False, **kwds
+):
+    """
+    Create a ``.hspy`` file to write a signal incrementally, by appending data
+    along its first axis, for example during a live acquisition. The data is
+    stored in a dataset resizable along this axis and the size of the axis is
+    updated after each append, so that the file can be read with
+    :py:func:`~.hspy.file_reader` at any time.
+
+    Parameters
+    ----------
+    %s
+    signal : dict
+        Dictionary containing the signal object, as for
+        :py:func:`~.hspy.file_writer`. The first axis must be a uniform
+        navigation axis, its size is the length of the initial data,
+        which can be zero.
+    chunks : tuple of int or None, default=None
+        Define the chunking used for saving the dataset. If ``None``,
+        calculates chunks for the signal assuming that the data is
+        long along the first axis.
+    %s
+    swmr : bool, default=False
+        If ``True``, create the file with the latest version of the HDF5 file
+        format and write it in single-writer/multiple-reader (SWMR) mode, so
+        that it can be read by :py:func:`~.hspy.file_reader` with
+        ``swmr=True`` while data is appended.
+    **kwds
+        The keyword argument are passed to the
+        :external+h5py:meth:`h5py.Group.require_dataset` function.
+
+    Returns
+    -------
+    HyperspyAppender
+        Object with an ``append`` method to append data to the signal, and a
+        ``close`` method to close the file. It can also be used as context
+        manager.
+
+    Notes
+    -----
+    %s
+
+    Examples
+    --------
+    >>> from rsciio.hspy import file_appender
+    >>> with file_appender("live.hspy", signal) as appender:
+    ...     for frame in acquisition:
+    ...         appender.append(frame[np.newaxis])
+    """
+    if "shuffle" not in kwds:
+        # Use shuffle by default to improve compression
+        kwds["shuffle"] = True
+
+    f = h5py.File(filename, mode="w", libver="latest" if swmr else None)
+    expg = require_signal_group(f, signal, "HyperSpy")
+    try:
+        appender = HyperspyAppender(
+            f, expg, signal, chunks=chunks, compression=compression, **kwds
+        )
+    except Exception:
+        f.close()
+        raise
+    if swmr:
+        # no group, dataset or attribute can be created afterwards
+        f.swmr_mode = True
+    return appender
+
+
+file_appender.__doc__ %= (
+    FILENAME_DOC.replace("read", "write to"),
     COMPRESSION_HDF5_DOC,
     COMPRESSION_HDF5_NOTES_DOC,
 )
 
 
+def _get_signal_group(file):
+    """Return the group of the single signal of a ``.hspy`` file."""
+    groups = [
+        group
+        for group in file.get("Experiments", {}).values()
+        if isinstance(group, h5py.Group) and "data" in group
+    ]
+    if len(groups) != 1:
+        raise ValueError(f"The file {file.filename} must contain a single signal.")
+    return groups[0]
+
+
+def write_virtual_dataset(filename, files, axis=None, new_axis=None):
+    """
+    Write a ``.hspy`` file whose data is a HDF5 virtual dataset referencing the
+    data of the signals of several ``.hspy`` files, for example the tiles or
+    the time steps of an acquisition, stacked along a new navigation axis or
+    concatenated along an existing one. No data is copied: the data is read
+    from the source files when reading the file, which can be read lazily as
+    a single signal without building a large dask graph.
+
+    The axes, metadata, original metadata and attributes of the signal are
+    copied from the first file. The paths of the source files are stored
+    relative to the directory of ``filename``, so that the files can be moved
+    together. Missing source files are read as zeros.
+
+    Parameters
+    ----------
+    %s
+    files : list of str or pathlib.Path
+        The ``.hspy`` files containing a single signal each. The data of the
+        signals must have the same dtype and the same shape, except along
+        ``axis``.
+    axis : int or None, default=None
+        If ``None``, the signals are stacked along a new navigation axis,
+        which is the first axis in array order. Otherwise, the index in array
+        order of the navigation axis along which the signals are concatenated,
+        which must be a uniform axis.
+    new_axis : dict or None, default=None
+        The parameters of the new axis when ``axis`` is ``None``, such as
+        ``name``, ``units``, ``scale`` and ``offset``.
+
+    Examples
+    --------
+    >>> from rsciio.hspy import write_virtual_dataset
+    >>> files = [f"tile_{i}.hspy" for i in range(100)]
+    >>> write_virtual_dataset("tiles.hspy", files, new_axis={"name": "tile"})
+    >>> d = file_reader("tiles.hspy", lazy=True)[0]
+    """
+    if not files:
+        raise ValueError("At least one file is required.")
+    dirname = Path(filename).resolve().parent
+    sources = []
+    for source in files:
+        with h5py.File(source, mode="r") as f:
+            group = _get_signal_group(f)
+            if axis is not None and not sources:
+                axis_group = group.get(f"axis-{axis}")
+                if axis_group is None or not axis_group.attrs["navigate"]:
+                    raise ValueError(
+                        f"The axis {axis} of the signals isn't a navigation axis."
+                    )
+                # only the size of the axis is updated, see below
+                axis_type = axis_group.attrs.get("_type", "UniformDataAxis")
+                if axis_type != "UniformDataAxis":
+                    raise ValueError(
+                        f"The axis {axis} of the signals is a {axis_type}, "
+                        "only uniform axes can be concatenated."
+                    )
+            dataset = group["data"]
+            if h5py.check_vlen_dtype(dataset.dtype) is not None:
+                raise ValueError("Virtual datasets of ragged arrays are not supported.")
+            sources.append(
+                (
+                    Path(os.path.relpath(Path(source).resolve(), dirname)).as_posix(),
+                    dataset.name,
+                    dataset.shape,
+                    dataset.dtype,
+                    dataset.chunks or dataset.shape,
+                )
+            )
+    _, _, shape, dtype, chunks = sources[0]
+    for path, _, shape_, dtype_, _ in sources:
+        shape_ = list(shape_)
+        if axis is not None:
+            shape_[axis] = shape[axis]
+        if tuple(shape_) != shape or dtype_ != dtype:
+            raise ValueError(
+                f"The data of {path} doesn't have the same dtype and shape as "
+                f"the data of {sources[0][0]}."
+            )
+
+    if axis is None:
+        shape = (len(sources),) + shape
+        chunks = (1,) + chunks
+    else:
+        shape = list(shape)
+        shape[axis] = sum(source[2][axis] for source in sources)
+        shape = tuple(shape)
+    layout = h5py.VirtualLayout(shape=shape, dtype=dtype)
+    start = 0
+    for i, (path, name, shape_, _, _) in enumerate(sources):
+        if axis is None:
+            layout[i] = h5py.VirtualSource(path, name, shape=shape_)
+        else:
+            region = [slice(None)] * len(shape)
+            region[axis] = slice(start, start + shape_[axis])
+            layout[tuple(region)] = h5py.VirtualSource(path, name, shape=shape_)
+            start += shape_[axis]
+
+    with h5py.File(files[0], mode="r") as source, h5py.File(filename, "w") as f:
+        f.attrs.update(source.attrs)
+        source_group = _get_signal_group(source)
+        group = f.require_group(source_group.name)
+        group.attrs.update(source_group.attrs)
+        ndim = len(shape) - (axis is None)
+        for key in source_group:
+            if key == "data" or key == "_summary" or key.startswith("axis-"):
+                continue
+            source.copy(source_group[key], group, name=key)
+        for i in range(ndim):
+            j = i + (axis is None)
+            source.copy(source_group[f"axis-{i}"], group, name=f"axis-{j}")
+            group[f"axis-{j}"].attrs["size"] = shape[j]
+        if axis is None:
+            axis_dict = {
+                "_type": "UniformDataAxis",
+                "name": None,
+                "units": None,
+                "navigate": True,
+                "is_binned": False,
+                "scale": 1.0,
+                "offset": 0.0,
+            }
+            axis_dict.update(new_axis or {}, size=len(sources))
+            writer = HyperspyWriter(f, {"data": np.empty(0)}, group)
+            writer.dict2group(axis_dict, group.create_group("axis-0"))
+        dataset = group.create_virtual_dataset("data", layout)
+        # the dask chunks are aligned on the chunks of the source datasets
+        dataset.attrs["chunks"] = chunks
+
+
+write_virtual_dataset.__doc__ %= (FILENAME_DOC.replace("read", "write to"),)
+
+
 overwrite_dataset = HyperspyWriter.overwrite_dataset
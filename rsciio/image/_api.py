@@ -25,9 +25,11 @@ import numpy as np
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import _UREG
 
 
@@ -201,7 +203,7 @@ def file_writer(
 file_writer.__doc__ %= (FILENAME_DOC.replace("read", "write to"), SIGNAL_DOC)
 
 
-def file_reader(filename, lazy=False, **kwds):
+def file_reader(filename, lazy=False, metadata_only=False, **kwds):
     """
     Read data from any format supported by imageio (PIL/pillow).
 
@@ -213,6 +215,7 @@ def file_reader(filename, lazy=False, **kwds):
     ----------
     %s
     %s
+    %s
     **kwds : dict, optional
         Allows to pass keyword arguments supported by the individual file
         readers as documented at
@@ -220,7 +223,9 @@ def file_reader(filename, lazy=False, **kwds):
 
     %s
     """
-    if lazy:
+    if metadata_only:
+        dc = _read_data_placeholder(filename, **kwds)
+    elif lazy:
         # load the image fully to check the dtype and shape, should be cheap.
         # Then store this info for later re-loading when required
         from dask.array import from_delayed
@@ -241,7 +246,7 @@ def file_reader(filename, lazy=False, **kwds):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def _read_data(filename, **kwds):
@@ -258,3 +263,17 @@ def _read_data(filename, **kwds):
             dc = rgb_tools.regular_array2rgbx(dc)
 
     return dc
+
+
+def _read_data_placeholder(filename, **kwds):
+    props = iio.improps(filename, **kwds)
+    shape = tuple(size for size in props.shape if size != 1)
+    if len(shape) > 2:
+        # Whether the image is saved as grayscale in the RGB(A) format
+        # depends on the pixel values, which needs to be read
+        dc = _read_data(filename, **kwds)
+        shape, dtype = dc.shape, dc.dtype
+    else:
+        dtype = props.dtype
+
+    return get_data_placeholder(shape, dtype)
@@ -3,7 +3,14 @@ import os
 import csv
 import logging
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -22,7 +29,8 @@ invalid_filenaming_error = {
 }
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a DENSsolutions Impulse logfile.
 
@@ -30,6 +38,7 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
@@ -38,10 +47,22 @@ def file_reader(filename, lazy=False):
 
     csv_file = ImpulseCSV(filename)
 
-    return _impulseCSV_log_reader(csv_file)
+    dictionaries = _impulseCSV_log_reader(csv_file)
+    if metadata_only:
+        # the axes are calibrated from the data, which needs to be read anyway
+        for dictionary in dictionaries:
+            data = dictionary["data"]
+            dictionary["data"] = get_data_placeholder(data.shape, data.dtype)
 
+    return dictionaries
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 
 
 def _impulseCSV_log_reader(csv_file):
@@ -58,7 +79,7 @@ class ImpulseCSV:
         self._read_data()
 
     def _parse_header(self):
-        with open(self.filename, "r") as f:
+        with open_file(self.filename, "r") as f:
             s = f.readline()
             self.column_names = s.strip().split(",")
             if not self._is_impulse_csv_file():
@@ -150,7 +171,7 @@ class ImpulseCSV:
                 "_".join(str(self.filename).split("_")[:-1]) + "_Metadata.log"
             ).replace("\\", "/")
             if os.path.isfile(metadata_file):
-                with open(metadata_file, newline="") as csvfile:
+                with open_file(metadata_file, newline="") as csvfile:
                     metadata_file_reader = csv.reader(csvfile, delimiter=",")
                     for row in metadata_file_reader:
                         if notes_section:
@@ -22,9 +22,12 @@ from datetime import datetime, timedelta
 import logging
 
 import numpy as np
-import numba
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.tools import deferred_njit
+from rsciio.utils import cache
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -51,6 +54,7 @@ jTYPE = {
 }
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
@@ -64,6 +68,7 @@ def file_reader(
     frame_list=None,
     frame_shifts=None,
     frame_start_index=None,
+    metadata_only=False,
 ):
     """
     File reader for JEOL Analysist Station software format.
@@ -112,7 +117,10 @@ def file_reader(
         This is useful for express drift correction. Not suitable for accurate analysis.
     frame_start_index : list, None, default=None
         The list of offset pointers of each frame in the raw data.
-        The pointer for frame0 is 0.
+        The pointer for frame0 is 0. If ``None``, the pointers are found by
+        scanning the raw data, or taken from the
+        :ref:`header cache <cache-utils>` when it is enabled.
+    %s
 
     %s
     """
@@ -129,16 +137,25 @@ def file_reader(
         frame_shifts=frame_shifts,
     )
     file_ext = os.path.splitext(filename)[-1][1:].lower()
-    if file_ext in extension_to_reader_mapping:
-        return extension_to_reader_mapping[file_ext](filename, **kwargs)
-    else:
+    if file_ext not in extension_to_reader_mapping:
         _logger.info(f"{filename} : File type {file_ext} is not supported. Skipping")
         return []
 
+    dictionaries = extension_to_reader_mapping[file_ext](filename, **kwargs)
+    if metadata_only:
+        # Images are stored in the header tree and the shape of a spectrum
+        # image depends on the content of the event stream: the data needs to
+        # be read anyway
+        for dictionary in dictionaries:
+            data = dictionary["data"]
+            dictionary["data"] = get_data_placeholder(data.shape, data.dtype)
+
+    return dictionaries
+
 
 def _read_asw(filename, **kwargs):
     image_list = []
-    with open(filename, "br") as fd:
+    with open_file(filename, "br") as fd:
         file_magic = np.fromfile(fd, "<I", 1)[0]
         if file_magic != 0:
             raise ValueError(f"Not a valid JEOL asw format '{filename}'")
@@ -178,7 +195,7 @@ def _read_asw(filename, **kwargs):
     return image_list
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def _read_img(filename, **kwargs):
@@ -196,7 +213,7 @@ def _read_img(filename, **kwargs):
         (Always len(image_list) == 1)
     """
 
-    with open(filename, "br") as fd:
+    with open_file(filename, "br") as fd:
         file_magic = np.fromfile(fd, "<I", 1)[0]
         if file_magic != 52:
             _logger.warning(f"Not a valid JEOL img format '{filename}'")
@@ -317,7 +334,9 @@ def _read_pts(
         Like the result of estimate_shift2D(), the first parameter is for y-axis
     frame_start_index: list
         The list of offset pointers of each frame in the raw data.
-        The pointer for frame0 is 0.
+        The pointer for frame0 is 0. If ``None``, the pointers are found by
+        scanning the raw data, or taken from the
+        :ref:`header cache <cache-utils>` when it is enabled.
     lazy : bool, default False
         Read spectrum image into sparse array if lazy == True
         SEM/STEM image is always read into dense array (numpy.ndarray)
@@ -338,7 +357,7 @@ def _read_pts(
     _check_divisor(rebin_energy, 4096, "rebin_energy")
     rebin_energy = int(rebin_energy)
 
-    with open(filename, "br") as fd:
+    with open_file(filename, "br") as fd:
         file_magic = np.fromfile(fd, "<I", 1)[0]
         if file_magic != 304:
             _logger.warning(f"Not a valid JEOL pts format '{filename}'")
@@ -459,11 +478,15 @@ def _read_pts(
         # + 1 for incomplete frame
         max_frame = frame_list.max() + 1
 
+        if frame_start_index is None:
+            # the index found in a previous session, if any
+            frame_start_index = cache.get_entry(filename, "jeol.frame_start_index")
         if frame_start_index is None:
             frame_start_index = np.full(max_frame, -1, dtype=np.int32)
             frame_start_index[0] = 0
         else:
             frame_start_index = np.asarray(frame_start_index)
+        indexed_frames = np.count_nonzero(frame_start_index >= 0)
 
         # fill with -1 as invaid index (not loaded)
         if frame_start_index.size < max_frame:
@@ -506,6 +529,8 @@ def _read_pts(
             only_valid_data,
             lazy,
         )
+        if np.count_nonzero(frame_start_index >= 0) > indexed_frames:
+            cache.set_entry(filename, "jeol.frame_start_index", frame_start_index)
         header["jeol_pts_frame_origin"] = origin
         header["jeol_pts_frame_shifts"] = frame_shifts_1
         header["jeol_pts_frame_start_index"] = frame_start_index
@@ -984,7 +1009,7 @@ def _readcube(
     )
 
 
-@numba.njit(cache=True)
+@deferred_njit(cache=True)
 def _readframe_dense(
     rawdata,
     countup,
@@ -1097,7 +1122,7 @@ def _readframe_dense(
     return count, 0, has_em_image, valid, previous_y // height_norm
 
 
-@numba.njit(cache=True)
+@deferred_njit(cache=True)
 def _readframe_lazy(
     rawdata,
     _1,
@@ -1198,7 +1223,7 @@ def _readframe_lazy(
     return count, data, has_em_image, valid, previous_y // height_norm
 
 
-@numba.njit(cache=True)
+@deferred_njit(cache=True)
 def _skip_frame(rawdata):  # pragma: no cover
     count = 0
     previous_y = 0
@@ -1228,7 +1253,7 @@ def _read_eds(filename, **kwargs):
         None on read error
     """
     header = {}
-    fd = open(filename, "br")
+    fd = open_file(filename, "br")
     # file_magic
     _ = np.fromfile(fd, "<I", 1)[0]
     np.fromfile(fd, "<b", 6)
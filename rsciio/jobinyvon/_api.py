@@ -29,7 +29,14 @@ from copy import deepcopy
 import numpy as np
 from numpy.polynomial.polynomial import polyfit
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -99,7 +106,8 @@ class JobinYvonXMLReader:
 
     def parse_file(self):
         """First parse through file to extract data/metadata positions."""
-        tree = ET.parse(self._file_path)
+        with open_file(self._file_path, "rb") as f:
+            tree = ET.parse(f)
         root = tree.getroot()
 
         lsx_tree_list = root.findall("LSX_Tree")
@@ -465,8 +473,8 @@ class JobinYvonXMLReader:
 
         self._sort_nav_axes()
 
-    def get_data(self):
-        """Extract data from file."""
+    def get_data(self, metadata_only=False):
+        """Extract data from file, or only its shape if ``metadata_only``."""
         data_raw = self._lsx_matrix.findall("LSX_Row")
         ## lexicographical ordering -> 3x3 map -> 9 rows
         num_rows = len(data_raw)
@@ -474,18 +482,24 @@ class JobinYvonXMLReader:
             _logger.critical("No data found.")  # pragma: no cover
         elif num_rows == 1:
             ## Spectrum
+            if metadata_only:
+                self.data = get_data_placeholder((self._get_size(data_raw[0]),), float)
+                return
             self.data = np.fromstring(data_raw[0].text.strip(), sep=" ")
             if self._reverse_signal:
                 self.data = self.data[::-1]
         else:
             ## linescan or map
             num_cols = self._get_size(data_raw[0])
-            self.data = np.empty((num_rows, num_cols))
-            for i, row in enumerate(data_raw):
-                row_array = np.fromstring(row.text.strip(), sep=" ")
-                if self._reverse_signal:
-                    row_array = row_array[::-1]
-                self.data[i, :] = row_array
+            if metadata_only:
+                self.data = get_data_placeholder((num_rows, num_cols), float)
+            else:
+                self.data = np.empty((num_rows, num_cols))
+                for i, row in enumerate(data_raw):
+                    row_array = np.fromstring(row.text.strip(), sep=" ")
+                    if self._reverse_signal:
+                        row_array = row_array[::-1]
+                    self.data[i, :] = row_array
             ## reshape the array (lexicographic -> cartesian)
             ## reshape depends on available axes
             if self._has_nav2:
@@ -675,7 +689,10 @@ class JobinYvonXMLReader:
         _remove_none_from_dict(self.metadata)
 
 
-def file_reader(filename, lazy=False, use_uniform_signal_axis=False):
+@instrumented
+def file_reader(
+    filename, lazy=False, use_uniform_signal_axis=False, metadata_only=False
+):
     """
     Read data from .xml files saved using Horiba Jobin Yvon's LabSpec software.
 
@@ -688,6 +705,7 @@ def file_reader(filename, lazy=False, use_uniform_signal_axis=False):
         If ``True``, the ``scale`` attribute is calculated from the average delta
         along the signal axis and a warning is raised in case the delta varies
         by more than 1 percent.
+    %s
 
     %s
     """
@@ -701,7 +719,7 @@ def file_reader(filename, lazy=False, use_uniform_signal_axis=False):
     jy.parse_file()
     jy.get_original_metadata()
     jy.get_axes()
-    jy.get_data()
+    jy.get_data(metadata_only=metadata_only)
     jy.map_metadata()
     dictionary = {
         "data": jy.data,
@@ -714,4 +732,9 @@ def file_reader(filename, lazy=False, use_uniform_signal_axis=False):
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
@@ -28,11 +28,15 @@ import numpy as np
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    CHUNKS_READ_DOC,
     ENDIANESS_DOC,
     MMAP_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
 )
+from rsciio.utils.array import get_data_placeholder, get_signal_aware_dask_array
 from rsciio.utils.tools import sarray2dict
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -135,8 +139,15 @@ def get_data_type(mode):
         raise ValueError(f"Unrecognised mode '{mode}'.")
 
 
+@instrumented
 def file_reader(
-    filename, lazy=False, mmap_mode=None, endianess="<", navigation_shape=None
+    filename,
+    lazy=False,
+    mmap_mode=None,
+    endianess="<",
+    navigation_shape=None,
+    metadata_only=False,
+    chunks="auto",
 ):
     """
     File reader for the MRC format for tomographic data.
@@ -149,12 +160,14 @@ def file_reader(
     %s
     navigation_shape : tuple, None, default=None
         Specify the shape of the navigation space.
+    %s
+    %s
 
     %s
     """
 
     metadata = {}
-    f = open(filename, "rb")
+    f = open_file(filename, "rb")
     std_header = np.fromfile(f, dtype=get_std_dtype_list(endianess), count=1)
     fei_header = None
     if std_header["NEXT"] / 1024 == 128:
@@ -171,17 +184,22 @@ def file_reader(
     shape = (NX[0], NY[0], NZ[0])
     if navigation_shape is not None:
         shape = shape[:2] + navigation_shape
-    data = (
-        np.memmap(
-            f,
-            mode=mmap_mode,
-            offset=f.tell(),
-            dtype=get_data_type(std_header["MODE"]),
+    if metadata_only:
+        data = get_data_placeholder(
+            shape[::-1], get_data_type(std_header["MODE"])
+        ).squeeze()
+    else:
+        data = (
+            np.memmap(
+                f,
+                mode=mmap_mode,
+                offset=f.tell(),
+                dtype=get_data_type(std_header["MODE"]),
+            )
+            .reshape(shape, order="F")
+            .squeeze()
+            .T
         )
-        .reshape(shape, order="F")
-        .squeeze()
-        .T
-    )
 
     original_metadata = {"std_header": sarray2dict(std_header)}
     # Convert bytes to unicode
@@ -261,6 +279,10 @@ def file_reader(
         for i in range(dim)
     ]
 
+    if lazy and not metadata_only:
+        signal_axes = [i for i, axis in enumerate(axes) if not axis["navigate"]]
+        data = get_signal_aware_dask_array(data, signal_axes, chunks=chunks)
+
     dictionary = {
         "data": data,
         "axes": axes,
@@ -288,4 +310,12 @@ mapping = {
 }
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, MMAP_DOC, ENDIANESS_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    MMAP_DOC,
+    ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
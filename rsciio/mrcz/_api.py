@@ -16,19 +16,24 @@
 # You should have received a copy of the GNU General Public License
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import json
+import logging
+
 from packaging.version import Version
 import mrcz as _mrcz
-import logging
 
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
     ENDIANESS_DOC,
     MMAP_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import DTBox
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -76,7 +81,22 @@ mapping = {
 }
 
 
-def file_reader(filename, lazy=False, mmap_mode="c", endianess="<", **kwds):
+def _read_header(filename, endian, slices=None):
+    # Same as `mrcz.readMRC` without reading (and decompressing) the data
+    header = _mrcz.readMRCHeader(
+        filename, slices=slices, endian=endian, pixelunits="nm"
+    )
+    if header["extendedBytes"] > 0 and header["metaId"] == b"json":
+        with open_file(filename, "rb") as f:
+            f.seek(1024)
+            header.update(json.loads(f.read(header["extendedBytes"]).decode()))
+    return header
+
+
+@instrumented
+def file_reader(
+    filename, lazy=False, mmap_mode="c", endianess="<", metadata_only=False, **kwds
+):
     """
     File reader for the MRCZ format for tomographic data.
 
@@ -86,6 +106,7 @@ def file_reader(filename, lazy=False, mmap_mode="c", endianess="<", **kwds):
     %s
     %s
     %s
+    %s
     **kwds : dict, optional
         The keyword arguments are passed to :py:func:`mrcz.readMRC`.
 
@@ -104,9 +125,13 @@ def file_reader(filename, lazy=False, mmap_mode="c", endianess="<", **kwds):
         raise ValueError("MRCZ supports only C-ordering memory-maps")
 
     mrcz_endian = "le" if endianess == "<" else "be"
-    data, mrcz_header = _mrcz.readMRC(
-        filename, endian=mrcz_endian, useMemmap=lazy, pixelunits="nm", **kwds
-    )
+    if metadata_only:
+        mrcz_header = _read_header(filename, mrcz_endian, kwds.get("slices"))
+        data = get_data_placeholder(mrcz_header["dimensions"], mrcz_header["dtype"])
+    else:
+        data, mrcz_header = _mrcz.readMRC(
+            filename, endian=mrcz_endian, useMemmap=lazy, pixelunits="nm", **kwds
+        )
 
     # Create the axis objects for each axis
     names = ["y", "x", "z"]
@@ -151,10 +176,12 @@ file_reader.__doc__ %= (
         "incompatible). The MRCZ reader currently only supports C-ordering memory-maps.",
     ),
     ENDIANESS_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
 )
 
 
+@instrumented
 def file_writer(
     filename,
     signal,
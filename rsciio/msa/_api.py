@@ -17,7 +17,6 @@
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 from datetime import datetime as dt
-import codecs
 import os
 import logging
 import warnings
@@ -28,10 +27,13 @@ from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_UNSUPPORTED_DOC,
     ENCODING_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import DTBox
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -161,7 +163,7 @@ keywords = {
 }
 
 
-def parse_msa_string(string, filename=None):
+def parse_msa_string(string, filename=None, metadata_only=False):
     """
     Parse an EMSA/MSA file content.
 
@@ -171,6 +173,9 @@ def parse_msa_string(string, filename=None):
         It must complain with the EMSA/MSA standard.
     filename : str, None
         The filename.
+    metadata_only : bool, default=False
+        If ``True``, the ``'data'`` item is a placeholder, see
+        :py:func:`rsciio.utils.array.get_data_placeholder`.
 
     Returns
     -------
@@ -274,9 +279,16 @@ def parse_msa_string(string, filename=None):
         ) as e:  # Error raised if split does not return 3 elements in this case
             _logger.warning(malformed_date_error + ": %s" % e)
 
+    # NPOINTS is not reliable: the size of the data is given by the data
+    # section, which is parsed in any case
+    if metadata_only:
+        data = get_data_placeholder((len(y),), float)
+    else:
+        data = np.array(y)
+
     axes = [
         {
-            "size": len(y),
+            "size": data.size,
             "index_in_array": 0,
             "name": parameters["XLABEL"] if "XLABEL" in parameters else "",
             "scale": parameters["XPERCHAN"] if "XPERCHAN" in parameters else 1,
@@ -331,7 +343,7 @@ def parse_msa_string(string, filename=None):
         mapped.set_item("Signal.quantity", quantity_units.strip())
 
     dictionary = {
-        "data": np.array(y),
+        "data": data,
         "axes": axes,
         "metadata": mapped.to_dict(),
         "original_metadata": parameters,
@@ -342,7 +354,8 @@ def parse_msa_string(string, filename=None):
     return file_data_list
 
 
-def file_reader(filename, lazy=False, encoding="latin-1"):
+@instrumented
+def file_reader(filename, lazy=False, encoding="latin-1", metadata_only=False):
     """
     Read an MSA file.
 
@@ -351,19 +364,31 @@ def file_reader(filename, lazy=False, encoding="latin-1"):
     %s
     %s
     %s
+    %s
 
     %s
     """
     if lazy is not False:
         raise NotImplementedError("Lazy loading is not supported.")
 
-    with codecs.open(filename, encoding=encoding, errors="replace") as spectrum_file:
-        return parse_msa_string(string=spectrum_file, filename=filename)
+    with open_file(
+        filename, encoding=encoding, errors="replace", newline=""
+    ) as spectrum_file:
+        return parse_msa_string(
+            string=spectrum_file, filename=filename, metadata_only=metadata_only
+        )
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, ENCODING_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    ENCODING_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 
 
+@instrumented
 def file_writer(filename, signal, format="Y", separator=", ", encoding="latin-1"):
     """
     Write signal to an MSA file.
@@ -483,7 +508,7 @@ def file_writer(filename, signal, format="Y", separator=", ", encoding="latin-1"
             if dic["mapped_to"] in md:
                 loc_kwds[key] = eval("md.%s" % dic["mapped_to"])
 
-    with codecs.open(filename, "w", encoding=encoding, errors="ignore") as f:
+    with open_file(filename, "w", encoding=encoding, errors="ignore", newline="") as f:
         # Remove the following keys from loc_kwds if they are in
         # (although they shouldn't)
         for key in ["SPECTRUM", "ENDOFDATA"]:
@@ -21,7 +21,13 @@ import logging
 
 import numpy as np
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
 
 _logger = logging.getLogger(__name__)
 
@@ -76,7 +82,7 @@ treatments2netcdf = {
 }
 
 
-def file_reader(filename, lazy=False):
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read netCDF ``.nc`` files saved using the HyperSpy predecessor EELSlab.
 
@@ -84,6 +90,7 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
@@ -104,7 +111,7 @@ def file_reader(filename, lazy=False):
         hasattr(ncfile, "file_format_version")
         and ncfile.file_format_version == "EELSLab 0.1"
     ):
-        dictionary = nc_hyperspy_reader_0dot1(ncfile, filename)
+        dictionary = nc_hyperspy_reader_0dot1(ncfile, filename, metadata_only)
     else:
         ncfile.close()
         raise IOError("Unsupported netCDF file")
@@ -112,13 +119,24 @@ def file_reader(filename, lazy=False):
     return (dictionary,)
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 
 
-def nc_hyperspy_reader_0dot1(ncfile, filename):
+def nc_hyperspy_reader_0dot1(ncfile, filename, metadata_only=False):
     calibration_dict, acquisition_dict, treatments_dict = {}, {}, {}
     dc = ncfile.variables["data_cube"]
-    data = dc[:]
+    if metadata_only:
+        # scipy variables don't have a `dtype` attribute
+        dtype = dc.dtype if netcdf_reader == "netCDF4" else dc.data.dtype
+        # Already in the C order, see below
+        data = get_data_placeholder(dc.shape[::-1], dtype)
+    else:
+        data = dc[:]
     if "history" in calibration_dict:
         calibration_dict["history"] = eval(ncfile.history)
     for attrib in attrib2netcdf.items():
@@ -182,7 +200,8 @@ def nc_hyperspy_reader_0dot1(ncfile, filename):
         navigate = [True, True, False]
 
     # The images are recorded in the Fortran order
-    data = data.T.copy()
+    if not metadata_only:
+        data = data.T.copy()
     try:
         scales = [calibration_dict[key] for key in scaleskeys[3 - dim :]]
     except KeyError:
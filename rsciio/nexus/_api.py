@@ -20,7 +20,6 @@
 import logging
 import os
 
-import dask.array as da
 import h5py
 import numpy as np
 
@@ -29,16 +28,24 @@ from rsciio._docstrings import (
     COMPRESSION_HDF5_NOTES_DOC,
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
 from rsciio._hierarchical import get_signal_chunks
 from rsciio.hspy._api import overwrite_dataset
-from rsciio.utils.tools import DTBox
+from rsciio.utils.array import (
+    get_aligned_chunks,
+    get_data_placeholder,
+    get_h5py_dask_array,
+)
+from rsciio.utils.tools import DTBox, deferred_import
 
 
 _logger = logging.getLogger(__name__)
 
+da = deferred_import("dask.array")
+
 
 def _byte_to_string(value):
     """Decode a byte string.
@@ -88,7 +95,7 @@ def _parse_from_file(value, lazy=False):
         else:
             if lazy:
                 if value.chunks:
-                    toreturn = da.from_array(value, value.chunks)
+                    toreturn = get_h5py_dask_array(value)
                 else:
                     chunks = get_signal_chunks(value.shape, value.dtype)
                     toreturn = da.from_array(value, chunks)
@@ -292,7 +299,7 @@ def _get_nav_list(data, dataentry):
     return nav_list
 
 
-def _extract_hdf_dataset(group, dataset, lazy=False):
+def _extract_hdf_dataset(group, dataset, lazy=False, metadata_only=False):
     """Import data from hdf path.
 
     Parameters
@@ -303,6 +310,8 @@ def _extract_hdf_dataset(group, dataset, lazy=False):
         path to the dataset within the group
     lazy    : bool {default:True}
         If true use lazy opening, if false read into memory
+    metadata_only : bool {default:False}
+        If true the data is a placeholder and is not read
 
     Returns
     -------
@@ -324,13 +333,17 @@ def _extract_hdf_dataset(group, dataset, lazy=False):
 
     nav_list = _get_nav_list(data, data.parent)
 
-    if lazy:
+    if metadata_only:
+        data_lazy = get_data_placeholder(data.shape, data.dtype)
+    elif lazy:
         if "chunks" in data.attrs.keys():
             chunks = data.attrs["chunks"]
         else:
             signal_axes = [d["index_in_array"] for d in nav_list if not d["navigate"]]
             chunks = get_signal_chunks(data.shape, data.dtype, signal_axes)
-        data_lazy = da.from_array(data, chunks=chunks)
+            if data.chunks is not None:
+                chunks = get_aligned_chunks(chunks, data.shape, data.dtype, data.chunks)
+        data_lazy = get_h5py_dask_array(data, chunks=chunks)
     else:
         data_lazy = np.array(data)
 
@@ -344,7 +357,9 @@ def _extract_hdf_dataset(group, dataset, lazy=False):
     return dictionary
 
 
-def _nexus_dataset_to_signal(group, nexus_dataset_path, lazy=False):
+def _nexus_dataset_to_signal(
+    group, nexus_dataset_path, lazy=False, metadata_only=False
+):
     """Load an NXdata set as a hyperspy signal.
 
     Parameters
@@ -354,6 +369,8 @@ def _nexus_dataset_to_signal(group, nexus_dataset_path, lazy=False):
         Path to the NXdata set in the group
     lazy : bool, default : True
         lazy loading of data
+    metadata_only : bool, default : False
+        If true the data is a placeholder and is not read
 
     Returns
     -------
@@ -388,18 +405,22 @@ def _nexus_dataset_to_signal(group, nexus_dataset_path, lazy=False):
     data = dataentry[data_key]
     nav_list = _get_nav_list(data, dataentry)
 
-    if lazy:
+    if metadata_only:
+        data_lazy = get_data_placeholder(data.shape, data.dtype)
+    elif lazy:
         if "chunks" in data.attrs.keys():
             chunks = data.attrs["chunks"]
         else:
             signal_axes = [d["index_in_array"] for d in nav_list if not d["navigate"]]
             chunks = get_signal_chunks(data.shape, data.dtype, signal_axes)
-        data_lazy = da.from_array(data, chunks=chunks)
+            if data.chunks is not None:
+                chunks = get_aligned_chunks(chunks, data.shape, data.dtype, data.chunks)
+        data_lazy = get_h5py_dask_array(data, chunks=chunks)
     else:
         data_lazy = np.array(data)
 
     if not nav_list:
-        for i in range(data.ndim):
+        for i in range(data_lazy.ndim):
             nav_list.append(
                 {
                     "size": data_lazy.shape[i],
@@ -441,6 +462,7 @@ def file_reader(
     hardlinks_only=False,
     use_default=False,
     mapping=None,
+    metadata_only=False,
 ):
     """
     Read NXdata class or hdf datasets from a file and return signal(s).
@@ -483,6 +505,7 @@ def file_reader(
     mapping : None or dict
         Define the mapping from the original metadata to the returned
         metadata.
+    %s
 
     %s
 
@@ -557,7 +580,9 @@ def file_reader(
         )
 
     for data_path in nexus_data_paths:
-        dictionary = _nexus_dataset_to_signal(fin, data_path, lazy=lazy)
+        dictionary = _nexus_dataset_to_signal(
+            fin, data_path, lazy=lazy, metadata_only=metadata_only
+        )
         entryname = _text_split(data_path, "/")[0]
         dictionary["mapping"] = mapping
         title = dictionary["metadata"]["General"]["title"]
@@ -613,7 +638,9 @@ def file_reader(
 
     if not nxdata_only:
         for data_path in hdf_data_paths:
-            datadict = _extract_hdf_dataset(fin, data_path, lazy=lazy)
+            datadict = _extract_hdf_dataset(
+                fin, data_path, lazy=lazy, metadata_only=metadata_only
+            )
             if datadict:
                 title = data_path[1:].replace("/", "_")
                 basic_metadata = {
@@ -628,7 +655,7 @@ def file_reader(
     return signal_dict_list
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def _is_linear_axis(data):
@@ -1036,7 +1063,7 @@ def _write_nexus_groups(dictionary, group, skip_keys=None, **kwds):
             else:
                 data = _parse_to_file(value)
                 overwrite_dataset(group, data, key, chunks=None, **kwds)
-        elif isinstance(value, (int, float, str, bytes)):
+        elif isinstance(value, (int, float, str, bytes, np.number, np.bool_)):
             group.create_dataset(key, data=_parse_to_file(value))
         else:
             if value is not None and key not in group:
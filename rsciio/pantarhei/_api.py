@@ -21,16 +21,20 @@
 from datetime import datetime as dt
 import logging
 import os
+import zipfile
 
 import numpy as np
 
 from rsciio._docstrings import (
     FILENAME_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
     LAZY_UNSUPPORTED_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import DTBox
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -42,7 +46,21 @@ _logger = logging.getLogger(__name__)
 # array (containing all data) with a dictionary containing all metadata.
 
 
-def file_reader(filename, lazy=False):
+def _read_data_placeholder(filename):
+    # Only the header of the npy file stored in the zip archive is
+    # decompressed
+    with zipfile.ZipFile(filename) as archive:
+        with archive.open("data.npy") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+    return get_data_placeholder(shape, dtype)
+
+
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a PantaRhei ``.prz`` file.
 
@@ -50,6 +68,7 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
@@ -57,14 +76,23 @@ def file_reader(filename, lazy=False):
         raise NotImplementedError("Lazy loading is not supported.")
 
     prz_file = np.load(filename, allow_pickle=True)
-    data = prz_file["data"]
+    if metadata_only:
+        data = _read_data_placeholder(filename)
+    else:
+        data = prz_file["data"]
     meta_data = prz_file["meta_data"][0]
     return import_pr(data, meta_data, filename)
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 
 
+@instrumented
 def file_writer(filename, signal):
     """
     Write signal to PantaRhei ``.prz`` format.
@@ -76,7 +104,7 @@ def file_writer(filename, signal):
     """
 
     data, meta_data = export_pr(signal=signal)
-    with open(filename, mode="wb") as f:
+    with open_file(filename, mode="wb") as f:
         # use open file to avoid numpy adding the npz extension
         np.savez_compressed(
             file=f,
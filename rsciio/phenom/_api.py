@@ -45,7 +45,14 @@ from dateutil import tz
 import tifffile
 import xml.etree.ElementTree as ET
 
-from rsciio._docstrings import FILENAME_DOC, RETURNS_DOC, LAZY_UNSUPPORTED_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+    LAZY_UNSUPPORTED_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 def element_symbol(z):
@@ -183,26 +190,27 @@ def family_symbol(i):
 
 
 def IsGZip(pathname):
-    with open(pathname, "rb") as f:
+    with open_file(pathname, "rb") as f:
         (magic,) = struct.unpack("2s", f.read(2))
     return magic == b"\x1f\x8b"
 
 
 def IsBZip2(pathname):
-    with open(pathname, "rb") as f:
+    with open_file(pathname, "rb") as f:
         (magic, _, bytes) = struct.unpack("2s2s6s", f.read(10))
     return magic == b"BZ" and bytes == b"\x31\x41\x59\x26\x53\x59"
 
 
 class ElidReader:
-    def __init__(self, pathname, block_size=1024 * 1024):
+    def __init__(self, pathname, block_size=1024 * 1024, metadata_only=False):
         if IsGZip(pathname):
             raise Exception("pre EID 3.8 files are not supported")
         if not IsBZip2(pathname):
             raise Exception("not an ELID file")
 
         self._pathname = pathname
-        with open(pathname, "rb") as self._file:
+        self._metadata_only = metadata_only
+        with open_file(pathname, "rb") as self._file:
             self._decompressor = bz2.BZ2Decompressor()
             self._block_size = block_size
             (id, version) = struct.unpack("<4si", self._read(8))
@@ -286,12 +294,25 @@ class ElidReader:
             return (None, None)
         bytes = io.BytesIO(self._read(n))
         with tifffile.TiffFile(bytes) as tiff:
-            data = tiff.asarray()
-            if len(data.shape) > 2:
+            if self._metadata_only:
+                shape, dtype = tiff.series[0].shape, tiff.series[0].dtype
+            else:
+                data = tiff.asarray()
+                shape, dtype = data.shape, data.dtype
+            if len(shape) > 2:
                 # HyperSpy uses struct arrays to store RGB data
                 from rsciio.utils import rgb_tools
 
-                data = rgb_tools.regular_array2rgbx(data)
+                if self._metadata_only:
+                    # Convert a single pixel to get the dtype
+                    dtype = rgb_tools.regular_array2rgbx(
+                        np.zeros(shape[-1:], dtype=dtype)
+                    ).dtype
+                    shape = shape[:-1]
+                else:
+                    data = rgb_tools.regular_array2rgbx(data)
+            if self._metadata_only:
+                data = get_data_placeholder(shape, dtype)
 
             tags = tiff.pages[0].tags
             if "FEI_TITAN" in tags:
@@ -326,10 +347,21 @@ class ElidReader:
             shift += 7
         return value
 
+    def _skip_varuint32s(self, n):
+        # The last byte of each value has the most significant bit cleared.
+        # Each value takes at least one byte, so reading as many bytes as the
+        # number of remaining values never reads past the last value.
+        while n > 0:
+            data = np.frombuffer(self._read(n), dtype=np.uint8)
+            n -= np.count_nonzero(data < 128)
+
     def _read_spectrum(self):
         offset = self._read_float64()
         dispersion = self._read_float64()
         n = self._read_uint32()
+        if self._metadata_only:
+            self._skip_varuint32s(n)
+            return (offset, dispersion, get_data_placeholder((n,), int))
         return (offset, dispersion, [self._read_varuint32() for _ in range(n)])
 
     def _read_uint8s(self):
@@ -706,7 +738,7 @@ class ElidReader:
             original_metadata,
             om["acquisition"]["scan"]["detectors"]["EDS"]["offset"],
             om["acquisition"]["scan"]["detectors"]["EDS"]["dispersion"],
-            np.array(sum_spectrum),
+            np.asarray(sum_spectrum),
             "{}, MSA {}".format(
                 label, om["acquisition"]["scan"]["detectors"]["EDS"]["order_nr"]
             ),
@@ -728,7 +760,7 @@ class ElidReader:
             original_metadata,
             om["acquisition"]["scan"]["detectors"]["EDS"]["offset"],
             om["acquisition"]["scan"]["detectors"]["EDS"]["dispersion"],
-            np.array(sum_spectrum),
+            np.asarray(sum_spectrum),
             "{}, Spot {}".format(
                 label, om["acquisition"]["scan"]["detectors"]["EDS"]["order_nr"]
             ),
@@ -757,10 +789,14 @@ class ElidReader:
         eds_metadata["dispersion"] = dispersion
         has_variable_real_time = self._read_bool()
         has_variable_live_time = self._read_bool()
-        data = np.empty([size, bins], dtype=np.uint32)
-        for i in range(size):
-            for bin in range(bins):
-                data[i, bin] = self._read_varuint32()
+        if self._metadata_only:
+            self._skip_varuint32s(size * bins)
+            data = get_data_placeholder([size, bins], np.uint32)
+        else:
+            data = np.empty([size, bins], dtype=np.uint32)
+            for i in range(size):
+                for bin in range(bins):
+                    data[i, bin] = self._read_varuint32()
         if has_variable_real_time:
             eds_metadata["real_time_values"] = [
                 self._read_float64() for _ in range(size)
@@ -809,11 +845,15 @@ class ElidReader:
         original_metadata["acquisition"]["scan"]["detectors"]["EDS"] = eds_metadata
         has_variable_real_time = self._read_bool()
         has_variable_live_time = self._read_bool()
-        data = np.empty([height, width, bins], dtype=np.uint32)
-        for y in range(height):
-            for x in range(width):
-                for bin in range(bins):
-                    data[y, x, bin] = self._read_varuint32()
+        if self._metadata_only:
+            self._skip_varuint32s(height * width * bins)
+            data = get_data_placeholder([height, width, bins], np.uint32)
+        else:
+            data = np.empty([height, width, bins], dtype=np.uint32)
+            for y in range(height):
+                for x in range(width):
+                    for bin in range(bins):
+                        data[y, x, bin] = self._read_varuint32()
         if has_variable_real_time:
             real_time_values = np.empty([height, width], dtype=float)
             for y in range(height):
@@ -856,7 +896,7 @@ class ElidReader:
             original_metadata,
             om["acquisition"]["scan"]["detectors"]["EDS"]["offset"],
             om["acquisition"]["scan"]["detectors"]["EDS"]["dispersion"],
-            np.array(sum_spectrum),
+            np.asarray(sum_spectrum),
             "{}, Difference {} - {}".format(label, minuend, subtrahend),
         )
 
@@ -880,7 +920,7 @@ class ElidReader:
             original_metadata,
             om["acquisition"]["scan"]["detectors"]["EDS"]["offset"],
             om["acquisition"]["scan"]["detectors"]["EDS"]["dispersion"],
-            np.array(sum_spectrum),
+            np.asarray(sum_spectrum),
             "{}, Region {}".format(
                 label, om["acquisition"]["scan"]["detectors"]["EDS"]["order_nr"]
             ),
@@ -950,7 +990,8 @@ class ElidReader:
         return [dict for dict in dictionaries if dict]
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a Phenom ``.elid`` file from the software Element Identification (>v3.8.0)
     used by the Thermo Fisher Scientific Phenom desktop SEMs.
@@ -959,14 +1000,20 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
     if lazy is not False:
         raise NotImplementedError("Lazy loading is not supported.")
 
-    reader = ElidReader(filename)
+    reader = ElidReader(filename, metadata_only=metadata_only)
     return reader.dictionaries
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
@@ -23,7 +23,14 @@ from datetime import datetime as dt
 import warnings
 import logging
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC
+from rsciio._docstrings import (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -38,7 +45,8 @@ invalid_file_error = (
 )
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a Protochips ``.csv`` logfile containing data for heater, biasing or gas
     cell experiments using an in-situ holder.
@@ -47,6 +55,7 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
@@ -54,10 +63,22 @@ def file_reader(filename, lazy=False):
         raise NotImplementedError("Lazy loading is not supported.")
 
     csv_file = ProtochipsCSV(filename)
-    return _protochips_log_reader(csv_file)
-
-
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_UNSUPPORTED_DOC, RETURNS_DOC)
+    dictionaries = _protochips_log_reader(csv_file)
+    if metadata_only:
+        # The whole csv file is parsed: the time axis and the notes stored
+        # in the original metadata are columns of the file
+        for dictionary in dictionaries:
+            data = dictionary["data"]
+            dictionary["data"] = get_data_placeholder(data.shape, data.dtype)
+    return dictionaries
+
+
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_UNSUPPORTED_DOC,
+    METADATA_ONLY_DOC,
+    RETURNS_DOC,
+)
 
 
 def _protochips_log_reader(csv_file):
@@ -80,7 +101,7 @@ class ProtochipsCSV(object):
         self._read_data()
 
     def _parse_header(self):
-        with open(self.filename, "r") as f:
+        with open_file(self.filename, "r") as f:
             s = f.readline()
             self.column_name = s.replace(", ", ",").replace("\n", "").split(",")
             if not self._is_protochips_csv_file():
@@ -70,7 +70,9 @@ from pathlib import Path
 import numpy as np
 from numpy.polynomial.polynomial import polyfit
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file, phase
 
 _logger = logging.getLogger(__name__)
 
@@ -426,11 +428,19 @@ class WDFReader(object):
         "BKXL",
     ]
 
-    def __init__(self, f, filename, use_uniform_signal_axis, load_unmatched_metadata):
+    def __init__(
+        self,
+        f,
+        filename,
+        use_uniform_signal_axis,
+        load_unmatched_metadata,
+        metadata_only=False,
+    ):
         self._file_obj = f
         self._filename = filename
         self._use_uniform_signal_axis = use_uniform_signal_axis
         self._load_unmatched_metadata = load_unmatched_metadata
+        self._metadata_only = metadata_only
 
         self.original_metadata = {}
         self._unmatched_metadata = {}
@@ -446,46 +456,49 @@ class WDFReader(object):
         self.metadata = None
 
     def read_file(self, filesize):
-        ## first parse through to determine file structure (blocks)
-        self._block_info = self.locate_all_blocks(filesize)
-
-        ## parse header, this needs to be done first as it contains sizes for ORGN, DATA, XLST, YLST
-        header_data = self._parse_WDF1()
-        self._points_per_spectrum = header_data["points_per_spectrum"]
-        self._num_spectra = header_data["num_spectra"]
-        self._measurement_type = header_data["measurement_type"]
-
-        ## parse metadata blocks
-        self._parse_YLST(header_data["YLST_length"])
-        self._parse_metadata("WXIS_0")
-        self._parse_metadata("WXCS_0")
-        ## WXDA has extra 1025 bytes at the end (newline: n\x00\x00...)
-        self._parse_metadata("WXDA_0")
-        self._parse_metadata("ZLDC_0")
-        self._parse_metadata("WARP_0")
-        self._parse_metadata("WARP_1")
-        self._parse_metadata("WXDM_0")
-        self._map_WXDM()
-        self._parse_MAP("MAP_0")
-        self._parse_MAP("MAP_1")
-        self._parse_TEXT()
-        self._parse_WHTL()
-
-        ## parse blocks with axes information
-        signal_dict = self._parse_XLST()
-        nav_orgn = self._parse_ORGN(header_data["num_ORGN"])
-        nav_wmap = self._parse_WMAP()
-
-        ## set axes
-        nav_dict = self._set_nav_axes(nav_orgn, nav_wmap)
-        self.axes = self._set_axes(signal_dict, nav_dict)
+        with phase("header"):
+            ## first parse through to determine file structure (blocks)
+            self._block_info = self.locate_all_blocks(filesize)
+
+            ## parse header, this needs to be done first as it contains sizes for ORGN, DATA, XLST, YLST
+            header_data = self._parse_WDF1()
+            self._points_per_spectrum = header_data["points_per_spectrum"]
+            self._num_spectra = header_data["num_spectra"]
+            self._measurement_type = header_data["measurement_type"]
+
+            ## parse metadata blocks
+            self._parse_YLST(header_data["YLST_length"])
+            self._parse_metadata("WXIS_0")
+            self._parse_metadata("WXCS_0")
+            ## WXDA has extra 1025 bytes at the end (newline: n\x00\x00...)
+            self._parse_metadata("WXDA_0")
+            self._parse_metadata("ZLDC_0")
+            self._parse_metadata("WARP_0")
+            self._parse_metadata("WARP_1")
+            self._parse_metadata("WXDM_0")
+            self._map_WXDM()
+            self._parse_MAP("MAP_0")
+            self._parse_MAP("MAP_1")
+            self._parse_TEXT()
+            self._parse_WHTL()
+
+            ## parse blocks with axes information
+            signal_dict = self._parse_XLST()
+            nav_orgn = self._parse_ORGN(header_data["num_ORGN"])
+            nav_wmap = self._parse_WMAP()
+
+            ## set axes
+            nav_dict = self._set_nav_axes(nav_orgn, nav_wmap)
+            self.axes = self._set_axes(signal_dict, nav_dict)
 
         ## extract data + reshape
-        self.data = self._parse_DATA()
-        self._reshape_data()
+        with phase("data"):
+            self.data = self._parse_DATA()
+            self._reshape_data()
 
         ## map metadata
-        self.metadata = self.map_metadata()
+        with phase("metadata"):
+            self.metadata = self.map_metadata()
 
         ## debug unmatched metadata
         if self._load_unmatched_metadata:
@@ -499,7 +512,10 @@ class WDFReader(object):
                 f"Input: {type}\n"
                 f"Supported types: {list(TypeNames.keys())}"
             )
-        data = np.fromfile(self._file_obj, dtype=TypeNames[type], count=size)
+        # Read through the buffer of the file object: `np.fromfile` reads a
+        # whole block from the disk for each value of the metadata
+        data = np.empty(size, dtype=TypeNames[type])
+        data = data[: self._file_obj.readinto(data) // data.itemsize]
         ## convert unsigned ints to ints
         ## because int + uint = float -> problems with indexing
         if type in ["uint8", "uint16", "uint32", "uint64"] and convert:
@@ -1115,6 +1131,8 @@ class WDFReader(object):
         pos, block_size = self._block_info["DATA_0"]
         size = self._points_per_spectrum * self._num_spectra
         self._check_block_size("DATA", "Data", block_size - 16, 4 * size)
+        if self._metadata_only:
+            return get_data_placeholder((size,), TypeNames["float"])
         self._file_obj.seek(pos)
         return self.__read_numeric("float", size=size)
 
@@ -1134,7 +1152,10 @@ class WDFReader(object):
                 "Axes sizes do not match data size.\n"
                 "Data is averaged over multiple collected spectra."
             )
-            self.data = np.mean(self.data.reshape(self._num_spectra, -1), axis=0)
+            if self._metadata_only:
+                self.data = self.data[: self._points_per_spectrum]
+            else:
+                self.data = np.mean(self.data.reshape(self._num_spectra, -1), axis=0)
 
         axes_sizes.append(signal_size)
         self.data = np.reshape(self.data, axes_sizes)
@@ -1284,11 +1305,13 @@ class WDFReader(object):
         self.original_metadata.update({"WHTL_0": whtl_metadata})
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
     use_uniform_signal_axis=True,
     load_unmatched_metadata=False,
+    metadata_only=False,
 ):
     """
     Read Renishaw's ``.wdf`` file.
@@ -1309,6 +1332,7 @@ def file_reader(
         `True`, this metadata will be included and can be accessed by
         ``s.original_metadata.UNMATCHED``,
         otherwise the ``UNMATCHED`` tag will not exist.
+    %s
 
     %s
     """
@@ -1318,12 +1342,13 @@ def file_reader(
     filesize = Path(filename).stat().st_size
     original_filename = Path(filename).name
     dictionary = {}
-    with open(str(filename), "rb") as f:
+    with open_file(str(filename), "rb") as f:
         wdf = WDFReader(
             f,
             filename=original_filename,
             use_uniform_signal_axis=use_uniform_signal_axis,
             load_unmatched_metadata=load_unmatched_metadata,
+            metadata_only=metadata_only,
         )
         wdf.read_file(filesize)
 
@@ -1337,4 +1362,4 @@ def file_reader(
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
@@ -21,7 +21,6 @@
 #  and
 #  https://www.nist.gov/services-resources/software/lispixdoc/image-file-formats/raw-file-format.htm
 
-import codecs
 import os.path
 from io import StringIO
 import logging
@@ -31,13 +30,17 @@ import numpy as np
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    CHUNKS_READ_DOC,
     ENCODING_DOC,
     MMAP_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
 from rsciio._version import __version__
+from rsciio.utils.array import get_data_placeholder, get_signal_aware_dask_array
 from rsciio.utils.tools import DTBox
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -189,7 +192,7 @@ def parse_ripple(fp):
     return rpl_info
 
 
-def read_raw(rpl_info, filename, mmap_mode="c"):
+def read_raw(rpl_info, filename, mmap_mode="c", metadata_only=False):
     """Read the raw file object 'fp' based on the information given in the
     'rpl_info' dictionary.
 
@@ -201,6 +204,8 @@ def read_raw(rpl_info, filename, mmap_mode="c"):
         The filename of the raw file.
     mmap_mode : str, default='c'
         The mmap_mode to use to read the file.
+    metadata_only : bool, default=False
+        If True, return a placeholder instead of the memory-mapped data.
     """
     width = rpl_info["width"]
     height = rpl_info["height"]
@@ -231,22 +236,35 @@ def read_raw(rpl_info, filename, mmap_mode="c"):
     data_type = np.dtype(data_type)
     data_type = data_type.newbyteorder(endian)
 
-    data = np.memmap(filename, offset=offset, dtype=data_type, mode=mmap_mode)
-
     if record_by == "vector":  # spectral image
         size = (height, width, depth)
-        data = data.reshape(size)
     elif record_by == "image":  # stack of images
         size = (depth, height, width)
-        data = data.reshape(size)
     elif record_by == "dont-care":  # stack of images
         size = (height, width)
+    else:
+        size = None
+
+    if metadata_only:
+        if size is None:
+            size = ((os.path.getsize(filename) - offset) // data_type.itemsize,)
+        return get_data_placeholder(size, data_type)
+
+    data = np.memmap(filename, offset=offset, dtype=data_type, mode=mmap_mode)
+    if size is not None:
         data = data.reshape(size)
     return data
 
 
+@instrumented
 def file_reader(
-    filename, lazy=False, rpl_info=None, encoding="latin-1", mmap_mode=None
+    filename,
+    lazy=False,
+    rpl_info=None,
+    encoding="latin-1",
+    mmap_mode=None,
+    metadata_only=False,
+    chunks="auto",
 ):
     """
     Read a ripple/raw file.
@@ -264,12 +282,16 @@ def file_reader(
         automatically from the ``.rpl`` file.
     %s
     %s
+    %s
+    %s
 
     %s
     """
     if not rpl_info:
         if filename[-3:] in file_extensions:
-            with codecs.open(filename, encoding=encoding, errors="replace") as f:
+            with open_file(
+                filename, encoding=encoding, errors="replace", newline=""
+            ) as f:
                 rpl_info = parse_ripple(f)
         else:
             raise IOError('File has wrong extension: "%s"' % filename[-3:])
@@ -287,7 +309,9 @@ def file_reader(
         mmap_mode = "r"
     else:
         mmap_mode = "c"
-    data = read_raw(rpl_info, rawfname, mmap_mode=mmap_mode)
+    data = read_raw(
+        rpl_info, rawfname, mmap_mode=mmap_mode, metadata_only=metadata_only
+    )
 
     if rpl_info["record-by"] == "vector":
         _logger.info("Loading as Signal1D")
@@ -443,8 +467,13 @@ def file_reader(
             )
             index_in_array += 1
 
+    data = data.squeeze()
+    if lazy and not metadata_only:
+        signal_axes = [i for i, axis in enumerate(axes) if not axis["navigate"]]
+        data = get_signal_aware_dask_array(data, signal_axes, chunks=chunks)
+
     dictionary = {
-        "data": data.squeeze(),
+        "data": data,
         "axes": axes,
         "metadata": mp.to_dict(),
         "original_metadata": rpl_info,
@@ -454,9 +483,18 @@ def file_reader(
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, ENCODING_DOC, MMAP_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    ENCODING_DOC,
+    MMAP_DOC,
+    METADATA_ONLY_DOC,
+    CHUNKS_READ_DOC,
+    RETURNS_DOC,
+)
 
 
+@instrumented
 def file_writer(filename, signal, encoding="latin-1"):
     """
     Write a ripple/raw file.
@@ -600,7 +638,7 @@ file_writer.__doc__ %= (
 
 
 def write_rpl(filename, keys_dictionary, encoding="ascii"):
-    with codecs.open(filename, "w", encoding=encoding, errors="ignore") as f:
+    with open_file(filename, "w", encoding=encoding, errors="ignore", newline="") as f:
         f.write(f";File created by RosettaSciIO version {__version__}\n")
         f.write("key\tvalue\n")
         # Even if it is not necessary, we sort the keywords when writing
@@ -84,10 +84,13 @@ import numpy as np
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import sarray2dict, DTBox
+from rsciio.utils.instrumentation import instrumented, open_file
 
 
 _logger = logging.getLogger(__name__)
@@ -346,7 +349,7 @@ class SemperFormat(object):
         return data, iform
 
     @classmethod
-    def load_from_unf(cls, filename, lazy=False):
+    def load_from_unf(cls, filename, lazy=False, metadata_only=False):
         r"""Load a `.unf`-file into a :class:`~.SemperFormat` object.
 
         Parameters
@@ -354,6 +357,11 @@ class SemperFormat(object):
         filename : string
             The name of the unf-file from which to load the data. Standard
             format is '\*.unf'.
+        lazy : bool
+            If True, the data is read on demand.
+        metadata_only : bool
+            If True, the data is a placeholder and the records of the
+            picture are not read.
 
         Returns
         -------
@@ -362,7 +370,7 @@ class SemperFormat(object):
 
         """
         metadata = OrderedDict()
-        with open(filename, "rb") as f:
+        with open_file(filename, "rb") as f:
             # Read header:
             rec_length = np.fromfile(f, dtype="<i4", count=1)[0]  # length of header
             header = np.fromfile(f, dtype=cls.HEADER_DTYPES[: rec_length // 2], count=1)
@@ -394,7 +402,9 @@ class SemperFormat(object):
             # Read picture data:
             pos = f.tell()
             shape = metadata["NLAY"], metadata["NROW"], metadata["NCOL"]
-            if lazy:
+            if metadata_only:
+                data = get_data_placeholder(shape, data_format)
+            elif lazy:
                 from dask.array import from_delayed
                 from dask import delayed
 
@@ -438,7 +448,7 @@ class SemperFormat(object):
         nlay, nrow, ncol = self.data.shape
         data, iform = self._check_format(self.data)
         title = self.title if self.title is not None else ""
-        with open(filename, "wb") as f:
+        with open_file(filename, "wb") as f:
             if not skip_header:
                 # Create header:
                 header = np.zeros(
@@ -649,7 +659,7 @@ def pack_to_intbytes(fmt, value):
 
 def _read_data(fobj, fname, position, data_format, shape):
     if fobj.closed:
-        fobj = open(fname, "rb")
+        fobj = open_file(fname, "rb")
     fobj.seek(position)
     nlay, nrow, ncol = shape
     data = np.empty(shape, dtype=data_format)
@@ -669,7 +679,8 @@ def _read_data(fobj, fname, position, data_format, shape):
     return data
 
 
-def file_reader(filename, lazy=False):
+@instrumented
+def file_reader(filename, lazy=False, metadata_only=False):
     """
     Read a Semper ``.unf`` file.
 
@@ -677,17 +688,21 @@ def file_reader(filename, lazy=False):
     ----------
     %s
     %s
+    %s
 
     %s
     """
-    semper = SemperFormat.load_from_unf(filename, lazy=lazy)
+    semper = SemperFormat.load_from_unf(
+        filename, lazy=lazy, metadata_only=metadata_only
+    )
     semper.log_info()
-    return [semper.to_dictionary(lazy=lazy)]
+    return [semper.to_dictionary(lazy=lazy and not metadata_only)]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
+@instrumented
 def file_writer(filename, signal, skip_header=False):
     """
     Write signal to a Semper ``.unf`` file.
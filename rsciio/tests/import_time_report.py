@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""
+Report the import time of each plugin and the heavy dependencies imported
+when importing the plugin. Each plugin is imported in a fresh interpreter.
+
+Usage::
+
+    python -m rsciio.tests.import_time_report
+"""
+
+import json
+import subprocess
+import sys
+
+
+# Dependencies which are slow to import and should only be imported when
+# they are needed by a code path of the plugin
+HEAVY_DEPENDENCIES = [
+    "dask",
+    "h5py",
+    "numba",
+    "numcodecs",
+    "pint",
+    "scipy",
+    "skimage",
+    "sparse",
+    "tifffile",
+    "zarr",
+]
+
+_CODE = """
+import json, sys, time
+t0 = time.perf_counter()
+try:
+    import {module}
+except ImportError as e:
+    print(json.dumps({{"error": str(e)}}))
+else:
+    t = time.perf_counter() - t0
+    print(json.dumps({{
+        "import_time": t,
+        "dependencies": [m for m in {dependencies} if m in sys.modules],
+    }}))
+"""
+
+
+def get_import_report(module):
+    """
+    Import ``module`` in a new python interpreter.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module to import, e.g. ``"rsciio.hspy"``.
+
+    Returns
+    -------
+    dict
+        Dictionary with the ``import_time`` (in s) and the imported heavy
+        ``dependencies``, or with an ``error`` key if the module can't be
+        imported, for example, because of a missing optional dependency.
+    """
+    code = _CODE.format(module=module, dependencies=HEAVY_DEPENDENCIES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    from rsciio import IO_PLUGINS
+
+    print(f"{'plugin':<26}{'time (ms)':>10}  heavy dependencies")
+    for plugin in IO_PLUGINS:
+        report = get_import_report(plugin["api"])
+        if "error" in report:
+            print(f"{plugin['api']:<26}{'-':>10}  {report['error']}")
+        else:
+            print(
+                f"{plugin['api']:<26}{report['import_time'] * 1e3:>10.0f}  "
+                f"{', '.join(report['dependencies'])}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -431,6 +431,14 @@ def test_load_lazy():
     assert isinstance(s.data, Array)
 
 
+def test_load_lazy_chunks():
+    s = hs.load(FILE2, lazy=True)
+    # chunks contain entire signals
+    assert s.data.chunks[-2:] == ((5,), (5,))
+    s = hs.load(FILE2, lazy=True, chunks=(1, 1, 5, 5))
+    assert s.data.chunksize == (1, 1, 5, 5)
+
+
 def test_load_to_memory():
     s = hs.load(FILE2, lazy=False)
     assert isinstance(s.data, np.ndarray)
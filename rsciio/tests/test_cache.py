@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import os
+from pathlib import Path
+import shutil
+
+import numpy as np
+import pytest
+
+from rsciio.utils import cache
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    directory = tmp_path / "cache"
+    with cache.header_cache(directory):
+        yield directory
+
+
+def test_cache_disabled_by_default(tmp_path):
+    assert not cache.is_cache_enabled()
+    fname = tmp_path / "file.bin"
+    fname.write_bytes(b"content")
+    cache.set_entry(fname, "test.entry", 1)
+    assert cache.get_entry(fname, "test.entry") is None
+
+
+def test_header_cache_context(tmp_path):
+    with cache.header_cache(tmp_path):
+        assert cache.is_cache_enabled()
+    assert not cache.is_cache_enabled()
+
+
+def test_set_get_entry(cache_dir, tmp_path):
+    fname = tmp_path / "file.bin"
+    fname.write_bytes(b"content")
+    value = {"offsets": np.arange(10), "name": "header"}
+    assert cache.get_entry(fname, "test.entry") is None
+    cache.set_entry(fname, "test.entry", value)
+    cached = cache.get_entry(str(fname), "test.entry")
+    np.testing.assert_array_equal(cached["offsets"], value["offsets"])
+    assert cached["name"] == "header"
+    assert cache.get_entry(fname, "test.other") is None
+    info = cache.cache_info()
+    assert info["directory"] == cache_dir
+    assert info["entries"] == 1
+    assert info["size"] > 0
+    cache.clear_cache()
+    assert cache.cache_info()["entries"] == 0
+
+
+def test_entry_invalidated_by_modification(cache_dir, tmp_path):
+    fname = tmp_path / "file.bin"
+    fname.write_bytes(b"content")
+    cache.set_entry(fname, "test.entry", 1)
+    # same size and modification time, different content
+    stat = fname.stat()
+    fname.write_bytes(b"CONTENT")
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.get_entry(fname, "test.entry") is None
+
+
+def test_entry_not_file_like(cache_dir):
+    cache.set_entry(object(), "test.entry", 1)
+    assert cache.get_entry(object(), "test.entry") is None
+    assert cache.get_entry("missing_file.bin", "test.entry") is None
+
+
+def test_corrupted_entry(cache_dir, tmp_path):
+    fname = tmp_path / "file.bin"
+    fname.write_bytes(b"content")
+    cache.set_entry(fname, "test.entry", 1)
+    entry = next(cache_dir.iterdir())
+    entry.write_bytes(b"corrupted")
+    assert cache.get_entry(fname, "test.entry") is None
+    assert not entry.exists()
+
+
+def test_eviction(tmp_path):
+    fnames = []
+    for i in range(3):
+        fname = tmp_path / f"file{i}.bin"
+        fname.write_bytes(b"content")
+        fnames.append(fname)
+    directory = tmp_path / "cache"
+    with cache.header_cache(directory, max_size=2500):
+        cache.set_entry(fnames[0], "test.entry", bytes(1000))
+        cache.set_entry(fnames[1], "test.entry", bytes(1000))
+        # order the access times of the entries explicitly
+        for i, t in enumerate((1, 0)):
+            key = cache._get_key(fnames[i], "test.entry")
+            os.utime(directory / f"{key}.pkl", ns=(t * 10**9, t * 10**9))
+        # the least recently used entry is removed
+        cache.set_entry(fnames[2], "test.entry", bytes(1000))
+        assert cache.cache_info()["entries"] == 2
+        assert cache.get_entry(fnames[1], "test.entry") is None
+        assert cache.get_entry(fnames[0], "test.entry") is not None
+        assert cache.get_entry(fnames[2], "test.entry") is not None
+        # too large to be stored
+        cache.set_entry(fnames[1], "test.entry", bytes(3000))
+        assert cache.get_entry(fnames[1], "test.entry") is None
+
+
+def test_digitalmicrograph_cache(cache_dir, tmp_path):
+    from rsciio.digitalmicrograph import file_reader
+
+    fname = tmp_path / "test.dm3"
+    shutil.copy(TEST_DATA_PATH / "digitalmicrograph" / "2D" / "test-1.dm3", fname)
+    s = file_reader(fname)
+    assert cache.cache_info()["entries"] == 1
+    s2 = file_reader(fname)
+    np.testing.assert_array_equal(s[0]["data"], s2[0]["data"])
+    assert s[0]["original_metadata"] == s2[0]["original_metadata"]
+
+
+def test_bruker_cache(cache_dir):
+    from rsciio.bruker import file_reader
+
+    fname = (
+        TEST_DATA_PATH / "bruker" / "30x30_instructively_packed_16bit_compressed.bcf"
+    )
+    s = file_reader(fname)
+    assert cache.cache_info()["entries"] == 1
+    s2 = file_reader(fname)
+    assert len(s) == len(s2)
+    for d, d2 in zip(s, s2):
+        np.testing.assert_array_equal(d["data"], d2["data"])
+        assert d["metadata"] == d2["metadata"]
+
+
+def test_jeol_pts_cache(cache_dir):
+    from rsciio.jeol import file_reader
+
+    fname = TEST_DATA_PATH / "jeol" / "Sample" / "00_View000" / "View000_0000006.pts"
+    kwargs = dict(downsample=[32, 32], rebin_energy=512, SI_dtype=np.int32)
+    s = file_reader(fname, sum_frames=False, **kwargs)
+    index = s[0]["original_metadata"]["jeol_pts_frame_start_index"]
+    assert cache.cache_info()["entries"] == 1
+    np.testing.assert_array_equal(
+        cache.get_entry(fname, "jeol.frame_start_index"), index
+    )
+    # the index of all frames is known without scanning the file
+    s2 = file_reader(fname, frame_list=[2, 5], sum_frames=False, **kwargs)
+    index2 = s2[0]["original_metadata"]["jeol_pts_frame_start_index"]
+    np.testing.assert_array_equal(index2, index)
+    np.testing.assert_array_equal(s2[0]["data"], s[0]["data"][[2, 5]])
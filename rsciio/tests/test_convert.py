@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import importlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rsciio import convert
+from rsciio.__main__ import main
+from rsciio._detect_format import detect_format
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+BLOCKFILE = TEST_DATA_PATH / "blockfile" / "test2.blo"
+
+
+def _read(filename):
+    plugin = detect_format(filename)[0]
+    return importlib.import_module(plugin["api"]).file_reader(str(filename))[0]
+
+
+@pytest.mark.parametrize("extension", ("zspy", "hspy", "nxs", "tvips"))
+def test_convert(tmp_path, extension):
+    dst = tmp_path / f"test2.{extension}"
+    reports = convert(BLOCKFILE, dst, show_progressbar=False)
+    assert len(reports) == 1
+    assert reports[0]["nbytes"] == 150
+    assert reports[0]["throughput"] > 0
+
+    if extension == "tvips":
+        dst = tmp_path / "test2_000.tvips"
+    expected = _read(BLOCKFILE)
+    result = _read(dst)
+    np.testing.assert_array_equal(
+        result["data"].reshape(expected["data"].shape), expected["data"]
+    )
+
+
+def test_convert_chunks_workers(tmp_path):
+    dst = tmp_path / "test2.zspy"
+    convert(BLOCKFILE, dst, chunks=(1, 1, 5, 5), workers=2, show_progressbar=False)
+    result = _read(dst)
+    np.testing.assert_array_equal(result["data"], _read(BLOCKFILE)["data"])
+    assert result["metadata"]["General"]["title"] == "test2"
+    assert result["axes"][0]["scale"] == 64.0
+    # one file per chunk
+    chunk_files = (dst / "Experiments" / "test2" / "data").glob("*/*/*/*")
+    assert len(list(chunk_files)) == 6
+
+
+def test_convert_resume(tmp_path, caplog):
+    dst = tmp_path / "test2.zspy"
+    convert(BLOCKFILE, dst, chunks=(1, 1, 5, 5), show_progressbar=False)
+    # remove two chunks as if the conversion had been interrupted
+    data_path = dst / "Experiments" / "test2" / "data"
+    (data_path / "0" / "1" / "0" / "0").unlink()
+    (data_path / "1" / "2" / "0" / "0").unlink()
+
+    with caplog.at_level("INFO"):
+        convert(BLOCKFILE, dst, resume=True, show_progressbar=False)
+    assert "2 chunks out of 6 to write" in caplog.text
+    np.testing.assert_array_equal(_read(dst)["data"], _read(BLOCKFILE)["data"])
+
+
+def test_convert_resume_missing_output(tmp_path):
+    dst = tmp_path / "test2.zspy"
+    convert(BLOCKFILE, dst, resume=True, show_progressbar=False)
+    np.testing.assert_array_equal(_read(dst)["data"], _read(BLOCKFILE)["data"])
+
+
+def test_convert_resume_not_supported(tmp_path):
+    with pytest.raises(ValueError, match="Resuming is not supported"):
+        convert(BLOCKFILE, tmp_path / "test2.hspy", resume=True)
+
+
+def test_convert_unknown_extension(tmp_path):
+    with pytest.raises(ValueError, match="extension 'xyz'"):
+        convert(BLOCKFILE, tmp_path / "test2.xyz")
+
+
+def test_convert_writer(tmp_path):
+    dst = tmp_path / "test2.hdf5"
+    convert(BLOCKFILE, dst, writer="hspy", show_progressbar=False)
+    assert _read(dst)["data"].shape == (2, 3, 5, 5)
+    with pytest.raises(ValueError, match="doesn't support writing"):
+        convert(BLOCKFILE, dst, writer="DigitalMicrograph")
+
+
+def test_cli_convert(tmp_path, capsys):
+    dst = tmp_path / "test2.zspy"
+    assert main(["convert", str(BLOCKFILE), str(dst), "--chunks", "1,1,-1,-1"]) == 0
+    assert "MiB/s" in capsys.readouterr().out
+    assert _read(dst)["data"].shape == (2, 3, 5, 5)
+
+
+def test_cli_convert_error(tmp_path, capsys):
+    assert main(["convert", str(BLOCKFILE), str(tmp_path / "test2.xyz")]) == 1
+    assert "Error" in capsys.readouterr().err
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import builtins
+from pathlib import Path
+import shutil
+
+import pytest
+
+from rsciio import IO_PLUGINS, detect_format
+import rsciio._detect_format
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+
+
+def _names(plugins):
+    return [plugin["name"] for plugin in plugins]
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("blockfile/test1.blo", "Blockfile"),
+        ("bruker/test_TEM.bcf", "Bruker"),
+        ("bruker/bruker_nano.spx", "Bruker"),
+        ("digitalmicrograph/1D/test-1.dm3", "DigitalMicrograph"),
+        ("digitalmicrograph/1D/test-1.dm4", "DigitalMicrograph"),
+        ("digitalsurf/test_spectrum_compressed.pro", "DigitalSurf"),
+        ("emd/example_image.emd", "EMD"),
+        ("emd/fei_example_complex_fft.emd", "EMD"),
+        ("hspy/example1_v1.0.hdf5", "HSPY"),
+        ("hspy/example2_v3.1.hspy", "HSPY"),
+        ("msa/example1.msa", "MSA"),
+        ("mrc/HAADFscan.mrc", "MRC"),
+        ("nexus/simple_signal.nxs", "NeXus"),
+        ("phenom/Elid2Version0.elid", "Phenom"),
+        ("renishaw/renishaw_test_spectrum.wdf", "Renishaw"),
+        ("tia/new/128x128-TEM_search.emi", "TIA"),
+        ("tiff/olympus_SIS.tif", "TIFF"),
+        ("tiff/test_dm_image_um_unit.dm3", "DigitalMicrograph"),
+        ("trivista/linescan.tvf", "TriVista"),
+        ("protochips/protochips_gas_cell.csv", "Protochips"),
+        ("impulse/StubExperiment_Heat raw.csv", "Impulse"),
+    ],
+)
+def test_detect_format(filename, expected):
+    plugins = detect_format(TEST_DATA_PATH / filename)
+    assert plugins[0]["name"] == expected
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("hspy/example2_v3.1.hspy", "HSPY"),
+        ("nexus/simple_signal.nxs", "NeXus"),
+        ("emd/example_image.emd", "EMD"),
+    ],
+)
+def test_detect_format_ignore_extension(tmp_path, filename, expected):
+    # the hints found in the header take precedence over the extension
+    fname = tmp_path / "file.hdf5"
+    shutil.copy(TEST_DATA_PATH / filename, fname)
+    plugins = detect_format(fname)
+    assert plugins[0]["name"] == expected
+
+
+def test_detect_format_wrong_extension(tmp_path):
+    fname = tmp_path / "file.msa"
+    shutil.copy(TEST_DATA_PATH / "tiff" / "olympus_SIS.tif", fname)
+    assert _names(detect_format(fname)) == ["TIFF"]
+
+
+def test_detect_format_signature_not_matching(tmp_path):
+    fname = tmp_path / "file.dm3"
+    fname.write_bytes(b"not a digital micrograph file")
+    assert detect_format(fname) == []
+
+
+def test_detect_format_extension_only():
+    fname = TEST_DATA_PATH / "ripple" / "test_ripple_sdim-1_ndim-0_float32.rpl"
+    assert _names(detect_format(fname)) == ["Ripple"]
+
+
+def test_detect_format_zspy_directory(tmp_path):
+    zarr = pytest.importorskip("zarr")
+    fname = tmp_path / "file.zarr"
+    f = zarr.open_group(str(fname), mode="w")
+    f.attrs["file_format"] = "ZSpy"
+    assert _names(detect_format(fname)) == ["ZSPY"]
+
+
+@pytest.mark.parametrize("userblock_size", [0, 512, 2048])
+def test_detect_format_hdf5_userblock(tmp_path, userblock_size):
+    h5py = pytest.importorskip("h5py")
+    fname = tmp_path / "file.h5"
+    with h5py.File(fname, mode="w", userblock_size=userblock_size) as f:
+        f.create_group("Experiments")
+    names = _names(detect_format(fname))
+    assert names[0] == "HSPY"
+    assert {"EMD", "NeXus", "USID"} <= set(names)
+
+
+def test_detect_format_plugins():
+    fname = TEST_DATA_PATH / "hspy" / "example2_v3.1.hspy"
+    plugins = [plugin for plugin in IO_PLUGINS if plugin["name"] != "HSPY"]
+    assert "HSPY" not in _names(detect_format(fname, plugins=plugins))
+
+
+def test_detect_format_single_read(monkeypatch):
+    calls = []
+
+    def _open(*args, **kwargs):
+        f = builtins.open(*args, **kwargs)
+        calls.append(f)
+        return f
+
+    monkeypatch.setattr(rsciio._detect_format, "open", _open, raising=False)
+    detect_format(TEST_DATA_PATH / "emd" / "example_image.emd")
+    assert len(calls) == 1
+
+
+def test_magic_specifications():
+    for plugin in IO_PLUGINS:
+        for key in ["magic_signatures", "magic_hints"]:
+            for signature in plugin.get(key, []):
+                assert set(signature) - {"offset", "hex", "ascii"} == set()
+                assert ("hex" in signature) != ("ascii" in signature)
+                if "hex" in signature:
+                    bytes.fromhex(signature["hex"])
+                offset = signature.get("offset", [])
+                offsets = offset if isinstance(offset, list) else [offset]
+                assert all(isinstance(i, int) for i in offsets)
@@ -604,3 +604,32 @@ class TestSpdMap_061_xrf:
 def test_unsupported_extension():
     with pytest.raises(ValueError):
         file_reader("fname.unsupported_extension")
+
+
+def test_spd_lazy_chunks():
+    filename = os.path.join(TMP_DIR.name, "spd_map.spd")
+    s = hs.load(filename)
+    s2 = hs.load(filename, lazy=True)
+    # chunks contain entire spectra
+    assert s2.data.chunks[-1] == (2500,)
+    s3 = hs.load(filename, lazy=True, chunks=(100, 128, 500))
+    assert s3.data.chunks == ((100, 100), (128, 128), (500,) * 5)
+    for lazy_signal in (s2, s3):
+        np.testing.assert_array_equal(lazy_signal.data.compute(), s.data)
+    # for windows
+    del s, s2, s3
+    gc.collect()
+
+
+def test_spc_lazy_chunks():
+    filename = os.path.join(TMP_DIR.name, "spc0_61-ipr333_xrf.spc")
+    s = hs.load(filename)
+    s2 = hs.load(filename, lazy=True)
+    # the chunk contains the entire spectrum
+    assert s2.data.chunks == ((s.data.size,),)
+    s3 = hs.load(filename, lazy=True, chunks=1000)
+    assert s3.data.chunksize == (1000,)
+    for lazy_signal in (s2, s3):
+        np.testing.assert_array_equal(lazy_signal.data.compute(), s.data)
+    del s, s2, s3
+    gc.collect()
@@ -115,3 +115,19 @@ def test_parse_xml_1_2_0():
     assert info["scan_x"] == 128
     assert info["scan_y"] == 128
     assert info["raw_filename"] == "scan_x128_y128.raw"
+
+
+def test_read_map_lazy_chunks():
+    s = hs.load(DATA_DIR / "map4x4.xml", reader="EMPAD")
+    s2 = hs.load(DATA_DIR / "map4x4.xml", lazy=True, reader="EMPAD")
+    # chunks contain entire images
+    assert s2.data.chunksize[-2:] == (128, 128)
+    s3 = hs.load(
+        DATA_DIR / "map4x4.xml", lazy=True, chunks=(2, 2, 64, 128), reader="EMPAD"
+    )
+    assert s3.data.chunks == ((2, 2), (2, 2), (64, 64), (128,))
+    for lazy_signal in (s2, s3):
+        np.testing.assert_array_equal(lazy_signal.data.compute(), s.data)
+    # for windows
+    del s, s2, s3
+    gc.collect()
@@ -16,11 +16,14 @@
 # You should have received a copy of the GNU General Public License
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import importlib
+import itertools
 import logging
 from pathlib import Path
 import sys
 import time
 
+import dask
 import dask.array as da
 import h5py
 import numpy as np
@@ -33,7 +36,8 @@ from hyperspy.decorators import lazifyTestClass
 from hyperspy.misc.test_utils import assert_deep_almost_equal
 from hyperspy.misc.test_utils import sanitize_dict as san_dict
 
-from rsciio._hierarchical import get_signal_chunks
+from rsciio._hierarchical import get_signal_chunks, plan_chunks
+from rsciio.utils.array import _open_with_chunk_cache
 from rsciio.utils.tools import get_file_handle
 
 
@@ -272,10 +276,13 @@ class TestSavingMetadataContainers:
     def test_unsupported_type(self, tmp_path, file):
         s = self.s
         s.metadata.set_item("test", hs.roi.Point2DROI(1, 2))
+        s.metadata.set_item("test2", 2.0)
         fname = tmp_path / file
         s.save(fname)
         l = hs.load(fname)
         assert "test" not in l.metadata
+        # the other attributes of the group are written
+        assert l.metadata.test2 == 2.0
 
     @zspy_marker
     def test_date_time(self, tmp_path, file):
@@ -880,6 +887,74 @@ def test_save_ragged_dim(tmp_path, file, nav_dim):
         np.testing.assert_allclose(s.data[indices], s2.data[indices])
 
 
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_save_ragged_chunks(tmp_path, file, lazy):
+    rng = np.random.default_rng(0)
+    data = np.empty((20, 30), dtype=object)
+    for ind in np.ndindex(data.shape):
+        data[ind] = rng.random((rng.integers(0, 5), 2))
+    s = hs.signals.BaseSignal(data, ragged=True)
+    if lazy:
+        s = s.as_lazy()
+        s.data = s.data.rechunk((8, 16))
+        chunks = None
+    else:
+        chunks = (8, 16)
+    filename = tmp_path / file
+    s.save(filename, chunks=chunks)
+
+    if file.endswith("hspy"):
+        f = h5py.File(filename, "r")
+    else:
+        f = zarr.open(str(filename), mode="r")
+    group = f["Experiments/__unnamed__"]
+    assert group["data"].chunks == (8, 16)
+    assert group["_ragged_shapes_data"].chunks == (8, 16)
+    if file.endswith("hspy"):
+        f.close()
+
+    s2 = hs.load(filename)
+    for indices in np.ndindex(data.shape):
+        np.testing.assert_allclose(s2.data[indices], data[indices])
+
+
+def test_get_ragged_chunks():
+    from rsciio._hierarchical import _get_ragged_chunks
+
+    data = np.empty((100, 100), dtype=object)
+    for ind in np.ndindex(data.shape):
+        data[ind] = np.zeros((5, 2))
+    # 80 bytes per array
+    assert _get_ragged_chunks(data, (), target_size=80 * 100) == (10, 10)
+    assert _get_ragged_chunks(data, (), target_size=1e6) == (100, 100)
+
+
+@zspy_marker
+def test_load_ragged_lazy(tmp_path, file):
+    rng = np.random.default_rng(0)
+    data = np.empty((6, 8), dtype=object)
+    for ind in np.ndindex(data.shape):
+        data[ind] = rng.random((rng.integers(0, 5), 2))
+    # arrays with different number of dimensions
+    data[0, 1] = np.arange(3.0)
+    s = hs.signals.BaseSignal(data, ragged=True)
+    filename = tmp_path / file
+    s.save(filename)
+
+    s2 = hs.load(filename, lazy=True)
+    assert s2._lazy and s2.ragged
+    assert isinstance(s2.data, da.Array)
+    assert s2.data.dtype == object
+    roi = s2.data[1:4, 2:7].compute()
+    assert roi.shape == (3, 5)
+    for indices in np.ndindex(roi.shape):
+        np.testing.assert_allclose(roi[indices], data[1:4, 2:7][indices])
+    s2.compute()
+    for indices in np.ndindex(data.shape):
+        np.testing.assert_allclose(s2.data[indices], data[indices])
+
+
 def test_load_missing_extension(caplog):
     path = TEST_DATA_PATH / "hspy_ext_missing.hspy"
     with pytest.warns(UserWarning):
@@ -982,6 +1057,55 @@ def test_saving_overwrite_data(tmp_path, file):
     # make sure we can open it after, file haven't been corrupted
     _ = hs.load(fname)
 
+
+def _get_raw_chunks(filename):
+    with h5py.File(filename, "r") as f:
+        dset = f["Experiments/__unnamed__/data"]
+        chunks = []
+        for i in range(dset.id.get_num_chunks()):
+            info = dset.id.get_chunk_info(i)
+            chunks.append(
+                (info.byte_offset, dset.id.read_direct_chunk(info.chunk_offset))
+            )
+    return chunks
+
+
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_write_dataset_false_metadata_only(tmp_path, file, lazy):
+    filename = tmp_path / file
+    s = hs.signals.Signal1D(np.arange(4 * 5 * 6.0).reshape((4, 5, 6)))
+    s.metadata.set_item("Sample.description", "old")
+    s.original_metadata.set_item("a.b", 1)
+    s.original_metadata.set_item("c", np.arange(3))
+    s.save(filename, chunks=(2, 5, 6))
+    if file.endswith("hspy"):
+        raw_chunks = _get_raw_chunks(filename)
+
+    s = hs.load(filename, lazy=lazy, mode="a")
+    s.axes_manager[-1].scale = 0.5
+    s.metadata.Sample.description = "new"
+    del s.original_metadata.a
+    s.original_metadata.set_item("d", "x")
+    s.save(filename, write_dataset=False, overwrite=True)
+    if lazy:
+        s.close_file()
+
+    s2 = hs.load(filename)
+    assert s2.axes_manager[-1].scale == 0.5
+    assert s2.metadata.Sample.description == "new"
+    # the items removed from the metadata are removed from the file
+    assert s2.original_metadata.as_dictionary().keys() == {"c", "d"}
+    np.testing.assert_array_equal(s2.original_metadata.c, np.arange(3))
+    np.testing.assert_array_equal(s2.data, np.arange(4 * 5 * 6.0).reshape((4, 5, 6)))
+    if file.endswith("hspy"):
+        # same compressed bytes at the same position in the file
+        assert _get_raw_chunks(filename) == raw_chunks
+
+    s2.data = np.zeros((4, 5, 3))
+    with pytest.raises(ValueError):
+        s2.save(filename, write_dataset=False, overwrite=True)
+
     # now new data
     @zspy_marker
     def test_chunking_saving_lazy_specify(self, tmp_path, file):
@@ -1026,6 +1150,392 @@ def test_get_signal_chunks_small_dataset():
     assert chunks == shape
 
 
+def test_plan_chunks():
+    shape = (64, 64, 256, 256)
+    kwargs = dict(dtype=np.uint16, signal_axes=(2, 3), target_size=2**20)
+    chunks = plan_chunks(shape, access_pattern="signal", **kwargs)
+    assert chunks == (2, 2, 256, 256)
+    chunks = plan_chunks(shape, access_pattern="navigation", **kwargs)
+    assert chunks == (64, 64, 11, 11)
+    chunks = plan_chunks(shape, access_pattern="balanced", **kwargs)
+    assert chunks == (13, 13, 53, 53)
+    assert np.prod(chunks) * 2 <= 2**20
+    # axes too small to be chunked with the same fraction as the others
+    chunks = plan_chunks((2, 1024, 1024), np.uint8, target_size=2**10)
+    assert chunks == (1, 32, 32)
+    # compressed chunks are larger
+    chunks = plan_chunks(shape, access_pattern="signal", compressor="gzip", **kwargs)
+    assert chunks == (4, 4, 256, 256)
+    with pytest.raises(ValueError):
+        plan_chunks(shape, access_pattern="unsupported", **kwargs)
+
+
+def test_plan_chunks_store(tmp_path):
+    zarr = pytest.importorskip("zarr")
+    kwargs = dict(
+        shape=(64, 64, 256, 256),
+        dtype=np.uint16,
+        signal_axes=(2, 3),
+        target_size=2**20,
+    )
+    # the chunks of a directory store are at least 4 MiB
+    store = zarr.storage.NestedDirectoryStore(tmp_path / "test.zspy")
+    assert plan_chunks(store=store, **kwargs) == (5, 5, 256, 256)
+    assert plan_chunks(store=zarr.MemoryStore(), **kwargs) == (2, 2, 256, 256)
+
+
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_save_access_pattern(tmp_path, file, lazy):
+    s = hs.signals.Signal2D(np.zeros((16, 16, 128, 128), dtype=np.uint8))
+    if lazy:
+        s = s.as_lazy()
+        s.data = s.data.rechunk((4, 4, 128, 128))
+    filename = tmp_path / file
+    s.save(filename, access_pattern="navigation")
+    s2 = hs.load(filename, lazy=True)
+    # the whole navigation space is in each chunk
+    if file.endswith("hspy"):
+        assert s2.data.chunksize == (16, 16, 88, 88)
+        s2.close_file()
+    else:
+        assert s2.data.chunksize == (16, 16, 128, 128)
+
+
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_read_hyperslab(tmp_path, file, lazy):
+    s = hs.signals.Signal2D(np.arange(6 * 5 * 4 * 3).reshape((6, 5, 4, 3)))
+    for axis, offset in zip(s.axes_manager._axes, [1.0, 2.0, 3.0, 4.0]):
+        axis.offset = offset
+        axis.scale = 0.5
+    filename = tmp_path / file
+    s.save(filename, chunks=(2, 2, 2, 3))
+
+    module = importlib.import_module(f"rsciio.{file.split('.')[1]}")
+    d = module.file_reader(
+        filename,
+        lazy=lazy,
+        navigation_slice=(slice(1, 4), slice(0, 5, 2)),
+        signal_slice=slice(-2, None),
+    )[0]
+    assert d["data"].shape == (3, 3, 2, 3)
+    np.testing.assert_array_equal(d["data"], s.data[1:4, 0:5:2, 2:])
+    axes = d["axes"]
+    assert [axis["size"] for axis in axes] == [3, 3, 2, 3]
+    assert [axis["offset"] for axis in axes] == [1.5, 2.0, 4.0, 4.0]
+    assert [axis["scale"] for axis in axes] == [0.5, 1.0, 0.5, 0.5]
+
+    d = module.file_reader(filename, metadata_only=True, signal_slice=slice(1, 3))[0]
+    assert d["data"].shape == (6, 5, 2, 3)
+
+    s2 = hs.load(filename, lazy=lazy, navigation_slice=slice(2, 3))
+    np.testing.assert_array_equal(s2.data, s.data[2:3])
+    if lazy:
+        s2.close_file()
+
+    with pytest.raises(ValueError):
+        module.file_reader(filename, signal_slice=(slice(0, 1),) * 3)
+    with pytest.raises(ValueError):
+        module.file_reader(filename, signal_slice=slice(None, None, -1))
+    with pytest.raises(TypeError):
+        module.file_reader(filename, navigation_slice=1)
+
+
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_read_hyperslab_ragged(tmp_path, file, lazy):
+    data = np.empty((4, 3), dtype=object)
+    for i in np.ndindex(data.shape):
+        data[i] = np.arange(sum(i) + 1.0)
+    s = hs.signals.BaseSignal(data, ragged=True)
+    filename = tmp_path / file
+    s.save(filename)
+
+    module = importlib.import_module(f"rsciio.{file.split('.')[1]}")
+    d = module.file_reader(
+        filename, lazy=lazy, navigation_slice=(slice(1, 3), slice(2, 3))
+    )[0]
+    assert d["data"].shape == (2, 1)
+    data2 = d["data"].compute() if lazy else d["data"]
+    for i in np.ndindex(data2.shape):
+        np.testing.assert_array_equal(data2[i], data[1:3, 2:3][i])
+
+
+@zspy_marker
+def test_read_chunks(tmp_path, file):
+    s = hs.signals.Signal2D(np.arange(32 * 32 * 8 * 8).reshape((32, 32, 8, 8)))
+    filename = tmp_path / file
+    s.save(filename, chunks=(4, 4, 8, 8))
+    module = importlib.import_module(f"rsciio.{file.split('.')[1]}")
+
+    d = module.file_reader(filename, lazy=True)[0]
+    assert d["data"].chunksize == (4, 4, 8, 8)
+
+    # the "auto" chunks are multiples of the chunks of the file
+    with dask.config.set({"array.chunk-size": "100KiB"}):
+        d = module.file_reader(filename, lazy=True, chunks="auto")[0]
+    assert d["data"].chunksize[2:] == (8, 8)
+    assert all(c % 4 == 0 for c in d["data"].chunksize[:2])
+    assert d["data"].chunksize != (4, 4, 8, 8)
+    np.testing.assert_array_equal(d["data"], s.data)
+
+    # explicit chunks are used as they are
+    kwds = {"rdcc_nbytes": 1024} if file.endswith("hspy") else {}
+    d = module.file_reader(filename, lazy=True, chunks=(6, 6, 8, 8), **kwds)[0]
+    assert d["data"].chunksize == (6, 6, 8, 8)
+    np.testing.assert_array_equal(d["data"], s.data)
+
+
+def test_open_with_chunk_cache(tmp_path):
+    from rsciio.hspy._api import HyperspyReader
+
+    filename = tmp_path / "test.hdf5"
+    with h5py.File(filename, "w") as f:
+        f.create_dataset("data", data=np.zeros((32, 32, 8, 8)), chunks=(4, 4, 8, 8))
+
+    with h5py.File(filename, "r", rdcc_nbytes=1024) as f:
+        # aligned chunks, each chunk is read once
+        dataset = _open_with_chunk_cache(f["data"], (8, 32, 8, 8))
+        assert dataset.id.get_access_plist().get_chunk_cache()[1] == 1024
+        # the chunks overlapping a row of (6, 6) blocks are cached:
+        # 3 chunks along the first axis and 8 along the second axis
+        dataset = _open_with_chunk_cache(dataset, (6, 6, 8, 8))
+        nslots, nbytes, _ = dataset.id.get_access_plist().get_chunk_cache()
+        assert nbytes == 3 * 8 * 4 * 4 * 8 * 8 * 8
+        assert nslots == 2411
+        np.testing.assert_array_equal(dataset[:6, :6], 0)
+
+    with h5py.File(filename, "r", rdcc_nbytes=1024) as f:
+        # the cache is shared with the other open handles, which stay valid
+        handle = f["data"]
+        data = HyperspyReader._read_array(f, "data", lazy=True, chunks=(6, 6, 8, 8))
+        np.testing.assert_array_equal(handle[:6, :6], 0)
+        np.testing.assert_array_equal(data[:6, :6], 0)
+        dataset = f["data"]
+        assert _open_with_chunk_cache(dataset, (6, 6, 8, 8)) is dataset
+        assert dataset.id.valid
+
+
+@zspy_marker
+@pytest.mark.parametrize("lazy", [False, True])
+def test_write_summary(tmp_path, file, lazy):
+    data = np.arange(130 * 3 * 4 * 5, dtype=np.uint16).reshape((130, 3, 4, 5))
+    s = hs.signals.Signal2D(data)
+    if lazy:
+        s = s.as_lazy()
+        s.data = s.data.rechunk((20, 3, 4, 5))
+    filename = tmp_path / file
+    s.save(filename, write_summary=True)
+
+    module = importlib.import_module(f"rsciio.{file.split('.')[1]}")
+    d = module.file_reader(filename, metadata_only=True)[0]
+    pyramid = d["summary"]["navigation_sum"]
+    assert [level.shape for level in pyramid] == [(130, 3), (65, 1), (32, 1)]
+    navigation_sum = data.sum(axis=(2, 3))
+    np.testing.assert_array_equal(pyramid[0], navigation_sum)
+    np.testing.assert_array_equal(
+        pyramid[1], navigation_sum[:, :2].reshape(65, 2, 1, 2).sum(axis=(1, 3))
+    )
+    np.testing.assert_array_equal(
+        pyramid[2], pyramid[1][:64].reshape(32, 2, 1, 1).sum(axis=(1, 3))
+    )
+    np.testing.assert_allclose(d["summary"]["signal_mean"], data.mean(axis=(0, 1)))
+    # the summary doesn't prevent loading the signal
+    np.testing.assert_array_equal(hs.load(filename).data, data)
+
+    s.save(filename, overwrite=True)
+    assert "summary" not in module.file_reader(filename, metadata_only=True)[0]
+
+
+@zspy_marker
+def test_file_appender(tmp_path, file):
+    module = importlib.import_module(f"rsciio.{file.split('.')[1]}")
+    filename = tmp_path / file
+    s = hs.signals.Signal1D(np.zeros((0, 4, 8), dtype=np.uint16))
+    s.axes_manager[1].scale = 0.5
+    s.metadata.General.title = "live"
+    signal_dict = s._to_dictionary(add_models=True)
+    signal_dict["package_info"] = {"name": "hyperspy", "version": hs.__version__}
+
+    with module.file_appender(filename, signal_dict) as appender:
+        d = module.file_reader(filename)[0]
+        assert d["data"].shape == (0, 4, 8)
+        for i in range(3):
+            appender.append(np.full((2, 4, 8), i, dtype=np.uint16))
+            assert appender.shape == (2 * (i + 1), 4, 8)
+            # the file can be read after each append
+            d = module.file_reader(filename)[0]
+            assert d["data"].shape == (2 * (i + 1), 4, 8)
+            assert d["axes"][0]["size"] == 2 * (i + 1)
+            assert d["axes"][0]["scale"] == 0.5
+            np.testing.assert_array_equal(d["data"][-2:], i)
+        with pytest.raises(ValueError):
+            appender.append(np.zeros((1, 4, 4)))
+
+    s2 = hs.load(filename)
+    assert s2.axes_manager.navigation_shape == (4, 6)
+    assert s2.metadata.General.title == "live"
+    np.testing.assert_array_equal(s2.data[::2, 0, 0], np.arange(3))
+
+
+def test_zspy_file_appender_metadata():
+    zarr = pytest.importorskip("zarr")
+    from rsciio.zspy import file_appender, file_reader
+
+    class Store(dict):
+        def __getitem__(self, key):
+            self.keys_read.append(key)
+            return super().__getitem__(key)
+
+    store = Store()
+    store.keys_read = []
+    s = hs.signals.Signal1D(np.zeros((0, 4, 8), dtype=np.uint16))
+    signal_dict = s._to_dictionary(add_models=True)
+    signal_dict["package_info"] = {"name": "hyperspy", "version": hs.__version__}
+    with file_appender(store, signal_dict) as appender:
+        appender.append(np.ones((2, 4, 8), dtype=np.uint16))
+        store.keys_read.clear()
+        appender.flush()
+        # the metadata of the other groups isn't read again
+        metadata_keys = [key for key in store.keys_read if key.split("/")[-1][0] == "."]
+        assert sorted(metadata_keys) == [
+            ".zmetadata",
+            "Experiments/__unnamed__/axis-0/.zattrs",
+            "Experiments/__unnamed__/data/.zarray",
+        ]
+    consolidated = zarr.util.json_loads(dict.__getitem__(store, ".zmetadata"))
+    assert consolidated["metadata"]["Experiments/__unnamed__/data/.zarray"][
+        "shape"
+    ] == [2, 4, 8]
+    assert file_reader(store)[0]["data"].shape == (2, 4, 8)
+
+
+def test_file_appender_error(tmp_path):
+    from rsciio.hspy import file_appender
+
+    signal_dict = hs.signals.Signal1D(np.zeros((2, 8)))._to_dictionary()
+    signal_dict["axes"][0]["navigate"] = False
+    with pytest.raises(ValueError):
+        file_appender(tmp_path / "test.hspy", signal_dict)
+
+
+def _swmr_writer(filename, signal_dict, events):
+    from rsciio.hspy import file_appender
+
+    with file_appender(filename, signal_dict, swmr=True) as appender:
+        assert appender.file.swmr_mode
+        events["ready"].set()
+        events["append"].wait(60)
+        appender.append(np.ones((3, 4, 8, 8)))
+        events["appended"].set()
+        events["done"].wait(60)
+
+
+def test_swmr(tmp_path):
+    import multiprocessing
+
+    from rsciio.hspy import file_reader
+
+    filename = tmp_path / "test.hspy"
+    s = hs.signals.Signal2D(np.zeros((2, 4, 8, 8)))
+    signal_dict = s._to_dictionary(add_models=True)
+    signal_dict["package_info"] = {"name": "hyperspy", "version": hs.__version__}
+    # the file is written by another process, as the SWMR mode is meant for
+    context = multiprocessing.get_context("spawn")
+    events = {name: context.Event() for name in ("ready", "append", "appended", "done")}
+    writer = context.Process(target=_swmr_writer, args=(filename, signal_dict, events))
+    writer.start()
+    try:
+        assert events["ready"].wait(60)
+        d = file_reader(filename, lazy=True, swmr=True, signal_slice=slice(0, 4))[0]
+        assert d["data"].shape == (2, 4, 4, 8)
+        events["append"].set()
+        assert events["appended"].wait(60)
+        assert d["refresh"]() is d
+        assert d["data"].shape == (5, 4, 4, 8)
+        assert d["axes"][0]["size"] == 5
+        assert d["axes"][2]["size"] == 4
+        np.testing.assert_array_equal(d["data"][2:], 1)
+        get_file_handle(d["data"]).close()
+    finally:
+        events["done"].set()
+        writer.join(60)
+    assert writer.exitcode == 0
+    with pytest.raises(ValueError):
+        file_reader(filename, swmr=True)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_write_virtual_dataset(tmp_path, lazy):
+    from rsciio.hspy import file_reader, write_virtual_dataset
+
+    files = []
+    for i in range(3):
+        s = hs.signals.Signal2D(np.arange(4 * 5 * 6 * 7).reshape((4, 5, 6, 7)) + i)
+        s.axes_manager[0].name = "x"
+        s.metadata.General.title = "tile"
+        s.original_metadata.set_item("index", i)
+        files.append(tmp_path / "tiles" / f"tile_{i}.hspy")
+        s.save(files[-1], chunks=(2, 5, 6, 7))
+    data = np.stack([hs.load(f).data for f in files])
+
+    filename = tmp_path / "stack.hspy"
+    write_virtual_dataset(filename, files, new_axis={"name": "tile", "units": "s"})
+    s2 = hs.load(filename, lazy=lazy)
+    assert s2.data.shape == (3, 4, 5, 6, 7)
+    np.testing.assert_array_equal(s2.data, data)
+    assert s2.axes_manager.navigation_shape == (5, 4, 3)
+    assert s2.axes_manager[0].name == "x"
+    assert s2.axes_manager[2].name == "tile"
+    assert s2.axes_manager[2].units == "s"
+    assert s2.metadata.General.title == "tile"
+    assert s2.original_metadata.index == 0
+    if lazy:
+        # aligned on the chunks of the source datasets
+        assert s2.data.chunksize == (1, 2, 5, 6, 7)
+        s2.close_file()
+
+    filename = tmp_path / "concatenate.hspy"
+    write_virtual_dataset(filename, files, axis=0)
+    d = file_reader(filename, lazy=lazy)[0]
+    np.testing.assert_array_equal(d["data"], np.concatenate(data))
+    assert [axis["size"] for axis in d["axes"]] == [12, 5, 6, 7]
+    if lazy:
+        get_file_handle(d["data"]).close()
+
+    with pytest.raises(ValueError):
+        write_virtual_dataset(filename, files, axis=2)
+    s.isig[:3].save(files[0], overwrite=True)
+    with pytest.raises(ValueError):
+        write_virtual_dataset(filename, files)
+
+
+@pytest.mark.parametrize("axis_type", ["DataAxis", "FunctionalDataAxis"])
+def test_write_virtual_dataset_non_uniform_axis(tmp_path, axis_type):
+    from rsciio.hspy import write_virtual_dataset
+
+    files = []
+    for i in range(2):
+        s = hs.signals.Signal1D(np.arange(4 * 6).reshape((4, 6)) + i)
+        if axis_type == "DataAxis":
+            s.axes_manager[0].convert_to_non_uniform_axis()
+        else:
+            s.axes_manager[0].convert_to_functional_data_axis(expression="x**2")
+        files.append(tmp_path / f"file_{i}.hspy")
+        s.save(files[-1])
+
+    filename = tmp_path / "concatenate.hspy"
+    with pytest.raises(ValueError, match=f"is a {axis_type}"):
+        write_virtual_dataset(filename, files, axis=0)
+    # stacking along a new axis keeps the non-uniform axis
+    write_virtual_dataset(filename, files)
+    s2 = hs.load(filename)
+    assert s2.data.shape == (2, 4, 6)
+    assert s2.axes_manager[0].size == 4
+    assert not s2.axes_manager[0].is_uniform
+
+
 @zspy_marker
 def test_error_saving(tmp_path, file):
     filename = tmp_path / file
@@ -1047,3 +1557,148 @@ def test_more_recent_version_warning(tmp_path):
     with pytest.warns(UserWarning):
         s2 = hs.load(filename)
     np.testing.assert_allclose(s.data, s2.data)
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+@pytest.mark.parametrize(
+    "compression_kwds",
+    (
+        {"compression": "gzip"},
+        {"compression": "gzip", "shuffle": False, "compression_opts": 9},
+        {"compression": None},
+        {"compression": "lzf"},
+        {"compression": "zstd"},
+        {"compression": "blosc"},
+    ),
+)
+def test_compression_workers(tmp_path, lazy, compression_kwds):
+    from rsciio.hspy._api import HyperspyWriter
+
+    compression_kwds = dict(compression_kwds)
+    if compression_kwds["compression"] in ("zstd", "blosc"):
+        hdf5plugin = pytest.importorskip("hdf5plugin")
+        if compression_kwds["compression"] == "zstd":
+            pytest.importorskip("zstandard")
+            compression_kwds = dict(hdf5plugin.Zstd(clevel=5))
+        else:
+            pytest.importorskip("blosc")
+            compression_kwds = dict(hdf5plugin.Blosc(cname="lz4"))
+    rng = np.random.default_rng(0)
+    data = rng.poisson(2, size=(13, 11, 64)).astype("u2")
+    # incompressible chunk
+    data[0, 0] = rng.integers(2**16, size=64)
+    if lazy:
+        data = da.from_array(data, chunks=(5, 5, 64))
+
+    filename = tmp_path / "test.hspy"
+    with h5py.File(filename, mode="w") as f:
+        for key, workers in (("reference", None), ("parallel", 4)):
+            HyperspyWriter.overwrite_dataset(
+                f,
+                data,
+                key,
+                chunks=(4, 4, 64),
+                store_kwds={"compression_workers": workers},
+                **compression_kwds,
+            )
+
+    with h5py.File(filename, mode="r") as f:
+        reference, parallel = f["reference"], f["parallel"]
+        np.testing.assert_array_equal(parallel[:], data)
+        # the chunks are identical to the ones compressed by HDF5,
+        # including the edge chunks
+        for offset in itertools.product(range(0, 13, 4), range(0, 11, 4), [0]):
+            assert reference.id.read_direct_chunk(
+                offset
+            ) == parallel.id.read_direct_chunk(offset)
+
+
+def test_compression_workers_file_writer(tmp_path):
+    s = hs.signals.Signal1D(np.arange(2 * 3 * 10).reshape((2, 3, 10)))
+    s.save(tmp_path / "test.hspy", compression_workers=2)
+    s2 = hs.load(tmp_path / "test.hspy")
+    np.testing.assert_array_equal(s2.data, s.data)
+
+
+def test_compression_workers_compute_once(tmp_path):
+    from rsciio.hspy import file_reader
+
+    calls = []
+
+    def count(block):
+        # exclude the calls of dask inferring the metadata of the array
+        if block.size > 1:
+            calls.append(block.shape)
+        return block
+
+    data = np.arange(12 * 10 * 8 * 8, dtype="u2").reshape((12, 10, 8, 8))
+    # the dask chunks don't match the chunks of the dataset
+    lazy_data = da.from_array(data, chunks=(5, 5, 8, 8)).map_blocks(count)
+    s = hs.signals.Signal2D(lazy_data).as_lazy()
+    filename = tmp_path / "test.hspy"
+    s.save(filename, chunks=(4, 4, 8, 8), compression_workers=2, write_summary=True)
+    # each block is computed once for the data and the summary
+    assert len(calls) == lazy_data.npartitions
+    np.testing.assert_array_equal(hs.load(filename).data, data)
+    d = file_reader(filename, metadata_only=True)[0]
+    np.testing.assert_array_equal(
+        d["summary"]["navigation_sum"][0], data.sum(axis=(2, 3))
+    )
+
+
+@zspy_marker
+def test_lazy_metadata(tmp_path, file):
+    from rsciio._hierarchical import LazyGroupDict
+    from rsciio.hspy import file_reader as hspy_reader
+    from rsciio.zspy import file_reader as zspy_reader
+
+    filename = tmp_path / file
+    s = hs.signals.Signal1D(np.arange(24, dtype=float).reshape((2, 3, 4)))
+    s.original_metadata.set_item("Tags.Image.values", np.arange(5))
+    s.original_metadata.set_item("Tags.Image.name", "image")
+    s.original_metadata.set_item("Tags.list", [1, 2, 3])
+    s.original_metadata.set_item("Tags.tuple", ("a", "b"))
+    s.original_metadata.set_item("Tags.empty", [])
+    s.original_metadata.set_item("Tags.none", None)
+    s.decomposition()
+    m = s.create_model()
+    m.store("a")
+    s.save(filename)
+
+    file_reader = hspy_reader if file.endswith("hspy") else zspy_reader
+    reference = file_reader(filename)[0]
+    with pytest.raises(ValueError, match="requires `lazy=True`"):
+        file_reader(filename, lazy_metadata=True)
+    d = file_reader(filename, lazy=True, lazy_metadata=True)[0]
+    original_metadata = d["original_metadata"]
+    assert isinstance(original_metadata, LazyGroupDict)
+    assert isinstance(original_metadata["Tags"]["Image"], LazyGroupDict)
+    assert "Image" in original_metadata["Tags"]
+    assert list(original_metadata["Tags"]) == list(
+        reference["original_metadata"]["Tags"]
+    )
+    assert len(original_metadata["Tags"]) == len(reference["original_metadata"]["Tags"])
+    np.testing.assert_array_equal(
+        original_metadata["Tags"]["Image"]["values"], np.arange(5)
+    )
+    # the arrays are read as dask arrays with `lazy=True`
+    (original_metadata_dict,) = dask.compute(original_metadata.to_dict())
+    assert_deep_almost_equal(original_metadata_dict, reference["original_metadata"])
+    learning_results = d["attributes"]["learning_results"]
+    assert isinstance(learning_results, LazyGroupDict)
+    (learning_results_dict,) = dask.compute(learning_results.to_dict())
+    assert_deep_almost_equal(
+        learning_results_dict, reference["attributes"]["learning_results"]
+    )
+    assert isinstance(d["models"]["a"], LazyGroupDict)
+    assert "_signal" not in d["models"]["a"]
+    assert d["models"]["a"].to_dict().keys() == reference["models"]["a"].keys()
+
+    # the mapping can be modified
+    tags = original_metadata["Tags"]
+    tags["new"] = 1
+    del tags["list"]
+    assert tags["new"] == 1
+    assert "list" not in tags
+    with pytest.raises(KeyError):
+        del tags["list"]
@@ -17,9 +17,13 @@
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import importlib
+import subprocess
+import sys
 
 import pytest
 
+from rsciio import IO_PLUGINS
+
 
 def test_import_version():
     from rsciio import __version__
@@ -28,7 +32,86 @@ def test_import_version():
 def test_rsciio_dir():
     import rsciio
 
-    assert dir(rsciio) == ["IO_PLUGINS", "__version__"]
+    assert dir(rsciio) == [
+        "IO_PLUGINS",
+        "__version__",
+        "convert",
+        "detect_format",
+        "read_many",
+    ]
+
+
+def test_io_plugins_registry_up_to_date():
+    from rsciio._io_plugins import IO_PLUGINS
+    from rsciio._specifications import read_specifications
+
+    # If this test fails, run `python -m rsciio._specifications` to update the
+    # compiled registry
+    assert IO_PLUGINS == read_specifications()
+
+
+def test_import_lazy_io_plugins():
+    code = (
+        "import sys, rsciio;"
+        "assert 'yaml' not in sys.modules;"
+        "assert 'rsciio._io_plugins' not in sys.modules;"
+        "rsciio.IO_PLUGINS;"
+        "assert 'rsciio._io_plugins' in sys.modules;"
+        "assert 'IO_PLUGINS' in vars(rsciio);"
+        "assert 'yaml' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_time():
+    # Benchmark guarding the cost of `import rsciio`, which is paid by every
+    # process using RosettaSciIO: only the standard library `logging` module
+    # is imported and no file is parsed
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import rsciio"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    self_time = {}
+    for line in output.splitlines()[1:]:
+        self_, _, name = line.split("|")
+        self_time[name.strip()] = int(self_.split(":")[1])
+    imported = [name for name in self_time if name.startswith("rsciio")]
+    assert imported == ["rsciio"]
+    # Time spent in rsciio/__init__.py only, in microseconds: parsing the
+    # specifications files used to take ~25 ms. Use a generous bound to avoid
+    # flaky failure on slow CI runners.
+    assert self_time["rsciio"] < 10_000
+
+
+# Heavy dependencies which are required to import the plugin, all other
+# heavy dependencies must be imported only when needed
+PLUGINS_REQUIRED_DEPENDENCIES = {
+    "rsciio.blockfile": ["skimage"],
+    "rsciio.dens": ["scipy"],
+    "rsciio.emd": ["h5py"],
+    "rsciio.hspy": ["h5py"],
+    "rsciio.mrcz": ["mrcz"],
+    "rsciio.netcdf": ["scipy"],
+    "rsciio.nexus": ["h5py"],
+    "rsciio.phenom": ["tifffile"],
+    "rsciio.tiff": ["tifffile"],
+    "rsciio.usid": ["dask", "h5py", "numba", "scipy", "sparse"],
+    "rsciio.zspy": ["numcodecs", "zarr"],
+}
+
+
+@pytest.mark.parametrize("plugin", [plugin["api"] for plugin in IO_PLUGINS])
+def test_plugin_import_deferred_dependencies(plugin, record_property):
+    from rsciio.tests.import_time_report import get_import_report
+
+    report = get_import_report(plugin)
+    if "error" in report:
+        pytest.skip(report["error"])
+    record_property("import_time", report["import_time"])
+    required = PLUGINS_REQUIRED_DEPENDENCIES.get(plugin, [])
+    assert [m for m in report["dependencies"] if m not in required] == []
 
 
 def test_rsciio_utils():
@@ -122,6 +205,19 @@ def test_dir_plugins():
         plugin_module = importlib.import_module(plugin_string)
         if plugin["writes"] is False:
             assert dir(plugin_module) == ["file_reader"]
+        elif plugin["name"] == "HSPY":
+            assert dir(plugin_module) == [
+                "file_appender",
+                "file_reader",
+                "file_writer",
+                "write_virtual_dataset",
+            ]
+        elif plugin["name"] == "ZSPY":
+            assert dir(plugin_module) == [
+                "file_appender",
+                "file_reader",
+                "file_writer",
+            ]
         elif plugin["name"] == "MSA":
             assert dir(plugin_module) == [
                 "file_reader",
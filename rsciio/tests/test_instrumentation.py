@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import builtins
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rsciio import read_many
+from rsciio.utils.instrumentation import (
+    add_callback,
+    instrument,
+    instrumented,
+    open_file,
+    remove_callback,
+)
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+MSA_FILE = str(TEST_DATA_PATH / "msa" / "example1.msa")
+BUILTIN_OPEN = builtins.open
+
+
+def test_instrument_reader():
+    from rsciio.msa import file_reader
+
+    with instrument() as records:
+        s = file_reader(MSA_FILE)
+    assert len(records) == 1
+    record = records[0]
+    assert record.plugin == "msa"
+    assert record.function == "file_reader"
+    assert record.filename == MSA_FILE
+    assert record.duration > 0
+    assert record.bytes_read == Path(MSA_FILE).stat().st_size
+    assert record.read_calls > 0
+    assert record.allocated_bytes == s[0]["data"].nbytes
+    assert record.error is None
+    # the record can be shipped as json
+    json.dumps(record.to_dict())
+
+
+def test_instrument_writer(tmp_path):
+    from rsciio.msa import file_reader, file_writer
+
+    s = file_reader(MSA_FILE)[0]
+    fname = tmp_path / "file.msa"
+    with instrument() as records:
+        file_writer(str(fname), s)
+    record = records[0]
+    assert record.function == "file_writer"
+    assert record.bytes_written == fname.stat().st_size
+    assert record.write_calls > 0
+
+
+def test_instrument_phases_seeks():
+    from rsciio.digitalmicrograph import file_reader
+
+    with instrument() as records:
+        file_reader(str(TEST_DATA_PATH / "digitalmicrograph" / "1D" / "test-1.dm3"))
+    record = records[0]
+    assert set(record.phases) == {"header", "metadata", "data"}
+    assert sum(record.phases.values()) <= record.duration
+    assert record.seeks > 0
+
+
+def test_instrument_os_counters():
+    from rsciio.mrc import file_reader
+
+    with instrument() as records:
+        file_reader(str(TEST_DATA_PATH / "mrc" / "HAADFscan.mrc"))
+    record = records[0]
+    if Path("/proc/thread-self/io").exists():
+        # numpy reads the data in C, which is only seen by the OS counters
+        assert record.os_bytes_read > record.bytes_read
+    else:
+        assert record.os_bytes_read is None
+
+
+def test_instrument_metadata_only():
+    from rsciio.msa import file_reader
+
+    with instrument() as records:
+        file_reader(MSA_FILE, metadata_only=True)
+    assert records[0].allocated_bytes == 0
+
+
+def test_instrument_error(tmp_path):
+    from rsciio.msa import file_reader
+
+    with instrument() as records:
+        with pytest.raises(FileNotFoundError):
+            file_reader(str(tmp_path / "missing.msa"))
+    assert "FileNotFoundError" in records[0].error
+
+
+def test_instrument_disabled():
+    from rsciio.msa import file_reader
+
+    with instrument() as records:
+        pass
+    file_reader(MSA_FILE)
+    assert records == []
+
+
+def test_open_file(tmp_path):
+    fname = tmp_path / "file.txt"
+
+    @instrumented
+    def writer(filename):
+        with open_file(filename, "w") as f:
+            f.write("text\n")
+        # the files opened with `open` are not counted
+        with open(filename, "a") as f:
+            f.write("not counted")
+
+    with instrument() as records:
+        writer(fname)
+    assert records[0].bytes_written == 5
+    assert records[0].write_calls == 1
+    # `open` is left untouched
+    assert builtins.open is io.open is BUILTIN_OPEN
+    # outside an instrumented call, it is the same as `open`
+    with open_file(fname) as f:
+        assert type(f.buffer.raw) is io.FileIO
+        assert f.read() == "text\nnot counted"
+
+
+def test_instrument_nested():
+    @instrumented
+    def inner(filename):
+        return [{"data": np.zeros(10)}]
+
+    @instrumented
+    def outer(filename):
+        return inner(filename)
+
+    with instrument() as records:
+        outer("file")
+    assert len(records) == 1
+    assert records[0].function == "outer"
+    assert records[0].allocated_bytes == 80
+
+
+def test_instrument_threads():
+    paths = [TEST_DATA_PATH / "msa" / f"example{i}.msa" for i in (1, 2)]
+    with instrument() as records:
+        list(read_many(paths, workers=2))
+    assert sorted(record.filename for record in records) == sorted(map(str, paths))
+    assert all(record.bytes_read > 0 for record in records)
+
+
+def test_callback():
+    from rsciio.msa import file_reader
+
+    records = []
+    add_callback(records.append)
+    try:
+        file_reader(MSA_FILE)
+    finally:
+        remove_callback(records.append)
+    file_reader(MSA_FILE)
+    assert len(records) == 1
+    assert records[0].plugin == "msa"
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import importlib
+import inspect
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rsciio import IO_PLUGINS
+from rsciio.utils.array import get_data_placeholder
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+
+
+def _read_bytes_count():
+    # number of bytes read by the process, including the page cache hits
+    with open("/proc/self/io") as f:
+        for line in f:
+            if line.startswith("rchar:"):
+                return int(line.split()[1])
+
+
+def _get_reader(plugin_name):
+    return importlib.import_module(f"rsciio.{plugin_name}").file_reader
+
+
+@pytest.mark.parametrize("plugin", IO_PLUGINS, ids=lambda plugin: plugin["name"])
+def test_metadata_only_keyword(plugin):
+    try:
+        file_reader = importlib.import_module(plugin["api"]).file_reader
+    except ImportError:
+        pytest.skip(f"The dependencies of {plugin['name']} are not installed.")
+    parameters = inspect.signature(file_reader).parameters
+    assert parameters["metadata_only"].default is False
+    assert "metadata_only : bool" in file_reader.__doc__
+
+
+def test_get_data_placeholder():
+    data = get_data_placeholder((1000, 2000), np.uint16)
+    assert data.shape == (1000, 2000)
+    assert data.dtype == np.uint16
+    assert data.strides == (0, 0)
+    assert data.nbytes == 1000 * 2000 * 2
+    assert not data.flags.writeable
+    assert not data.any()
+
+
+@pytest.mark.parametrize(
+    ("plugin_name", "filename"),
+    [
+        ("blockfile", "blockfile/test1.blo"),
+        ("bruker", "bruker/30x30_instructively_packed_16bit_compressed.bcf"),
+        ("bruker", "bruker/bruker_nano.spx"),
+        ("dens", "dens/file1.dens"),
+        ("digitalmicrograph", "digitalmicrograph/1D/test-1.dm3"),
+        ("digitalsurf", "digitalsurf/test_spectral_map_compressed.sur"),
+        ("digitalsurf", "digitalsurf/test_RGB.sur"),
+        ("emd", "emd/example_image.emd"),
+        ("hamamatsu", "hamamatsu/operate_mode.img"),
+        ("hspy", "hspy/example2_v3.1.hspy"),
+        ("jobinyvon", "jobinyvon/jobinyvon_test_map_x3-y2.xml"),
+        ("mrc", "mrc/HAADFscan.mrc"),
+        ("msa", "msa/example1.msa"),
+        ("nexus", "nexus/simple_signal.nxs"),
+        ("phenom", "phenom/Elid2Version0.elid"),
+        ("protochips", "protochips/protochips_gas_cell.csv"),
+        ("renishaw", "renishaw/renishaw_test_spectrum.wdf"),
+        ("ripple", "ripple/test_ripple_sdim-1_ndim-0_float32.rpl"),
+        ("semper", "semper/example_signal_3d.unf"),
+        ("tia", "tia/new/128x128-TEM_search.emi"),
+        ("tiff", "tiff/olympus_SIS.tif"),
+        ("trivista", "trivista/linescan.tvf"),
+        ("tvips", "tvips/test_tvips_2345_000.tvips"),
+    ],
+)
+def test_metadata_only_read(plugin_name, filename):
+    file_reader = _get_reader(plugin_name)
+    fname = str(TEST_DATA_PATH / filename)
+    s_list = file_reader(fname, metadata_only=True)
+    ref_list = file_reader(fname)
+    assert len(s_list) == len(ref_list)
+    for s, ref in zip(s_list, ref_list):
+        assert s["data"].shape == ref["data"].shape
+        assert s["data"].dtype == ref["data"].dtype
+        assert not any(s["data"].strides)
+        np.testing.assert_equal(s["axes"], ref["axes"])
+        np.testing.assert_equal(s["metadata"], ref["metadata"])
+
+
+@pytest.fixture
+def signal_dict():
+    # float32 random values don't compress, the files are about 16 MB
+    data = np.random.default_rng(0).random((64, 256, 256), dtype=np.float32)
+    axes = [
+        {
+            "name": name,
+            "size": size,
+            "scale": 1.0,
+            "offset": 0.0,
+            "units": "nm",
+            "navigate": navigate,
+            "index_in_array": i,
+        }
+        for i, (name, size, navigate) in enumerate(
+            [("z", 64, True), ("y", 256, False), ("x", 256, False)]
+        )
+    ]
+    return {
+        "data": data,
+        "axes": axes,
+        "metadata": {"General": {"title": "test"}, "Signal": {"signal_type": ""}},
+        "original_metadata": {},
+        "tmp_parameters": {},
+        "learning_results": {},
+        "models": {},
+        "attributes": {"_lazy": False},
+        "package_info": {"name": "", "version": ""},
+    }
+
+
+@pytest.mark.parametrize(
+    ("plugin_name", "extension"),
+    [
+        ("blockfile", "blo"),
+        ("emd", "emd"),
+        ("hspy", "hspy"),
+        ("pantarhei", "prz"),
+        ("ripple", "rpl"),
+        ("semper", "unf"),
+        ("tiff", "tif"),
+        ("tvips", "tvips"),
+        ("zspy", "zspy"),
+    ],
+)
+def test_metadata_only_bytes_read(tmp_path, signal_dict, plugin_name, extension):
+    if not Path("/proc/self/io").exists():
+        pytest.skip("The number of bytes read is not available.")
+    plugin = importlib.import_module(f"rsciio.{plugin_name}")
+    fname = str(tmp_path / f"file.{extension}")
+    plugin.file_writer(fname, signal_dict)
+    if plugin_name == "tvips":
+        fname = str(tmp_path / "file_000.tvips")
+
+    # read once to import the lazily imported modules
+    plugin.file_reader(fname, metadata_only=True)
+    count = _read_bytes_count()
+    s = plugin.file_reader(fname, metadata_only=True)[0]
+    count = _read_bytes_count() - count
+
+    assert s["data"].shape == signal_dict["data"].shape
+    assert count < 64 * 1024 < signal_dict["data"].nbytes // 100
@@ -38,6 +38,16 @@ def test_single_image():
         assert axis.units == "nm"
 
 
+def test_single_image_lazy():
+    from dask.array import Array
+
+    s = hs.load(TEST_DATA_DIR / "HAADFscan.mrc", lazy=True)
+    assert isinstance(s.data, Array)
+    assert s.data.chunksize == (16, 16)
+    s = hs.load(TEST_DATA_DIR / "HAADFscan.mrc", lazy=True, chunks=(8, 8))
+    assert s.data.chunksize == (8, 8)
+
+
 def test_4DSTEM_image():
     # Acquired from Velox
     s = hs.load(TEST_DATA_DIR / "4DSTEMscan.mrc")
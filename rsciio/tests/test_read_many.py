@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rsciio import read_many
+import rsciio._read_many
+
+
+TEST_DATA_PATH = Path(__file__).parent / "data"
+
+FILES = [
+    ("msa", "msa/example1.msa"),
+    ("msa", "msa/example2.msa"),
+    ("bruker", "bruker/bruker_nano.spx"),
+    ("digitalmicrograph", "digitalmicrograph/1D/test-1.dm3"),
+    ("protochips", "protochips/protochips_gas_cell.csv"),
+]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_read_many(executor):
+    files = FILES
+    if executor == "process":
+        # the `post_process` of the dm reader can't be pickled
+        files = [f for f in files if f[0] != "digitalmicrograph"]
+    paths = [TEST_DATA_PATH / filename for _, filename in files]
+    results = dict(read_many(paths, workers=2, executor=executor))
+    assert set(results) == set(paths)
+    for plugin_name, filename in files:
+        plugin = pytest.importorskip(f"rsciio.{plugin_name}")
+        ref = plugin.file_reader(str(TEST_DATA_PATH / filename))
+        result = results[TEST_DATA_PATH / filename]
+        assert len(result) == len(ref)
+        for d, d_ref in zip(result, ref):
+            np.testing.assert_allclose(d["data"], d_ref["data"])
+            np.testing.assert_equal(d["axes"], d_ref["axes"])
+
+
+def test_read_many_kwds():
+    paths = [TEST_DATA_PATH / "msa" / "example1.msa"]
+    (path, result), *_ = read_many(paths, metadata_only=True)
+    assert not any(result[0]["data"].strides)
+
+
+def test_read_many_generator():
+    paths = (TEST_DATA_PATH / "msa" / f"example{i}.msa" for i in (1, 2))
+    assert len(list(read_many(paths))) == 2
+
+
+def test_read_many_unknown_format(tmp_path):
+    fname = tmp_path / "file.unknown"
+    fname.write_bytes(b"unknown format")
+    with pytest.raises(ValueError, match="can't be detected"):
+        list(read_many([fname]))
+
+
+def test_read_many_wrong_executor():
+    with pytest.raises(ValueError, match="`executor` must be one of"):
+        list(read_many([], executor="cluster"))
+
+
+@pytest.mark.parametrize("max_bytes_in_flight", [None, 250, 50])
+def test_read_many_max_bytes_in_flight(tmp_path, monkeypatch, max_bytes_in_flight):
+    started = []
+
+    def _read_file(path, kwds):
+        started.append(path)
+        return path
+
+    monkeypatch.setattr(rsciio._read_many, "_read_file", _read_file)
+    paths = []
+    for i in range(10):
+        fname = tmp_path / f"file{i}"
+        fname.write_bytes(bytes(100))
+        paths.append(fname)
+
+    # the budget allows 2 files in flight, and at least one when it's too low
+    max_files = {None: 2 * 4, 250: 2, 50: 1}[max_bytes_in_flight]
+    results = []
+    for i, (path, result) in enumerate(
+        read_many(paths, workers=4, max_bytes_in_flight=max_bytes_in_flight)
+    ):
+        assert len(started) - i <= max_files
+        results.append(result)
+    assert sorted(results) == paths
+
+
+@pytest.mark.parametrize("on_error", ["raise", "skip", "return"])
+def test_read_many_on_error(tmp_path, monkeypatch, on_error):
+    started = []
+
+    def _read_file(path, kwds):
+        started.append(path)
+        if path.name == "file1":
+            raise OSError("corrupted file")
+        return path
+
+    monkeypatch.setattr(rsciio._read_many, "_read_file", _read_file)
+    paths = []
+    for i in range(10):
+        fname = tmp_path / f"file{i}"
+        fname.write_bytes(bytes(100))
+        paths.append(fname)
+
+    results = read_many(paths, workers=1, on_error=on_error)
+    if on_error == "raise":
+        with pytest.raises(OSError, match="corrupted file"):
+            list(results)
+        # the files submitted after the failing one are cancelled
+        assert len(started) <= 3
+        return
+    results = dict(results)
+    assert len(started) == len(paths)
+    if on_error == "skip":
+        assert sorted(results) == [p for p in paths if p.name != "file1"]
+    else:
+        assert sorted(results) == paths
+        assert isinstance(results[paths[1]], OSError)
+
+
+def test_read_many_wrong_on_error():
+    with pytest.raises(ValueError, match="`on_error` must be one of"):
+        list(read_many([], on_error="ignore"))
@@ -56,6 +56,25 @@ def test_write_without_metadata(tmp_path):
     gc.collect()
 
 
+def test_read_lazy_chunks(tmp_path):
+    import dask
+
+    data = np.arange(20 * 10 * 1024, dtype="int32").reshape((20, 10, 1024))
+    fname = tmp_path / "test_read_lazy_chunks.rpl"
+    hs.signals.Signal1D(data).save(fname)
+    with dask.config.set({"array.chunk-size": "100KiB"}):
+        s = hs.load(fname, lazy=True)
+    # chunks contain entire spectra and are close to the dask chunk size
+    assert s.data.chunks[-1] == (1024,)
+    assert s.data.nbytes > s.data.chunksize[0] * s.data.chunksize[1] * 4096 >= 50000
+    s2 = hs.load(fname, lazy=True, chunks=(5, 5, 512))
+    assert s2.data.chunksize == (5, 5, 512)
+    np.testing.assert_allclose(s.data.compute(), data)
+    # for windows
+    del s, s2
+    gc.collect()
+
+
 def test_write_with_metadata(tmp_path):
     data = np.arange(5 * 10).reshape((5, 10))
     s = hs.signals.Signal1D(data)
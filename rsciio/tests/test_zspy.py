@@ -111,6 +111,85 @@ class TestZspy:
         )
         _ = hs.load(tmp_path / "test_compression.zspy")
 
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_compression_auto(self, tmp_path, lazy):
+        from rsciio.zspy._api import _get_compressor_candidates
+
+        filename = tmp_path / "test.zspy"
+        rng = np.random.default_rng(0)
+        s = hs.signals.Signal1D(rng.poisson(0.1, (16, 16, 256)).astype(np.uint16))
+        if lazy:
+            s = s.as_lazy()
+        s.save(filename, compressor="auto")
+        f = zarr.open(str(filename), mode="r")
+        group = f["Experiments/__unnamed__"]
+        compressor = group["data"].compressor
+        assert compressor in _get_compressor_candidates()
+        assert group.attrs["auto_compressor"] == compressor.get_config()
+        np.testing.assert_array_equal(hs.load(filename).data, s.data)
+
+    def test_compression_auto_compute_once(self, tmp_path, monkeypatch):
+        import dask.array as da
+
+        from rsciio.zspy import _api
+
+        # sample regions smaller than the chunks of the data
+        monkeypatch.setattr(_api, "_COMPRESSOR_SAMPLE_SIZE", 2048)
+        computed = []
+
+        def count(block):
+            if block.size > 1:
+                computed.append(block.shape)
+            return block
+
+        data = da.ones((8, 8, 256), chunks=(8, 8, 256), dtype=np.uint16)
+        data = data.map_blocks(count, dtype=data.dtype)
+        s = hs.signals.Signal1D(data).as_lazy()
+        s.save(tmp_path / "test.zspy", compressor="auto")
+        # the data is computed once to select the compressor and once to
+        # write it
+        assert len(computed) == 2
+
+        computed.clear()
+        s.save(
+            tmp_path / "test.zspy",
+            compressor="auto",
+            write_dataset=False,
+            overwrite=True,
+        )
+        assert computed == []
+        group = zarr.open(str(tmp_path / "test.zspy"), mode="r")[
+            "Experiments/__unnamed__"
+        ]
+        assert group.attrs["auto_compressor"] == group["data"].compressor.get_config()
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_consolidated_metadata(self, signal, tmp_path, lazy):
+        from rsciio.zspy import file_reader
+
+        filename = tmp_path / "test.zspy"
+        signal.original_metadata.set_item("a.b.c", [1, 2])
+        signal.save(filename)
+        assert (filename / ".zmetadata").is_file()
+        d = file_reader(filename, lazy=lazy)[0]
+        np.testing.assert_array_equal(d["data"], signal.data)
+        assert d["original_metadata"]["a"]["b"]["c"] == [1, 2]
+
+        # files saved without consolidated metadata
+        os.remove(filename / ".zmetadata")
+        d2 = file_reader(filename, lazy=lazy)[0]
+        np.testing.assert_array_equal(d2["data"], signal.data)
+        assert d2["original_metadata"] == d["original_metadata"]
+        assert d2["metadata"] == d["metadata"]
+
+    def test_consolidated_metadata_write_dataset(self, signal, tmp_path):
+        filename = tmp_path / "test.zspy"
+        signal.save(filename)
+        signal.metadata.set_item("Sample.description", "new description")
+        signal.save(filename, write_dataset=False, overwrite=True)
+        s2 = hs.load(filename)
+        assert s2.metadata.Sample.description == "new description"
+
 
 def test_non_valid_zspy(tmp_path, caplog):
     filename = tmp_path / "testfile.zspy"
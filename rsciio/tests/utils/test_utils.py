@@ -381,3 +381,42 @@ def test_get_date_time_from_metadata():
         )
         == "12:00:00"
     )
+
+
+def test_deferred_object_threads():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rsciio.utils.tools import DeferredObject
+
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    deferred = DeferredObject(factory)
+    with ThreadPoolExecutor(8) as executor:
+        objects = list(executor.map(lambda _: deferred._get_object(), range(8)))
+    assert len(calls) == 1
+    assert all(obj is objects[0] for obj in objects)
+
+
+@pytest.mark.parametrize("signature", [False, True])
+def test_deferred_njit(signature):
+    pytest.importorskip("numba")
+    from rsciio.utils.tools import deferred_njit
+
+    def square(x):
+        return x * x
+
+    if signature:
+        jitted = deferred_njit("float64(float64)", fastmath=True)(square)
+    else:
+        jitted = deferred_njit(square)
+    assert jitted.py_func is square
+    # the signature is passed to numba, which converts the integer to float
+    result = jitted(3)
+    assert result == 9
+    assert isinstance(result, float) is signature
@@ -26,10 +26,13 @@ import xml.etree.ElementTree as ET
 from collections import OrderedDict
 
 import numpy as np
+from numpy.lib.recfunctions import repack_fields
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import sarray2dict
 from rsciio.utils.tools import DTBox
+from rsciio.utils.instrumentation import instrumented, open_file, phase
 
 
 _logger = logging.getLogger(__name__)
@@ -244,7 +247,9 @@ def emixml2dtb(et, dictree):
             emixml2dtb(child, dictree[et.tag])
 
 
-def emi_reader(filename, lazy=False, only_valid_data=True, dump_xml=False):
+def emi_reader(
+    filename, lazy=False, only_valid_data=True, dump_xml=False, metadata_only=False
+):
     # TODO: recover the tags from the emi file. It is easy: just look for
     # <ObjectInfo> and </ObjectInfo>. It is standard xml :)
     # xml chunks are identified using UUID, if we can find how these UUID are
@@ -255,7 +260,7 @@ def emi_reader(filename, lazy=False, only_valid_data=True, dump_xml=False):
     filename = os.path.splitext(filename)[0]
     if dump_xml:
         for i, obj in enumerate(objects):
-            with open(filename + "-object-%s.xml" % i, "w") as f:
+            with open_file(filename + "-object-%s.xml" % i, "w") as f:
                 f.write(obj)
 
     ser_files = sorted(glob(filename + "_[0-9].ser"))
@@ -263,7 +268,7 @@ def emi_reader(filename, lazy=False, only_valid_data=True, dump_xml=False):
     for f in ser_files:
         _logger.info("Opening %s", f)
         try:
-            sers.extend(ser_reader(f, objects, lazy, only_valid_data))
+            sers.extend(ser_reader(f, objects, lazy, only_valid_data, metadata_only))
         except IOError:  # Probably a single spectrum that we don't support
             continue
 
@@ -283,7 +288,8 @@ def emi_reader(filename, lazy=False, only_valid_data=True, dump_xml=False):
     return sers
 
 
-def file_reader(filename, lazy=False, only_valid_data=True):
+@instrumented
+def file_reader(filename, lazy=False, only_valid_data=True, metadata_only=False):
     """
     Read sets of ``.ser`` and ``.emi`` files from the FEI/ThermoFisher software TIA
     (TEM Imaging & Analysis).
@@ -296,75 +302,114 @@ def file_reader(filename, lazy=False, only_valid_data=True):
         For cases, where acquisition of series or linescan data stopped before
         the end. If `True`, load only the acquired data. If `False`, the empty
         data are filled with zeros.
+    %s
 
     %s
     """
     ext = os.path.splitext(filename)[1][1:]
     if ext.lower() == "ser":
         to_return = ser_reader(
-            filename, objects=None, lazy=lazy, only_valid_data=only_valid_data
+            filename,
+            objects=None,
+            lazy=lazy,
+            only_valid_data=only_valid_data,
+            metadata_only=metadata_only,
         )
     elif ext.lower() == "emi":
-        to_return = emi_reader(filename, lazy, only_valid_data)
+        to_return = emi_reader(
+            filename, lazy, only_valid_data, metadata_only=metadata_only
+        )
     else:
         raise ValueError(f"'{ext}' is not a supported extension for the TIA reader.")
 
     return to_return
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
-def load_ser_file(filename):
-    _logger.info("Opening the file: %s", filename)
-    with open(filename, "rb") as f:
-        header = np.fromfile(f, dtype=np.dtype(get_header_dtype_list(f)), count=1)
-        _logger.info("Header info:")
-        log_struct_array_values(header[0])
-
-        if header["ValidNumberElements"] == 0:
-            raise IOError(
-                "The file does not contains valid data. "
-                "If it is a single spectrum, the data is contained in the  "
-                ".emi file but HyperSpy cannot currently extract this "
-                "information."
-            )
+def _read_ser_header(f):
+    header = np.fromfile(f, dtype=np.dtype(get_header_dtype_list(f)), count=1)
+    _logger.info("Header info:")
+    log_struct_array_values(header[0])
 
-        # Read the first element of data offsets
-        f.seek(header["OffsetArrayOffset"][0])
-        # OffsetArrayOffset can contain 4 or 8 bytes integer depending if the
-        # data have been acquired using a 32 or 64 bits platform.
-        if header["SeriesVersion"] <= 528:
-            data_offset = readLELong(f)
-            data_offset_array = np.fromfile(
-                f, dtype="<u4", count=header["ValidNumberElements"][0]
-            )
-        else:
-            data_offset = readLELongLong(f)
-            data_offset_array = np.fromfile(
-                f, dtype="<u8", count=header["ValidNumberElements"][0]
-            )
-        data_dtype_list, shape = get_data_dtype_list(
-            f, data_offset, guess_record_by(header["DataTypeID"])
+    if header["ValidNumberElements"] == 0:
+        raise IOError(
+            "The file does not contains valid data. "
+            "If it is a single spectrum, the data is contained in the  "
+            ".emi file but HyperSpy cannot currently extract this "
+            "information."
         )
-        tag_dtype_list = get_data_tag_dtype_list(header["TagTypeID"])
-        f.seek(data_offset)
-        data = np.empty(
-            header["ValidNumberElements"][0],
-            dtype=np.dtype(data_dtype_list + tag_dtype_list),
+
+    # Read the first element of data offsets
+    f.seek(header["OffsetArrayOffset"][0])
+    # OffsetArrayOffset can contain 4 or 8 bytes integer depending if the
+    # data have been acquired using a 32 or 64 bits platform.
+    if header["SeriesVersion"] <= 528:
+        data_offset = readLELong(f)
+        data_offset_array = np.fromfile(
+            f, dtype="<u4", count=header["ValidNumberElements"][0]
+        )
+    else:
+        data_offset = readLELongLong(f)
+        data_offset_array = np.fromfile(
+            f, dtype="<u8", count=header["ValidNumberElements"][0]
         )
+    data_dtype_list, shape = get_data_dtype_list(
+        f, data_offset, guess_record_by(header["DataTypeID"])
+    )
+    tag_dtype_list = get_data_tag_dtype_list(header["TagTypeID"])
+    dtype = np.dtype(data_dtype_list + tag_dtype_list)
+    return header, data_offset, data_offset_array, dtype
+
+
+def load_ser_file(filename):
+    _logger.info("Opening the file: %s", filename)
+    with open_file(filename, "rb") as f:
+        header, data_offset, data_offset_array, dtype = _read_ser_header(f)
+        f.seek(data_offset)
+        data = np.empty(header["ValidNumberElements"][0], dtype=dtype)
         for i, offset in enumerate(data_offset_array):
-            data[i] = np.fromfile(
-                f, dtype=np.dtype(data_dtype_list + tag_dtype_list), count=1
-            )
+            data[i] = np.fromfile(f, dtype=dtype, count=1)
             f.seek(offset)
         _logger.info("Data info:")
         log_struct_array_values(data[0])
     return header, data
 
 
+def load_ser_header(filename):
+    """
+    Same as :py:func:`load_ser_file` without reading the ``"Array"`` field of
+    the elements, which is returned as a placeholder.
+
+    Returns
+    -------
+    header, data, array
+    """
+    _logger.info("Opening the file: %s", filename)
+    with open_file(filename, "rb") as f:
+        header, data_offset, data_offset_array, dtype = _read_ser_header(f)
+        array_offset = dtype.fields["Array"][1]
+        tag_offset = array_offset + dtype["Array"].itemsize
+        names = [name for name in dtype.names if name != "Array"]
+        # The fields before and after "Array" are concatenated
+        metadata_dtype = repack_fields(dtype[names])
+        data = np.empty(header["ValidNumberElements"][0], dtype=metadata_dtype)
+        offsets = [data_offset] + data_offset_array[:-1].tolist()
+        for i, offset in enumerate(offsets):
+            f.seek(offset)
+            buffer = f.read(array_offset)
+            f.seek(offset + tag_offset)
+            buffer += f.read(dtype.itemsize - tag_offset)
+            data[i] = np.frombuffer(buffer, dtype=metadata_dtype)[0]
+        _logger.info("Data info:")
+        log_struct_array_values(data[0])
+    array = get_data_placeholder(data.shape + dtype["Array"].shape, dtype["Array"].base)
+    return header, data, array
+
+
 def get_xml_info_from_emi(emi_file):
-    with open(emi_file, "rb") as f:
+    with open_file(emi_file, "rb") as f:
         tx = f.read()
     objects = []
     i_start = 0
@@ -503,12 +548,21 @@ def convert_xml_to_dict(xml_object):
     return op
 
 
-def ser_reader(filename, objects=None, lazy=False, only_valid_data=True):
+def ser_reader(
+    filename, objects=None, lazy=False, only_valid_data=True, metadata_only=False
+):
     """
     Reads the information from the file and returns it in the HyperSpy
     required format.
     """
-    header, data = load_ser_file(filename)
+    if metadata_only:
+        with phase("header"):
+            header, data, array = load_ser_header(filename)
+    else:
+        # the header and the data are read together
+        with phase("data"):
+            header, data = load_ser_file(filename)
+        array = data["Array"]
     record_by = guess_record_by(header["DataTypeID"])
     ndim = int(header["NumberDimensions"])
     date, time = None, None
@@ -647,14 +701,25 @@ def ser_reader(filename, objects=None, lazy=False, only_valid_data=True):
 
     # Remove Nones from array_shape caused by squeezing size 1 dimensions
     array_shape = [dim for dim in array_shape if dim is not None]
-    if lazy:
+    if metadata_only:
+        dc = load_only_data(
+            filename,
+            array_shape,
+            record_by,
+            len(axes),
+            data=data,
+            header=header,
+            only_valid_data=only_valid_data,
+            array=array,
+        )
+    elif lazy:
         from dask import delayed
         from dask.array import from_delayed
 
         val = delayed(load_only_data, pure=True)(
             filename, array_shape, record_by, len(axes), only_valid_data=only_valid_data
         )
-        dc = from_delayed(val, shape=array_shape, dtype=data["Array"].dtype)
+        dc = from_delayed(val, shape=array_shape, dtype=array.dtype)
     else:
         dc = load_only_data(
             filename,
@@ -670,7 +735,7 @@ def ser_reader(filename, objects=None, lazy=False, only_valid_data=True):
     header_parameters = sarray2dict(header)
     sarray2dict(data, header_parameters)
     # We remove the Array key to save memory avoiding duplication
-    del header_parameters["Array"]
+    header_parameters.pop("Array", None)
     original_metadata["ser_header_parameters"] = header_parameters
     metadata = {
         "General": {
@@ -703,29 +768,35 @@ def load_only_data(
     data=None,
     header=None,
     only_valid_data=True,
+    array=None,
 ):
     if data is None:
         header, data = load_ser_file(filename)
+    if array is None:
+        array = data["Array"]
     # If the acquisition stops before finishing the job, the stored file will
     # report the requested size even though no values are recorded. Therefore
     # if the shapes of the retrieved array does not match that of the data
     # dimensions we must fill the rest with zeros or (better) nans if the
     # dtype is float
-    if np.prod(array_shape) != np.prod(data["Array"].shape):
+    if np.prod(array_shape) != np.prod(array.shape):
         if int(header["NumberDimensions"]) == 1 and only_valid_data:
             # No need to fill with zeros if `TotalNumberElements !=
             # ValidNumberElements` for series data.
             # The valid data is always `0:ValidNumberElements`
-            dc = data["Array"][0 : header["ValidNumberElements"][0], ...]
+            dc = array[0 : header["ValidNumberElements"][0], ...]
             array_shape[0] = header["ValidNumberElements"][0]
+        elif not array.strides[0]:
+            # The placeholder of the metadata only mode
+            dc = get_data_placeholder(np.prod(array_shape), array.dtype)
         else:
             # Maps will need to be filled with zeros or nans
-            dc = np.zeros(np.prod(array_shape), dtype=data["Array"].dtype)
+            dc = np.zeros(np.prod(array_shape), dtype=array.dtype)
             if dc.dtype is np.dtype("f") or dc.dtype is np.dtype("f8"):
                 dc[:] = np.nan
-            dc[: data["Array"].ravel().shape[0]] = data["Array"].ravel()
+            dc[: array.ravel().shape[0]] = array.ravel()
     else:
-        dc = data["Array"]
+        dc = array
 
     dc = dc.reshape(array_shape)
     if record_by == "image":
@@ -32,9 +32,11 @@ from tifffile import __version__ as tiffversion
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import DTBox, _UREG
 from rsciio.utils.date_time_tools import get_date_time_from_metadata
 
@@ -139,6 +141,7 @@ def file_reader(
     force_read_resolution=False,
     multipage_as_list=False,
     hamamatsu_streak_axis_type=None,
+    metadata_only=False,
     **kwds,
 ):
     """
@@ -178,6 +181,7 @@ def file_reader(
         is issued. Explicitly passing ``hamamatsu_streak_axis_type='uniform'``
         suppresses the warning. In all cases, the original axis values are stored
         in the ``original_metadata`` of the signal object.
+    %s
     **kwds : dict, optional
         Additional arguments to be passed to the ``TiffFile`` class of the `tifffile library
         <https://github.com/cgohlke/tifffile>`_.
@@ -205,6 +209,7 @@ def file_reader(
                 force_read_resolution,
                 lazy=lazy,
                 hamamatsu_streak_axis_type=hamamatsu_streak_axis_type,
+                metadata_only=metadata_only,
                 **kwds,
             )
             for handle in handles
@@ -213,7 +218,7 @@ def file_reader(
     return dict_list
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def _order_axes_by_name(names: list, scales: dict, offsets: dict, units: dict):
@@ -276,6 +281,7 @@ def _read_tiff(
     memmap=None,
     RGB_as_structured_array=True,
     hamamatsu_streak_axis_type=None,
+    metadata_only=False,
     **kwds,
 ):
     """handle - one of either of TiffPage type or TiffPageSeries type"""
@@ -367,7 +373,9 @@ def _read_tiff(
         md["Signal"]["Noise_properties"] = {"Variance_linear_model": dic}
 
     data_args = handle, is_rgb
-    if lazy:
+    if metadata_only:
+        dc = get_data_placeholder(shape, dtype)
+    elif lazy:
         from dask import delayed
         from dask.array import from_delayed
 
@@ -26,7 +26,9 @@ from collections import defaultdict
 import numpy as np
 from numpy.polynomial.polynomial import polyfit
 
-from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, RETURNS_DOC
+from rsciio._docstrings import FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC
+from rsciio.utils.array import get_data_placeholder
+from rsciio.utils.instrumentation import instrumented, open_file
 
 _logger = logging.getLogger(__name__)
 
@@ -126,10 +128,12 @@ class TrivistaTVFReader:
         use_uniform_signal_axis=False,
         glued_data_as_stack=False,
         filter_original_metadata=True,
+        metadata_only=False,
     ):
         self._file_path = file_path
         self._use_uniform_signal_axis = use_uniform_signal_axis
         self._glued_data_as_stack = glued_data_as_stack
+        self._metadata_only = metadata_only
 
         (
             data_head,
@@ -201,7 +205,8 @@ class TrivistaTVFReader:
         """
         filtered_original_metadata = dict()
         unfiltered_original_metadata = dict()
-        et_root = ET.parse(self._file_path).getroot()
+        with open_file(self._file_path, "rb") as f:
+            et_root = ET.parse(f).getroot()
 
         ## root level metadata
         filtered_original_metadata.update(_etree_to_dict(et_root, only_top_lvl=True))
@@ -660,7 +665,7 @@ class TrivistaTVFReader:
         return axes_list
 
     @staticmethod
-    def _parse_data(data_pos):
+    def _parse_data(data_pos, metadata_only=False):
         """Extracts data from file."""
         data_list = data_pos.findall("Data")
         _error_handling_find_location(len(data_list), "data")  # pragma: no cover
@@ -675,10 +680,17 @@ class TrivistaTVFReader:
             time_frame = np.fromstring(
                 frame.attrib["TimeStamp"], sep=" ", dtype=np.int64
             )
-            data_frame = [float(x) for x in frame.text.split(";")]
+            if metadata_only:
+                # Only the number of values is needed
+                data_frame = frame.text.count(";") + 1
+            else:
+                data_frame = [float(x) for x in frame.text.split(";")]
             time_array.append(time_frame)
             data_array.append(data_frame)
-        data = np.array(data_array).ravel()
+        if metadata_only:
+            data = get_data_placeholder((sum(data_array),), float)
+        else:
+            data = np.array(data_array).ravel()
         time = (np.array(time_array, dtype=np.int64) - time_array[0]).ravel() / 1e7
         return data, time
 
@@ -693,10 +705,12 @@ class TrivistaTVFReader:
         for dataset in num_datasets_list[0]:
             signal_axis = self._get_signal_axis(dataset)
             signal_axis_list.append(signal_axis)
-            data, time = self._parse_data(dataset)
+            data, time = self._parse_data(dataset, self._metadata_only)
             data_array.append(data)
             time_array.append(time)
-        data = np.array(data_array)
+        # Placeholders are read-only and can't be stacked in an array updated
+        # in place by `reshape_data`
+        data = data_array if self._metadata_only else np.array(data_array)
         time = np.array(time_array)
         return data, time, signal_axis_list
 
@@ -704,7 +718,7 @@ class TrivistaTVFReader:
         if self._glued_data_as_stack and self._num_datasets != 0:
             data, time, signal_axis = self._load_glued_data_stack(data_head)
         else:
-            data, time = self._parse_data(data_head)
+            data, time = self._parse_data(data_head, self._metadata_only)
             signal_axis = [self._get_signal_axis(data_head)]
             data = [data]
             ## extra surrounding list here
@@ -729,12 +743,14 @@ class TrivistaTVFReader:
         return data
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
     use_uniform_signal_axis=False,
     glued_data_as_stack=False,
     filter_original_metadata=True,
+    metadata_only=False,
 ):
     """
     Read TriVista's ``.tvf`` file.
@@ -766,6 +782,7 @@ def file_reader(
         will be added to original_metadata.
         This setting only affects the ``original_metadata`` attribute
         and not the ``metadata`` attribute.
+    %s
 
     %s
     """
@@ -777,6 +794,7 @@ def file_reader(
         use_uniform_signal_axis=use_uniform_signal_axis,
         glued_data_as_stack=glued_data_as_stack,
         filter_original_metadata=filter_original_metadata,
+        metadata_only=metadata_only,
     )
 
     result = []
@@ -792,4 +810,4 @@ def file_reader(
     return result
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
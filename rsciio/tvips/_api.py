@@ -24,22 +24,25 @@ from dateutil.parser import parse as dtparse
 from datetime import datetime, timezone
 
 import numpy as np
-import dask.array as da
-import dask
-from dask.diagnostics import ProgressBar
-import pint
-from numba import njit
 
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
     SHOW_PROGRESSBAR_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 from rsciio.utils.tools import DTBox, sarray2dict
 from rsciio.utils.tools import dummy_context_manager
-from rsciio.utils.tools import _UREG
+from rsciio.utils.tools import _UREG, deferred_import, deferred_njit
+from rsciio.utils.instrumentation import instrumented, open_file
+
+
+da = deferred_import("dask.array")
+dask = deferred_import("dask")
+pint = deferred_import("pint")
 
 
 _logger = logging.getLogger(__name__)
@@ -198,7 +201,7 @@ def _find_auto_scan_start_stop(rotidxs):
         return startx, indx[-1] + 1
 
 
-@njit
+@deferred_njit
 def _guess_scan_index_grid(rotidx, start, stop):
     indxs = np.zeros(rotidx[stop], dtype=np.int64)
     rotidx = rotidx[start : stop + 1]
@@ -217,6 +220,7 @@ def _guess_scan_index_grid(rotidx, start, stop):
     return indxs + start
 
 
+@instrumented
 def file_reader(
     filename,
     lazy=False,
@@ -225,6 +229,7 @@ def file_reader(
     winding_scan_axis=None,
     hysteresis=0,
     rechunking="auto",
+    metadata_only=False,
 ):
     """
     Read TVIPS stream file for in-situ and 4D STEM data.
@@ -266,6 +271,7 @@ def file_reader(
         are optimally chunked and the signal axes are not chunked.
         If set to anything else, e.g. a dictionary, the value will be passed to
         the chunks argument in dask.array.rechunk.
+    %s
 
     %s
     """
@@ -285,7 +291,7 @@ def file_reader(
         file_index += 1
 
     # parse the header from the first file
-    with open(filename, "rb") as f:
+    with open_file(filename, "rb") as f:
         f.seek(0)
         # read the main header in file 0
         header = np.fromfile(f, dtype=TVIPS_RECORDER_GENERAL_HEADER, count=1)
@@ -334,7 +340,10 @@ def file_reader(
         records = np.memmap(i, mode="r", dtype=record_dtype)
         all_metadata.append(records[metadata_keys])
         all_array_data.append(records["data"])
-    if lazy:
+    if metadata_only:
+        frame_count = sum(len(array_data) for array_data in all_array_data)
+        data_stack = get_data_placeholder((frame_count, dimy, dimx), dtype)
+    elif lazy:
         data_stack = da.concatenate(all_array_data, axis=0)
     else:
         data_stack = np.concatenate(all_array_data, axis=0)
@@ -396,9 +405,12 @@ def file_reader(
             else:
                 raise ValueError("Invalid winding scan axis")
 
-        with dask.config.set(**{"array.slicing.split_large_chunks": True}):
-            data_stack = data_stack[indices.ravel()]
-        data_stack = data_stack.reshape(*indices.shape, dimy, dimx)
+        if metadata_only:
+            data_stack = get_data_placeholder(indices.shape + (dimy, dimx), dtype)
+        else:
+            with dask.config.set(**{"array.slicing.split_large_chunks": True}):
+                data_stack = data_stack[indices.ravel()]
+            data_stack = data_stack.reshape(*indices.shape, dimy, dimx)
         units = (indices.ndim - 2) * [""] + ["nm", "nm", DPU, DPU]
         names = (indices.ndim - 2) * [""] + ["y", "x", "dy", "dx"]
         # no scale information stored in the scan!
@@ -475,7 +487,7 @@ def file_reader(
         },
     }
 
-    if lazy:
+    if lazy and not metadata_only:
         if rechunking:
             if rechunking == "auto":
                 navdims = data_stack.ndim - 2
@@ -503,9 +515,10 @@ def file_reader(
     ]
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
+@instrumented
 def file_writer(
     filename,
     signal,
@@ -600,7 +613,7 @@ def file_writer(
         suffix = "_" + (f"{file_index}".zfill(3))
         filename = fnb + suffix + ext
         if file_index == 0:
-            with open(filename, "wb") as f:
+            with open_file(filename, "wb") as f:
                 main_header.tofile(f)
                 file_location = f.tell()
                 open_mode = "r+"
@@ -635,6 +648,8 @@ def file_writer(
         file_memmap["rotidx"] = rotator + 1
         data = fdata[current_frame : current_frame + frames_saved]
         if signal["attributes"]["_lazy"]:
+            from dask.diagnostics import ProgressBar
+
             cm = ProgressBar if show_progressbar else dummy_context_manager
             with cm():
                 data.store(file_memmap["data"])
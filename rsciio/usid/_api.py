@@ -29,9 +29,11 @@ import sidpy
 from rsciio._docstrings import (
     FILENAME_DOC,
     LAZY_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
 )
+from rsciio.utils.array import get_data_placeholder
 
 
 _logger = logging.getLogger(__name__)
@@ -229,7 +231,9 @@ def _convert_to_signal_dict(
     return sig
 
 
-def _usidataset_to_signal_dict(h5_main, ignore_non_uniform_dims=True, lazy=False):
+def _usidataset_to_signal_dict(
+    h5_main, ignore_non_uniform_dims=True, lazy=False, metadata_only=False
+):
     """
     Converts a single specified USIDataset object to one or more Signal objects
 
@@ -244,6 +248,7 @@ def _usidataset_to_signal_dict(h5_main, ignore_non_uniform_dims=True, lazy=False
         uniformly varied parameters and
         a Signal object will be generated.
     %s
+    %s
 
     %s
     """
@@ -271,12 +276,17 @@ def _usidataset_to_signal_dict(h5_main, ignore_non_uniform_dims=True, lazy=False
         ".".format(num_pos_dims, num_spec_dims)
     )
 
-    ret_vals = usid.hdf_utils.reshape_to_n_dims(h5_main, get_labels=True, lazy=lazy)
+    ret_vals = usid.hdf_utils.reshape_to_n_dims(
+        h5_main, get_labels=True, lazy=lazy or metadata_only
+    )
     ds_nd, success, dim_labs = ret_vals
 
     if success is not True:
         raise ValueError("Dataset could not be reshaped!")
     ds_nd = ds_nd.squeeze()
+    if metadata_only:
+        # The dask array is not computed, it only gives the N-dimensional shape
+        ds_nd = get_data_placeholder(ds_nd.shape, ds_nd.dtype)
     _logger.info("N-dimensional shape: {}".format(ds_nd.shape))
     _logger.info("N-dimensional labels: {}".format(dim_labs))
 
@@ -328,7 +338,7 @@ def _usidataset_to_signal_dict(h5_main, ignore_non_uniform_dims=True, lazy=False
     return sig
 
 
-_usidataset_to_signal_dict.__doc__ %= (LAZY_DOC, RETURNS_DOC)
+_usidataset_to_signal_dict.__doc__ %= (LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 # ######## UTILITIES THAT SIMPLIFY WRITING TO H5USID FILES ####################
@@ -399,7 +409,13 @@ def _axes_list_to_dimensions(axes_list, data_shape, is_spec):
 # ####### REQUIRED FUNCTIONS FOR AN IO PLUGIN #################################
 
 
-def file_reader(filename, lazy=False, dataset_path=None, ignore_non_uniform_dims=True):
+def file_reader(
+    filename,
+    lazy=False,
+    dataset_path=None,
+    ignore_non_uniform_dims=True,
+    metadata_only=False,
+):
     """
     Read a USID Main dataset present in an HDF5 file into a HyperSpy Signal.
 
@@ -419,6 +435,7 @@ def file_reader(filename, lazy=False, dataset_path=None, ignore_non_uniform_dims
         desired dataset will result in Exceptions.
         Else, all such non-uniformly varied parameters will be treated as
         uniformly varied parameters and a Signal object will be generated.
+    %s
 
     %s
     """
@@ -440,20 +457,24 @@ def file_reader(filename, lazy=False, dataset_path=None, ignore_non_uniform_dims
                 h5_dset,
                 ignore_non_uniform_dims=ignore_non_uniform_dims,
                 lazy=lazy,
+                metadata_only=metadata_only,
             )
     else:
         if not isinstance(dataset_path, str):
             raise TypeError("'dataset_path' should be a string")
         h5_dset = h5_f[dataset_path]
         signals = _usidataset_to_signal_dict(
-            h5_dset, ignore_non_uniform_dims=ignore_non_uniform_dims, lazy=lazy
+            h5_dset,
+            ignore_non_uniform_dims=ignore_non_uniform_dims,
+            lazy=lazy,
+            metadata_only=metadata_only,
         )
-    if not lazy:
+    if not lazy or metadata_only:
         h5_f.close()
     return signals
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, METADATA_ONLY_DOC, RETURNS_DOC)
 
 
 def file_writer(filename, signal, **kwds):
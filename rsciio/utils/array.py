@@ -37,3 +37,198 @@ def get_numpy_kwargs(array):
         kw["like"] = array
 
     return kw
+
+
+def get_data_placeholder(shape, dtype):
+    """
+    Return a read-only array with the given shape and dtype, which doesn't
+    allocate memory for its items: all items are zeros and share the same
+    memory location.
+
+    It is used by the readers as ``'data'`` of the signal dictionary when
+    reading only the metadata of a file.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the data.
+    dtype : numpy.dtype
+        The dtype of the data.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    return np.broadcast_to(np.zeros((), dtype=dtype), tuple(shape))
+
+
+def get_signal_aware_dask_array(data, signal_axes, chunks="auto"):
+    """
+    Return a dask array wrapping a memory-mapped array (or any array
+    supporting slicing), chunked so that each chunk contains entire signals.
+
+    Parameters
+    ----------
+    data : array-like
+        The data to wrap, typically a :py:class:`numpy.memmap`.
+    signal_axes : iterable of int
+        The indices of the signal axes of ``data``.
+    chunks : str, tuple or dict, default="auto"
+        If ``"auto"``, the chunks are calculated with
+        :py:func:`rsciio._hierarchical.get_signal_chunks` to contain entire
+        signals, with a size close to the ``array.chunk-size`` value of the
+        dask configuration. Otherwise, it is passed to
+        :py:func:`dask.array.from_array`.
+
+    Returns
+    -------
+    dask.array.Array
+    """
+    import dask
+    import dask.array as da
+
+    from rsciio._hierarchical import get_signal_chunks
+
+    if isinstance(chunks, str) and chunks == "auto":
+        target_size = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+        chunks = get_signal_chunks(
+            data.shape, data.dtype, list(signal_axes), target_size=target_size
+        )
+    return da.from_array(data, chunks=chunks)
+
+
+# Maximum size of the raw data chunk cache of the h5py datasets read lazily
+_MAX_CHUNK_CACHE_SIZE = 2**28
+
+
+def _next_prime(n):
+    """Return the smallest prime number larger than or equal to ``n``."""
+    n = max(int(n), 2)
+    while any(n % i == 0 for i in range(2, int(n**0.5) + 1)):
+        n += 1
+    return n
+
+
+def get_aligned_chunks(chunks, shape, dtype, storage_chunks):
+    """
+    Return the chunks of a dask array rounded to multiples of the chunks of
+    the array on disk, so that each chunk on disk is read by a single task.
+    For example, ``"auto"`` chunks of a dataset stored in chunks of
+    ``(16, 16, 64, 64)`` are multiples of 16 along the first two axes.
+
+    Parameters
+    ----------
+    chunks : str, tuple or dict
+        The requested chunks, as accepted by :py:func:`dask.array.from_array`.
+    shape : tuple of int
+        The shape of the array.
+    dtype : numpy.dtype
+        The dtype of the array.
+    storage_chunks : tuple of int
+        The chunks of the array on disk.
+
+    Returns
+    -------
+    tuple of int
+    """
+    import dask.array as da
+
+    chunks = da.core.normalize_chunks(
+        chunks, shape, dtype=dtype, previous_chunks=storage_chunks
+    )
+    return tuple(
+        min(size, max(storage, round(max(c) / storage) * storage))
+        for c, size, storage in zip(chunks, shape, storage_chunks)
+    )
+
+
+def _open_with_chunk_cache(dataset, chunks):
+    """
+    Reopen a chunked h5py dataset with a raw data chunk cache large enough to
+    keep the chunks on disk overlapping a row of blocks of ``chunks`` along
+    the first axis, so that the chunks shared by neighbouring blocks are
+    decompressed only once when the blocks are read in order.
+
+    HDF5 shares the chunk cache between all the open identifiers of a
+    dataset, therefore the identifier of ``dataset`` is closed before being
+    reopened and the returned dataset must be used instead of ``dataset``.
+    If the dataset is also open through other :py:class:`h5py.Dataset`
+    objects, the cache can't be resized and ``dataset`` is returned as it is.
+    """
+    import h5py
+
+    storage_chunks = dataset.chunks
+    shape = dataset.shape
+    if all(c % s == 0 or c == n for c, s, n in zip(chunks, storage_chunks, shape)):
+        # each chunk on disk is read by a single block, once
+        return dataset
+    # number of chunks on disk overlapping a block along the first axis and
+    # all the chunks on disk along the other axes
+    n_chunks = min(
+        -(-chunks[0] // storage_chunks[0]) + 1, -(-shape[0] // storage_chunks[0])
+    )
+    n_chunks *= np.prod([-(-n // s) for n, s in zip(shape[1:], storage_chunks[1:])])
+    chunk_size = np.prod(storage_chunks) * dataset.dtype.itemsize
+    nbytes = int(min(n_chunks * chunk_size, _MAX_CHUNK_CACHE_SIZE))
+    current_nbytes = dataset.id.get_access_plist().get_chunk_cache()[1]
+    if nbytes <= current_nbytes:
+        return dataset
+    open_ids = h5py.h5f.get_obj_ids(dataset.file.id, types=h5py.h5f.OBJ_DATASET)
+    # the identifiers of the same dataset compare equal
+    n_open = sum(open_id == dataset.id for open_id in open_ids)
+    # the identifiers returned by HDF5 keep the dataset open
+    del open_ids
+    if n_open > 1:
+        return dataset
+    # HDF5 recommends a prime number ~100 times larger than the number of
+    # chunks fitting in the cache
+    nslots = _next_prime(100 * max(nbytes // chunk_size, 1))
+    dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+    dapl.set_chunk_cache(nslots, nbytes, 0.75)
+    file_id, name = dataset.file.id, dataset.name.encode()
+    dataset.id.close()
+    return h5py.Dataset(h5py.h5d.open(file_id, name, dapl))
+
+
+def get_h5py_dask_array(dataset, chunks=None, storage_chunks=None):
+    """
+    Return a dask array reading a h5py dataset. If ``chunks`` is ``None`` or
+    a string, the chunks of the dask array are aligned on the chunks of the
+    dataset. Otherwise, if the chunks are not aligned, the dataset is
+    reopened with a chunk cache sized for the chunks of the dask array:
+    ``dataset`` is closed and must not be used afterwards.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The dataset to read.
+    chunks : None, str, tuple or dict, default=None
+        The chunks of the dask array, as accepted by
+        :py:func:`dask.array.from_array`. If ``None``, use the chunks of the
+        dataset or ``"auto"`` for contiguous datasets.
+    storage_chunks : tuple of int or None, default=None
+        The chunks to align the dask chunks on, if the dataset isn't chunked,
+        for example the chunks of the source datasets of a virtual dataset.
+        If ``None``, use the chunks of the dataset.
+
+    Returns
+    -------
+    dask.array.Array
+    """
+    import dask.array as da
+
+    if storage_chunks is None:
+        storage_chunks = dataset.chunks
+    if chunks is None:
+        chunks = storage_chunks or "auto"
+    if storage_chunks is not None:
+        if isinstance(chunks, str):
+            chunks = get_aligned_chunks(
+                chunks, dataset.shape, dataset.dtype, storage_chunks
+            )
+        elif dataset.chunks is not None:
+            blocks = da.core.normalize_chunks(
+                chunks, dataset.shape, dtype=dataset.dtype
+            )
+            dataset = _open_with_chunk_cache(dataset, tuple(max(c) for c in blocks))
+    return da.from_array(dataset, chunks=chunks)
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""
+Opt-in on-disk cache of the parsed headers and of the frame indexes of the
+files, to skip parsing or scanning the files again when they are read in a
+later session.
+
+An entry is identified by the path, the size, the modification time and a
+hash of the first bytes of the file, so that it is not used anymore when the
+file is modified. The cache is limited in size: the least recently used
+entries are removed when the limit is exceeded.
+
+The entries are stored with :py:mod:`pickle`, the cache directory must
+therefore only be writable by trusted users.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import logging
+import os
+from pathlib import Path
+import pickle
+import sys
+import tempfile
+import threading
+
+from rsciio._version import __version__
+
+
+_logger = logging.getLogger(__name__)
+
+# Incremented when the layout of the entries changes
+_CACHE_FORMAT = 1
+# Number of bytes at the start of the file included in its identity
+_HEAD_SIZE = 2**16
+_SUFFIX = ".pkl"
+
+DEFAULT_MAX_SIZE = 256 * 2**20
+
+# The directory and size limit of the cache, the cache is disabled when the
+# directory is None
+_config = {"directory": None, "max_size": DEFAULT_MAX_SIZE}
+_lock = threading.Lock()
+
+
+def get_default_directory():
+    """
+    Return the default directory of the cache, in the cache directory of the
+    user, for example ``~/.cache/rosettasciio`` on Linux.
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        return Path(base) / "rosettasciio" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "rosettasciio"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "rosettasciio"
+
+
+def enable_cache(directory=None, max_size=DEFAULT_MAX_SIZE):
+    """
+    Enable the cache of the headers and frame indexes.
+
+    Parameters
+    ----------
+    directory : str, pathlib.Path or None, default=None
+        The directory where the entries are stored, created if needed. If
+        None, use :py:func:`get_default_directory`.
+    max_size : int, default=268435456
+        The maximum size of the cache, in bytes. When it is exceeded, the
+        least recently used entries are removed.
+
+    See Also
+    --------
+    disable_cache, header_cache
+    """
+    if directory is None:
+        directory = get_default_directory()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    _config["directory"] = directory
+    _config["max_size"] = int(max_size)
+
+
+def disable_cache():
+    """
+    Disable the cache. The entries are kept on disk, use
+    :py:func:`clear_cache` to remove them.
+    """
+    _config["directory"] = None
+
+
+def is_cache_enabled():
+    """Return True if the cache is enabled."""
+    return _config["directory"] is not None
+
+
+@contextmanager
+def header_cache(directory=None, max_size=DEFAULT_MAX_SIZE):
+    """
+    Context manager enabling the cache in its scope. The previous state is
+    restored on exit.
+
+    Parameters
+    ----------
+    directory : str, pathlib.Path or None, default=None
+        The directory where the entries are stored, see
+        :py:func:`enable_cache`.
+    max_size : int, default=268435456
+        The maximum size of the cache, in bytes.
+
+    Examples
+    --------
+    >>> from rsciio.bruker import file_reader
+    >>> from rsciio.utils.cache import header_cache
+    >>> with header_cache():
+    ...     d = file_reader("map.bcf")
+    """
+    previous = dict(_config)
+    enable_cache(directory, max_size)
+    try:
+        yield
+    finally:
+        _config.update(previous)
+
+
+def _list_entries(directory):
+    entries = []
+    for path in Path(directory).glob(f"*{_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # removed by another process
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    return entries
+
+
+def cache_info(directory=None):
+    """
+    Return the directory, the number of entries and the size of the cache.
+
+    Parameters
+    ----------
+    directory : str, pathlib.Path or None, default=None
+        The directory of the cache. If None, use the directory of the enabled
+        cache or :py:func:`get_default_directory`.
+
+    Returns
+    -------
+    dict
+        With the keys ``directory``, ``entries`` and ``size`` (in bytes).
+    """
+    directory = Path(directory or _config["directory"] or get_default_directory())
+    entries = _list_entries(directory)
+    return {
+        "directory": directory,
+        "entries": len(entries),
+        "size": sum(size for _, size, _ in entries),
+    }
+
+
+def clear_cache(directory=None):
+    """
+    Remove all the entries of the cache.
+
+    Parameters
+    ----------
+    directory : str, pathlib.Path or None, default=None
+        The directory of the cache. If None, use the directory of the enabled
+        cache or :py:func:`get_default_directory`.
+    """
+    directory = Path(directory or _config["directory"] or get_default_directory())
+    for _, _, path in _list_entries(directory):
+        path.unlink(missing_ok=True)
+
+
+def _get_key(filename, name):
+    """
+    Return the hash identifying the entry ``name`` of a file, or None if the
+    file can't be identified.
+    """
+    if not isinstance(filename, (str, os.PathLike)):
+        return None
+    try:
+        path = Path(filename).resolve()
+        stat = path.stat()
+        with open(path, "rb") as f:
+            head = f.read(_HEAD_SIZE)
+    except OSError:
+        return None
+    h = hashlib.sha256()
+    for item in (
+        _CACHE_FORMAT,
+        __version__,
+        name,
+        path,
+        stat.st_size,
+        stat.st_mtime_ns,
+    ):
+        h.update(str(item).encode("utf-8"))
+        h.update(b"\0")
+    h.update(hashlib.sha256(head).digest())
+    return h.hexdigest()
+
+
+def get_entry(filename, name):
+    """
+    Return the value stored by :py:func:`set_entry` for the file, or None
+    if the cache is disabled or doesn't contain it.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The file the value has been computed from.
+    name : str
+        The name of the entry, prefixed with the name of the plugin, for
+        example ``"bruker.header"``.
+
+    Returns
+    -------
+    object or None
+    """
+    directory = _config["directory"]
+    if directory is None:
+        return None
+    key = _get_key(filename, name)
+    if key is None:
+        return None
+    path = directory / f"{key}{_SUFFIX}"
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+        # the modification time is used to find the least recently used
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        _logger.warning(f"Removing the corrupted cache entry {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    _logger.debug(f"Cache entry '{name}' of {filename} found.")
+    return value
+
+
+def set_entry(filename, name, value):
+    """
+    Store a value computed from a file, such as a parsed header or the
+    offsets of the frames, when the cache is enabled.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The file the value has been computed from.
+    name : str
+        The name of the entry, see :py:func:`get_entry`.
+    value : object
+        A picklable object.
+    """
+    directory = _config["directory"]
+    if directory is None:
+        return
+    key = _get_key(filename, name)
+    if key is None:
+        return
+    content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(content) > _config["max_size"]:
+        _logger.info(f"Cache entry '{name}' of {filename} too large to be stored.")
+        return
+    # write to a temporary file so that a partially written entry is never read
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, directory / f"{key}{_SUFFIX}")
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    _evict(directory, _config["max_size"])
+
+
+def _evict(directory, max_size):
+    """Remove the least recently used entries until the size is below max_size."""
+    with _lock:
+        entries = sorted(_list_entries(directory))
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
@@ -16,26 +16,44 @@
 # You should have received a copy of the GNU General Public License
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import functools
+
 import numpy as np
-import dask.array as da
-import sparse
 
-from numba import njit
+from rsciio.utils.tools import deferred_import, deferred_njit
+
+
+da = deferred_import("dask.array")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dense_slice_coo_class():
+    # sparse (and numba) are imported only when the class is needed
+    import sparse
+
+    class DenseSliceCOO(sparse.COO):
+        """Just like sparse.COO, but returning a dense array on indexing/slicing"""
+
+        def __getitem__(self, *args, **kwargs):
+            obj = super().__getitem__(*args, **kwargs)
+            try:
+                return obj.todense()
+            except AttributeError:
+                # Indexing, unlike slicing, returns directly the content
+                return obj
 
+    DenseSliceCOO.__module__ = __name__
+    DenseSliceCOO.__qualname__ = "DenseSliceCOO"
+    return DenseSliceCOO
 
-class DenseSliceCOO(sparse.COO):
-    """Just like sparse.COO, but returning a dense array on indexing/slicing"""
 
-    def __getitem__(self, *args, **kwargs):
-        obj = super().__getitem__(*args, **kwargs)
-        try:
-            return obj.todense()
-        except AttributeError:
-            # Indexing, unlike slicing, returns directly the content
-            return obj
+def __getattr__(name):
+    if name == "DenseSliceCOO":
+        return _get_dense_slice_coo_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@njit(cache=True)
+@deferred_njit(cache=True)
 def _stream_to_sparse_COO_array_sum_frames(
     stream_data, last_frame, shape, channels, rebin_energy=1, first_frame=0
 ):  # pragma: no cover
@@ -123,7 +141,7 @@ def _stream_to_sparse_COO_array_sum_frames(
     return coords, data, final_shape
 
 
-@njit(cache=True)
+@deferred_njit(cache=True)
 def _stream_to_sparse_COO_array(
     stream_data, last_frame, shape, channels, rebin_energy=1, first_frame=0
 ):  # pragma: no cover
@@ -256,12 +274,12 @@ def stream_to_sparse_COO_array(
             first_frame=first_frame,
             last_frame=last_frame,
         )
-    dense_sparse = DenseSliceCOO(coords=coords, data=data, shape=shape)
+    dense_sparse = _get_dense_slice_coo_class()(coords=coords, data=data, shape=shape)
     dask_sparse = da.from_array(dense_sparse, chunks="auto")
     return dask_sparse
 
 
-@njit(cache=True)
+@deferred_njit(cache=True)
 def _fill_array_with_stream_sum_frames(
     spectrum_image, stream, first_frame, last_frame, rebin_energy=1
 ):  # pragma: no cover
@@ -289,7 +307,7 @@ def _fill_array_with_stream_sum_frames(
             navigation_index += 1
 
 
-@njit(cache=True)
+@deferred_njit(cache=True)
 def _fill_array_with_stream(
     spectrum_image, stream, first_frame, last_frame, rebin_energy=1
 ):  # pragma: no cover
@@ -386,7 +404,7 @@ def stream_to_array(
     return spectrum_image
 
 
-@njit(cache=True)
+@deferred_njit(cache=True)
 def array_to_stream(array):  # pragma: no cover
     """Convert an array to a FEI stream
 
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The HyperSpy developers
+#
+# This file is part of RosettaSciIO.
+#
+# RosettaSciIO is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RosettaSciIO is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""
+Opt-in instrumentation of the ``file_reader`` and ``file_writer`` functions
+of the plugins.
+
+When the instrumentation is enabled, with the :py:func:`instrument` context
+manager or by registering a callback with :py:func:`add_callback`, each call
+to a ``file_reader`` or ``file_writer`` produces an :py:class:`IORecord`.
+When it is disabled, the overhead is a single check per call.
+
+The plugins open their files with :py:func:`open_file`, which counts the IO
+operations of the file in the record of the call.
+"""
+
+from contextlib import contextmanager
+import contextvars
+import functools
+import io
+import time
+
+import numpy as np
+
+
+# Lists collecting the records of the active `instrument` contexts and
+# callbacks registered with `add_callback`
+_sinks = []
+_callbacks = []
+# The record of the call being instrumented in the current thread/context
+_current_record = contextvars.ContextVar("rsciio_io_record", default=None)
+
+_OS_COUNTERS_PATH = "/proc/thread-self/io"
+
+
+class IORecord:
+    """
+    Record of a call to a ``file_reader`` or ``file_writer`` function.
+
+    Attributes
+    ----------
+    plugin : str
+        The name of the plugin, e.g. ``"hspy"``.
+    function : str
+        ``"file_reader"`` or ``"file_writer"``.
+    filename : str
+        The filename passed to the function.
+    start : float
+        The time of the call, in seconds since the epoch.
+    duration : float
+        The wall time of the call, in seconds.
+    phases : dict
+        The wall time, in seconds, spent in each of the phases declared by
+        the plugin, such as ``"header"``, ``"metadata"`` or ``"data"``. The
+        time not covered by any phase isn't included.
+    bytes_read, bytes_written : int
+        The number of bytes read from or written to the files opened by the
+        plugin with :py:func:`open_file` (the buffering excluded). The IO of
+        the libraries used by the plugins, such as numpy, h5py or tifffile,
+        is only accounted in ``os_bytes_read`` and ``os_bytes_written``.
+    read_calls, write_calls, seeks : int
+        The number of read, write and seek operations on these files.
+    os_bytes_read, os_bytes_written : int or None
+        The number of bytes read or written by the thread, as reported by the
+        operating system, including the IO of the libraries written in C
+        (e.g. h5py or numpy). None when not available (only Linux provides
+        these counters).
+    allocated_bytes : int
+        The size of the numpy arrays owning their memory in the dictionaries
+        returned by a ``file_reader``, memory-mapped and lazy arrays
+        excluded.
+    error : str or None
+        The representation of the exception raised by the call, if any.
+    """
+
+    def __init__(self, plugin, function, filename):
+        self.plugin = plugin
+        self.function = function
+        self.filename = filename
+        self.start = time.time()
+        self.duration = 0.0
+        self.phases = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.read_calls = 0
+        self.write_calls = 0
+        self.seeks = 0
+        self.os_bytes_read = None
+        self.os_bytes_written = None
+        self.allocated_bytes = 0
+        self.error = None
+
+    def __repr__(self):
+        return (
+            f"<IORecord {self.plugin}.{self.function}('{self.filename}'), "
+            f"{self.duration:.3g} s, {self.bytes_read} bytes read>"
+        )
+
+    def to_dict(self):
+        """
+        Return the record as a dictionary of python scalars, which can be
+        serialised to JSON, for example.
+        """
+        d = dict(vars(self))
+        d["phases"] = dict(self.phases)
+        return d
+
+
+class _CountingFileIO(io.FileIO):
+    """File IO counting the operations in the record given at creation."""
+
+    def __init__(self, file, mode, record):
+        super().__init__(file, mode)
+        self._record = record
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self._record.read_calls += 1
+        self._record.bytes_read += len(data or b"")
+        return data
+
+    def readall(self):
+        data = super().readall()
+        self._record.read_calls += 1
+        self._record.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer):
+        n = super().readinto(buffer)
+        self._record.read_calls += 1
+        self._record.bytes_read += n or 0
+        return n
+
+    def write(self, buffer):
+        n = super().write(buffer)
+        self._record.write_calls += 1
+        self._record.bytes_written += n or 0
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # `tell` is implemented with a seek relative to the current position
+        if offset or whence != io.SEEK_CUR:
+            self._record.seeks += 1
+        return super().seek(offset, whence)
+
+
+def open_file(file, mode="r", buffering=-1, encoding=None, errors=None, newline=None):
+    """
+    Open a file in the same way as :py:func:`open`. In an instrumented call,
+    the IO operations of the file are counted in the :py:class:`IORecord`
+    of the call. Used by the plugins instead of :py:func:`open`.
+
+    Examples
+    --------
+    >>> from rsciio.utils.instrumentation import open_file
+    >>> with open_file(filename, "rb") as f:
+    ...     header = f.read(1024)
+    """
+    record = _current_record.get()
+    if record is None or isinstance(file, int) or buffering == 0:
+        return open(file, mode, buffering, encoding, errors, newline)
+
+    raw_mode = "".join(c for c in mode if c in "rwxa+")
+    raw = _CountingFileIO(file, raw_mode, record)
+    try:
+        line_buffering = buffering == 1
+        if buffering in (-1, 1):
+            buffering = io.DEFAULT_BUFFER_SIZE
+        if "+" in mode:
+            buffer = io.BufferedRandom(raw, buffering)
+        elif "r" in mode:
+            buffer = io.BufferedReader(raw, buffering)
+        else:
+            buffer = io.BufferedWriter(raw, buffering)
+        if "b" in mode:
+            return buffer
+        text = io.TextIOWrapper(buffer, encoding, errors, newline, line_buffering)
+        text.mode = mode
+        return text
+    except BaseException:
+        raw.close()
+        raise
+
+
+def _read_os_counters():
+    """
+    Return the number of bytes read and written by the current thread and the
+    size of the content of the counters file, or None if not available.
+    """
+    try:
+        with open(_OS_COUNTERS_PATH, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    counters = dict(line.split(b":") for line in content.splitlines())
+    return int(counters[b"rchar"]), int(counters[b"wchar"]), len(content)
+
+
+def _get_allocated_bytes(result):
+    if not isinstance(result, list):
+        return 0
+    nbytes = 0
+    for d in result:
+        data = d.get("data") if isinstance(d, dict) else None
+        # exclude memmaps, views, placeholders and lazy arrays
+        if isinstance(data, np.ndarray) and data.base is None:
+            nbytes += data.nbytes
+    return nbytes
+
+
+def _emit(record):
+    for sink in list(_sinks):
+        sink.append(record)
+    for callback in list(_callbacks):
+        callback(record)
+
+
+def instrumented(function):
+    """
+    Decorator of the ``file_reader`` and ``file_writer`` functions of the
+    plugins producing an :py:class:`IORecord` for each call when the
+    instrumentation is enabled.
+
+    A call made from an instrumented call, for example a reader calling
+    another reader, is accounted in the record of the outer call.
+    """
+    plugin = function.__module__.split(".")[1]
+
+    @functools.wraps(function)
+    def wrapper(filename, *args, **kwargs):
+        if (not _sinks and not _callbacks) or _current_record.get() is not None:
+            return function(filename, *args, **kwargs)
+
+        record = IORecord(plugin, function.__name__, str(filename))
+        token = _current_record.set(record)
+        os_counters = _read_os_counters()
+        start = time.perf_counter()
+        try:
+            result = function(filename, *args, **kwargs)
+            record.allocated_bytes = _get_allocated_bytes(result)
+            return result
+        except BaseException as error:
+            record.error = repr(error)
+            raise
+        finally:
+            record.duration = time.perf_counter() - start
+            if os_counters is not None:
+                rchar, wchar, _ = _read_os_counters()
+                # the first reading of the counters is accounted in `rchar`
+                record.os_bytes_read = rchar - os_counters[0] - os_counters[2]
+                record.os_bytes_written = wchar - os_counters[1]
+            _current_record.reset(token)
+            _emit(record)
+
+    return wrapper
+
+
+@contextmanager
+def phase(name):
+    """
+    Context manager used by the plugins to account the time spent in a
+    phase of an instrumented call, such as ``"header"``, ``"metadata"``,
+    ``"decompression"`` or ``"data"``. The time of a phase used several
+    times is summed. Outside an instrumented call, it does nothing.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase.
+
+    Examples
+    --------
+    >>> from rsciio.utils.instrumentation import phase
+    >>> with phase("header"):
+    ...     header = read_header(f)
+    """
+    record = _current_record.get()
+    if record is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        record.phases[name] = record.phases.get(name, 0.0) + duration
+
+
+@contextmanager
+def instrument():
+    """
+    Context manager enabling the instrumentation and collecting the
+    :py:class:`IORecord` of the calls to the ``file_reader`` and
+    ``file_writer`` functions completed in its scope, in all threads.
+
+    Yields
+    ------
+    list of IORecord
+        The list is filled as the calls complete.
+
+    Examples
+    --------
+    >>> from rsciio.hspy import file_reader
+    >>> from rsciio.utils.instrumentation import instrument
+    >>> with instrument() as records:
+    ...     d = file_reader("file.hspy")
+    >>> records[0].to_dict()
+    {'plugin': 'hspy', 'function': 'file_reader', 'filename': 'file.hspy', ...}
+    """
+    records = []
+    _sinks.append(records)
+    try:
+        yield records
+    finally:
+        _sinks.remove(records)
+
+
+def add_callback(callback):
+    """
+    Enable the instrumentation and register a function called with the
+    :py:class:`IORecord` of each completed call, for example to send the
+    records to a monitoring service. The callback is called in the thread of
+    the call.
+
+    Parameters
+    ----------
+    callback : callable
+        Function taking an :py:class:`IORecord` as argument.
+
+    See Also
+    --------
+    remove_callback
+    """
+    _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    """
+    Unregister a callback registered with :py:func:`add_callback`. The
+    instrumentation is disabled when no callback is registered and no
+    :py:func:`instrument` context is active.
+
+    Parameters
+    ----------
+    callback : callable
+        The function to unregister.
+    """
+    _callbacks.remove(callback)
@@ -24,14 +24,14 @@ import os
 from ast import literal_eval
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
+import functools
 import importlib
 import re
+import threading
+import types
 
 import numpy as np
 from box import Box
-from pint import UnitRegistry
-
-_UREG = UnitRegistry()
 
 
 _logger = logging.getLogger(__name__)
@@ -42,6 +42,116 @@ def dummy_context_manager(*args, **kwargs):
     yield
 
 
+class DeferredObject:
+    """
+    Proxy to an object which is only created when one of its attribute is
+    accessed or when it is called. This is used to defer the import of
+    heavy dependencies, which are only needed for specific code paths, from
+    the import of a plugin to their first use.
+
+    Parameters
+    ----------
+    factory : callable
+        Function without argument returning the object.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._object = None
+        self._lock = threading.Lock()
+
+    def _get_object(self):
+        if self._object is None:
+            # the object is created once, also when it is first used by
+            # several threads at the same time, e.g. by `read_many`
+            with self._lock:
+                if self._object is None:
+                    self._object = self._factory()
+        return self._object
+
+    def __getattr__(self, name):
+        return getattr(self._get_object(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._get_object()(*args, **kwargs)
+
+    def __repr__(self):
+        loaded = "loaded" if self._object is not None else "not loaded"
+        return f"<{self.__class__.__name__} of {self._factory!r} ({loaded})>"
+
+
+def deferred_import(name):
+    """
+    Return a proxy of the module ``name``, which is imported on first
+    attribute access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the module, for example ``"dask.array"``.
+
+    Returns
+    -------
+    DeferredObject
+
+    Examples
+    --------
+    >>> da = deferred_import("dask.array")  # dask is not imported yet
+    >>> data = da.zeros((10, 10))  # dask.array is imported here
+    """
+    return DeferredObject(functools.partial(importlib.import_module, name))
+
+
+def deferred_njit(*args, **kwargs):
+    """
+    Decorator equivalent to :py:func:`numba.njit`, except that numba is
+    imported and the function compiled on the first call of the function.
+    The pure python function is available as the ``py_func`` attribute, as
+    for a numba jitted function.
+
+    The positional and keyword arguments, for example the signatures of the
+    function, are passed to :py:func:`numba.njit`.
+
+    Examples
+    --------
+    >>> @deferred_njit("float64(float64)", cache=True)
+    ... def square(x):
+    ...     return x * x
+    """
+    if args and isinstance(args[0], types.FunctionType):
+        # used as `@deferred_njit` without arguments
+        func, *args = args
+        return deferred_njit(*args, **kwargs)(func)
+
+    def decorator(func):
+        jitted = None
+
+        @functools.wraps(func)
+        def wrapper(*args_, **kwargs_):
+            nonlocal jitted
+            if jitted is None:
+                import numba
+
+                jitted = numba.njit(*args, **kwargs)(func)
+            return jitted(*args_, **kwargs_)
+
+        wrapper.py_func = func
+        return wrapper
+
+    return decorator
+
+
+def _get_unit_registry():
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+# Creating a pint registry is slow (and importing pint is slow too), create
+# it only when units need to be parsed or converted
+_UREG = DeferredObject(_get_unit_registry)
+
+
 # MSXML sanitization ###
 # re pattern with two capturing groups with comma in between;
 # firstgroup looks for numeric value after <tag> (the '>' char) with or
@@ -1,7 +1,8 @@
-from ._api import file_reader, file_writer
+from ._api import file_appender, file_reader, file_writer
 
 
 __all__ = [
+    "file_appender",
     "file_reader",
     "file_writer",
 ]
@@ -17,20 +17,39 @@
 # along with RosettaSciIO. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import logging
+import math
+import time
 from collections.abc import MutableMapping
 
-import dask.array as da
 import numcodecs
+import numpy as np
 import zarr
 
 from rsciio._docstrings import (
+    ACCESS_PATTERN_DOC,
+    CHUNKS_ALIGNED_READ_DOC,
     CHUNKS_DOC,
     FILENAME_DOC,
     LAZY_DOC,
+    LAZY_METADATA_DOC,
+    METADATA_ONLY_DOC,
     RETURNS_DOC,
     SIGNAL_DOC,
+    SLICE_DOC,
+    WRITE_SUMMARY_DOC,
 )
-from rsciio._hierarchical import HierarchicalWriter, HierarchicalReader, version
+from rsciio._hierarchical import (
+    HierarchicalAppender,
+    HierarchicalReader,
+    HierarchicalWriter,
+    get_signal_chunks,
+    require_signal_group,
+    version,
+)
+from rsciio.utils.tools import deferred_import
+
+
+da = deferred_import("dask.array")
 
 
 _logger = logging.getLogger(__name__)
@@ -81,44 +100,154 @@ class ZspyWriter(HierarchicalWriter):
         super().__init__(file, signal, expg, **kwargs)
         self.Dataset = zarr.Array
         self.unicode_kwds = {"dtype": object, "object_codec": numcodecs.JSON()}
-        self.ragged_kwds = {
-            "dtype": object,
-            "object_codec": numcodecs.VLenArray(signal["data"][0].dtype),
-            "exact": True,
-        }
+        if signal["data"].dtype == object:
+            self.ragged_kwds = {
+                "dtype": object,
+                "object_codec": numcodecs.VLenArray(signal["data"][0].dtype),
+                "exact": True,
+            }
 
     @staticmethod
-    def _get_object_dset(group, data, key, chunks, **kwds):
-        """Creates a Zarr Array object for saving ragged data
-
-        Forces the number of chunks span the array if not a dask array as
-        calculating the chunks for a ragged array is not supported. See
-        https://github.com/hyperspy/rosettasciio/issues/168 for more details.
+    def _get_object_dset(group, data, key, chunks, dtype, **kwds):
+        """
+        Creates a Zarr Array object for saving ragged data, ``dtype`` is the
+        dtype of the arrays.
         """
-        if not isinstance(data, da.Array):
-            chunks = data.shape
         these_kwds = kwds.copy()
         these_kwds.update(dict(dtype=object, exact=True, chunks=chunks))
         dset = group.require_dataset(
             key,
             data.shape,
-            object_codec=numcodecs.VLenArray(data.flatten()[0].dtype),
+            object_codec=numcodecs.VLenArray(dtype),
             **these_kwds,
         )
         return dset
 
     @staticmethod
-    def _store_data(data, dset, group, key, chunks):
+    def _write_region(data, dset, region):
+        dset[region] = data
+
+    @staticmethod
+    def _store_data(data, dset, group, key, chunks, extra_stores=()):
         """Write data to zarr format."""
         if isinstance(data, da.Array):
             if data.chunks != dset.chunks:
                 data = data.rechunk(dset.chunks)
+            # the sources of `extra_stores` are computed from the data and
+            # stored with it, see `HierarchicalWriter._write_summary`
+            sources = [source for source, _ in extra_stores]
+            targets = [target for _, target in extra_stores]
             # lock=False is necessary with the distributed scheduler
-            data.store(dset, lock=False)
+            da.store([data] + sources, [dset] + targets, lock=False)
         else:
             dset[:] = data
 
 
+# Throughput of the storage, in bytes per second, used to weigh the size of
+# the compressed data against the compression time when selecting the
+# compressor with `compressor="auto"`
+_STORAGE_THROUGHPUT = 2e8
+# Size of the blocks of data sampled to select the compressor
+_COMPRESSOR_SAMPLE_SIZE = 2**20
+
+
+def _get_default_compressor():
+    return numcodecs.Blosc(cname="zstd", clevel=1, shuffle=numcodecs.Blosc.SHUFFLE)
+
+
+def _get_compressor_candidates():
+    """The compressors compared by `compressor="auto"`, the default first."""
+    Blosc = numcodecs.Blosc
+    return [
+        _get_default_compressor(),
+        Blosc(cname="zstd", clevel=5, shuffle=Blosc.SHUFFLE),
+        Blosc(cname="zstd", clevel=1, shuffle=Blosc.BITSHUFFLE),
+        Blosc(cname="lz4", clevel=5, shuffle=Blosc.BITSHUFFLE),
+    ]
+
+
+def _sample_blocks(data, signal_axes, n_samples):
+    """
+    Return ``n_samples`` blocks of the data evenly spaced in the array, each
+    containing whole signals if possible.
+
+    For dask arrays, whole existing blocks are sampled and computed together,
+    so that the chunks they depend on are computed only once.
+    """
+    if isinstance(data, da.Array):
+        n_blocks = data.numblocks
+        indices = np.linspace(0, math.prod(n_blocks) - 1, n_samples, dtype=int)
+        blocks = da.compute(
+            *[data.blocks[np.unravel_index(i, n_blocks)] for i in np.unique(indices)]
+        )
+        # keep only the leading signals of large blocks
+        samples = []
+        for block in blocks:
+            size = get_signal_chunks(
+                block.shape, block.dtype, signal_axes, _COMPRESSOR_SAMPLE_SIZE
+            )
+            region = tuple(slice(0, s) for s in size)
+            samples.append(np.ascontiguousarray(block[region]))
+        return samples
+
+    blocks = get_signal_chunks(
+        data.shape, data.dtype, signal_axes, _COMPRESSOR_SAMPLE_SIZE
+    )
+    n_blocks = [math.ceil(s / b) for s, b in zip(data.shape, blocks)]
+    indices = np.linspace(0, math.prod(n_blocks) - 1, n_samples, dtype=int)
+    samples = []
+    for index in np.unique(indices):
+        location = np.unravel_index(index, n_blocks)
+        region = tuple(slice(i * b, (i + 1) * b) for i, b in zip(location, blocks))
+        samples.append(np.ascontiguousarray(data[region]))
+    return samples
+
+
+def _select_compressor(data, signal_axes, n_samples=4):
+    """
+    Select the compressor of the candidates minimising the time to compress
+    and write a few blocks sampled from the data.
+    """
+    candidates = _get_compressor_candidates()
+    if data.dtype.kind not in "biuf" or data.size == 0:
+        return candidates[0]
+    samples = _sample_blocks(data, signal_axes, n_samples)
+
+    def get_cost(compressor):
+        start = time.perf_counter()
+        size = sum(len(compressor.encode(sample)) for sample in samples)
+        return time.perf_counter() - start + size / _STORAGE_THROUGHPUT
+
+    compressor = min(candidates, key=get_cost)
+    _logger.info(f"Compressor selected: {compressor}")
+    return compressor
+
+
+def _consolidate_metadata(store):
+    n5_stores = tuple(
+        getattr(zarr, name) for name in ("N5Store", "N5FSStore") if hasattr(zarr, name)
+    )
+    if not isinstance(store, n5_stores):
+        # Store the metadata of all groups and arrays in a single key, which
+        # is read at once when opening the file, see `file_reader`.
+        # N5 stores have their own metadata layout, which isn't supported.
+        zarr.consolidate_metadata(store)
+
+
+def _update_consolidated_metadata(store, keys, metadata_key=".zmetadata"):
+    """
+    Replace the given metadata keys in the consolidated metadata, without
+    reading the metadata of all the other groups and arrays.
+    """
+    if metadata_key not in store:
+        # N5 stores, see `_consolidate_metadata`
+        return
+    consolidated = zarr.util.json_loads(store[metadata_key])
+    for key in keys:
+        consolidated["metadata"][key] = zarr.util.json_loads(store[key])
+    store[metadata_key] = zarr.util.json_dumps(consolidated)
+
+
 def file_writer(
     filename,
     signal,
@@ -126,6 +255,8 @@ def file_writer(
     compressor=None,
     close_file=True,
     write_dataset=True,
+    access_pattern=None,
+    write_summary=False,
     **kwds,
 ):
     """
@@ -136,10 +267,16 @@ def file_writer(
     %s
     %s
     %s
-    compressor : numcodecs.abc.Codec or None, default=None
+    %s
+    compressor : numcodecs.abc.Codec, None or 'auto', default=None
         A compressor can be passed to the save function to compress the data
         efficiently, see `Numcodecs codec <https://numcodecs.readthedocs.io/en/stable>`_.
-        If None, use a Blosc compressor.
+        If None, use a Blosc compressor. If ``'auto'``, a few Blosc compressors
+        with different algorithms, levels and shuffle filters are compared on
+        blocks sampled from the data and the one minimising the compression
+        time and the time to write the compressed data at 200 MB/s is used.
+        Its configuration is stored in the ``'auto_compressor'`` attribute of
+        the group of the signal.
     close_file : bool, default=True
         Close the file after writing. Only relevant for some zarr storages
         (:py:class:`zarr.storage.ZipStore`, :py:class:`zarr.storage.DBMStore`)
@@ -149,7 +286,11 @@ def file_writer(
     write_dataset : bool, default=True
         If ``False``, doesn't write the dataset when writing the file. This can
         be useful to overwrite signal attributes only (for example ``axes_manager``)
-        without having to write the whole dataset, which can take time.
+        without having to write the whole dataset, which can take time. The
+        axes, metadata, original metadata, learning results and attributes of
+        the signal are replaced and the shape of the data must be the same as
+        in the file.
+    %s
     **kwds
         The keyword arguments are passed to the
         :py:meth:`zarr.hierarchy.Group.require_dataset` function.
@@ -160,12 +301,20 @@ def file_writer(
     >>> compressor = Blosc(cname='zstd', clevel=1, shuffle=Blosc.SHUFFLE) # Used by default
     >>> file_writer('test.zspy', s, compressor = compressor) # will save with Blosc compression
     """
-    if compressor is None:
-        compressor = numcodecs.Blosc(
-            cname="zstd", clevel=1, shuffle=numcodecs.Blosc.SHUFFLE
-        )
     if not isinstance(write_dataset, bool):
         raise ValueError("`write_dataset` argument must a boolean.")
+    auto_compressor = isinstance(compressor, str) and compressor == "auto"
+    if auto_compressor and not write_dataset:
+        # the dataset isn't written, there is nothing to select the compressor for
+        auto_compressor = False
+        compressor = None
+    if compressor is None:
+        compressor = _get_default_compressor()
+    elif auto_compressor:
+        signal_axes = [
+            i for i, axis in enumerate(signal["axes"]) if not axis["navigate"]
+        ]
+        compressor = _select_compressor(signal["data"], signal_axes)
 
     if isinstance(filename, MutableMapping):
         store = filename
@@ -179,15 +328,7 @@ def file_writer(
     _logger.debug(f"Zarr store: {store}")
 
     f = zarr.open_group(store=store, mode=mode)
-    f.attrs["file_format"] = "ZSpy"
-    f.attrs["file_format_version"] = version
-    exps = f.require_group("Experiments")
-    title = signal["metadata"]["General"]["title"]
-    group_name = title if title else "__unnamed__"
-    # / is a invalid character, see https://github.com/hyperspy/hyperspy/issues/942
-    if "/" in group_name:
-        group_name = group_name.replace("/", "-")
-    expg = exps.require_group(group_name)
+    expg = require_signal_group(f, signal, "ZSpy")
 
     writer = ZspyWriter(
         f,
@@ -196,9 +337,14 @@ def file_writer(
         chunks=chunks,
         compressor=compressor,
         write_dataset=write_dataset,
+        access_pattern=access_pattern,
+        write_summary=write_summary,
         **kwds,
     )
     writer.write()
+    if auto_compressor:
+        expg.attrs["auto_compressor"] = compressor.get_config()
+    _consolidate_metadata(store)
 
     if isinstance(store, (zarr.ZipStore, zarr.DBMStore, zarr.LMDBStore)):
         if close_file:
@@ -211,10 +357,146 @@ file_writer.__doc__ %= (
     FILENAME_DOC.replace("read", "write to"),
     SIGNAL_DOC,
     CHUNKS_DOC,
+    ACCESS_PATTERN_DOC,
+    WRITE_SUMMARY_DOC,
 )
 
 
-def file_reader(filename, lazy=False, **kwds):
+class ZspyAppender(HierarchicalAppender):
+    """
+    Write a signal incrementally to a ``.zspy`` file, see
+    :py:func:`~.zspy.file_appender`.
+    """
+
+    writer_class = ZspyWriter
+
+    def __init__(self, *args, **kwds):
+        # the metadata keys changed by `append`, the others are consolidated
+        # once when the file is created
+        self._appended_keys = None
+        super().__init__(*args, **kwds)
+
+    def flush(self):
+        # the consolidated metadata contains the shape of the data
+        if self._appended_keys is None:
+            _consolidate_metadata(self.file.store)
+            self._appended_keys = [
+                f"{self.dataset.path}/.zarray",
+                f"{self.group['axis-0'].path}/.zattrs",
+            ]
+        else:
+            _update_consolidated_metadata(self.file.store, self._appended_keys)
+        if isinstance(self.file.store, (zarr.ZipStore, zarr.DBMStore, zarr.LMDBStore)):
+            self.file.store.flush()
+
+    def close(self):
+        if isinstance(self.file.store, (zarr.ZipStore, zarr.DBMStore, zarr.LMDBStore)):
+            self.file.store.close()
+
+
+def file_appender(filename, signal, chunks=None, compressor=None, **kwds):
+    """
+    Create a ``.zspy`` file to write a signal incrementally, by appending data
+    along its first axis, for example during a live acquisition. The size of
+    the axis and the consolidated metadata are updated after each append, so
+    that the file can be read with :py:func:`~.zspy.file_reader` at any time.
+
+    Parameters
+    ----------
+    %s
+    signal : dict
+        Dictionary containing the signal object, as for
+        :py:func:`~.zspy.file_writer`. The first axis must be a uniform
+        navigation axis, its size is the length of the initial data,
+        which can be zero.
+    chunks : tuple of int or None, default=None
+        Define the chunking used for saving the dataset. If ``None``,
+        calculates chunks for the signal assuming that the data is
+        long along the first axis.
+    compressor : numcodecs.abc.Codec or None, default=None
+        A compressor can be passed to the save function to compress the data
+        efficiently, see `Numcodecs codec <https://numcodecs.readthedocs.io/en/stable>`_.
+        If None, use a Blosc compressor.
+    **kwds
+        The keyword arguments are passed to the
+        :py:meth:`zarr.hierarchy.Group.require_dataset` function.
+
+    Returns
+    -------
+    ZspyAppender
+        Object with an ``append`` method to append data to the signal, and a
+        ``close`` method to close the file. It can also be used as context
+        manager.
+
+    Examples
+    --------
+    >>> from rsciio.zspy import file_appender
+    >>> with file_appender("live.zspy", signal) as appender:
+    ...     for frame in acquisition:
+    ...         appender.append(frame[np.newaxis])
+    """
+    if compressor is None:
+        compressor = _get_default_compressor()
+    if isinstance(filename, MutableMapping):
+        store = filename
+    else:
+        store = zarr.storage.NestedDirectoryStore(filename)
+
+    f = zarr.open_group(store=store, mode="w")
+    expg = require_signal_group(f, signal, "ZSpy")
+    return ZspyAppender(f, expg, signal, chunks=chunks, compressor=compressor, **kwds)
+
+
+file_appender.__doc__ %= (FILENAME_DOC.replace("read", "write to"),)
+
+
+class _ConsolidatedMetadataStore(zarr.storage.ConsolidatedMetadataStore):
+    """
+    Consolidated metadata store listing the children of a group from an index
+    instead of scanning the keys of all the nodes of the file at each call.
+    """
+
+    def __init__(self, store, metadata_key=".zmetadata"):
+        super().__init__(store, metadata_key=metadata_key)
+        self._children = {}
+        for key in self.meta_store:
+            parts = key.split("/")
+            for i in range(len(parts)):
+                self._children.setdefault("/".join(parts[:i]), set()).add(parts[i])
+
+    def listdir(self, path=""):
+        return sorted(self._children.get((path or "").strip("/"), ()))
+
+
+def _open_group(filename, mode, **kwds):
+    """
+    Open the root group of a zspy file, using the consolidated metadata
+    when the file is opened in read only mode and has been saved with it.
+    """
+    if mode == "r":
+        store = zarr.storage.normalize_store_arg(filename, mode=mode)
+        try:
+            # the metadata of all groups and arrays is read at once instead
+            # of reading a ".zattrs" and ".zarray" file per node
+            meta_store = _ConsolidatedMetadataStore(store)
+        except KeyError:
+            # saved without consolidated metadata (rosettasciio < 0.2)
+            _logger.debug("No consolidated metadata found.")
+        else:
+            return zarr.open(meta_store, mode=mode, chunk_store=store, **kwds)
+    return zarr.open(filename, mode=mode, **kwds)
+
+
+def file_reader(
+    filename,
+    lazy=False,
+    metadata_only=False,
+    lazy_metadata=False,
+    navigation_slice=None,
+    signal_slice=None,
+    chunks=None,
+    **kwds,
+):
     """
     Read data from zspy files saved with the HyperSpy zarr format
     specification.
@@ -223,14 +505,20 @@ def file_reader(filename, lazy=False, **kwds):
     ----------
     %s
     %s
+    %s
+    %s
+    %s
+    %s
     **kwds : dict, optional
         Pass keyword arguments to the :py:func:`zarr.convenience.open` function.
 
     %s
     """
+    if lazy_metadata and not lazy:
+        raise ValueError("Reading the metadata lazily requires `lazy=True`.")
     mode = kwds.pop("mode", "r")
     try:
-        f = zarr.open(filename, mode=mode, **kwds)
+        f = _open_group(filename, mode, **kwds)
     except Exception:
         _logger.error(
             "The file can't be read. It may be possible that the zspy file is "
@@ -241,7 +529,22 @@ def file_reader(filename, lazy=False, **kwds):
 
     reader = ZspyReader(f)
 
-    return reader.read(lazy=lazy)
+    return reader.read(
+        lazy=lazy,
+        metadata_only=metadata_only,
+        lazy_metadata=lazy_metadata,
+        navigation_slice=navigation_slice,
+        signal_slice=signal_slice,
+        chunks=chunks,
+    )
 
 
-file_reader.__doc__ %= (FILENAME_DOC, LAZY_DOC, RETURNS_DOC)
+file_reader.__doc__ %= (
+    FILENAME_DOC,
+    LAZY_DOC,
+    METADATA_ONLY_DOC,
+    LAZY_METADATA_DOC,
+    SLICE_DOC,
+    CHUNKS_ALIGNED_READ_DOC,
+    RETURNS_DOC,
+)